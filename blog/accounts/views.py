@@ -13,6 +13,7 @@ from .forms import (
 from .models import CustomUser
 from django.views.generic import DetailView
 from blog_page.models import Post, Bookmark
+from blog_page.pagination import KeysetPaginator
 
 
 class RegisterView(CreateView):
@@ -135,12 +136,21 @@ class ProfileView(LoginRequiredMixin, DetailView):
             dict: 확장된 컨텍스트 데이터
         """
         context = super().get_context_data(**kwargs)
-        context["user_posts"] = Post.objects.filter(author=self.request.user).order_by(
-            "-created_at"
-        )
-        context["bookmarked_posts"] = Post.objects.filter(
-            bookmark__user=self.request.user
-        ).order_by("-bookmark__created_at")
+        posts_page = KeysetPaginator(
+            Post.objects.filter(author=self.request.user).for_listing(),
+            ("-created_at", "-pk"),
+        ).get_page(self.request.GET.get("posts_cursor"))
+        # 북마크한 순서로 정렬하기 위해 Bookmark 를 기준으로 페이지를 나눕니다.
+        bookmarks_page = KeysetPaginator(
+            Bookmark.objects.filter(user=self.request.user).select_related(
+                "post__author"
+            ),
+            ("-created_at", "-pk"),
+        ).get_page(self.request.GET.get("bookmarks_cursor"))
+        context["user_posts"] = posts_page
+        context["posts_page"] = posts_page
+        context["bookmarked_posts"] = [bookmark.post for bookmark in bookmarks_page]
+        context["bookmarks_page"] = bookmarks_page
         return context
 
 
@@ -0,0 +1,349 @@
+import gzip
+import mimetypes
+import os
+import re
+from fnmatch import fnmatch
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import (
+    ManifestStaticFilesStorage,
+    staticfiles_storage,
+)
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.http import FileResponse, Http404
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from .media import IMMUTABLE_MAX_AGE, MUTABLE_MAX_AGE
+
+try:
+    import brotli
+except ImportError:  # brotli 가 없으면 gzip 만 만듭니다.
+    brotli = None
+
+# 미리 압축해 둘 형식 (이미지/글꼴 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".map", ".json", ".svg", ".txt", ".xml"}
+# 이보다 작은 파일은 압축해도 이득이 없어 원본만 둡니다.
+MIN_COMPRESS_SIZE = 256
+# 미리 압축한 파일의 (Content-Encoding, 확장자). 앞에 있을수록 우선합니다.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _minify_css(text):
+    """
+    CSS 에서 주석과 불필요한 공백을 지웁니다. 문자열 안은 그대로 둡니다.
+
+    선택자의 후손 결합자(a :hover)와 calc() 의 연산자 공백은 의미가 있으므로
+    { } ; , 옆의 공백만 지우고 나머지는 한 칸으로 줄입니다.
+    """
+    strings = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+    text = re.sub(
+        rf"({strings})|/\*(?!!).*?\*/",
+        lambda match: match.group(1) or " ",
+        text,
+        flags=re.S,
+    )
+
+    def whitespace(match):
+        if match.group(1):
+            return match.group(1)
+        before = match.string[match.start() - 1 : match.start()]
+        after = match.string[match.end() : match.end() + 1]
+        return "" if not before or not after or {before, after} & set("{};,") else " "
+
+    text = re.sub(rf"({strings})|\s+", whitespace, text)
+    return re.sub(rf"({strings})|;}}", lambda match: match.group(1) or "}", text)
+
+
+# 다음에 오는 / 가 나눗셈이 아니라 정규식의 시작인 글자와 키워드
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+}  # fmt: skip
+# 옆에 있으면 공백을 지워도 되는 글자
+_JS_PUNCTUATION = set("{}()[];,:=<>?!&|*%^~")
+_JS_WORD = re.compile(r"[\w$]+")
+
+
+def _js_string_end(text, start):
+    """start 의 따옴표로 시작하는 문자열(템플릿 리터럴 포함)이 끝나는 위치를 반환합니다."""
+    quote = text[start]
+    index = start + 1
+    while index < len(text):
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == quote:
+            return index + 1
+        if quote == "`" and text.startswith("${", index):
+            index = _js_expression_end(text, index + 2)
+            continue
+        if quote != "`" and char == "\n":
+            return index
+        index += 1
+    return len(text)
+
+
+def _js_expression_end(text, start):
+    """템플릿 리터럴의 ${ 다음 위치에서 짝이 맞는 } 다음 위치를 반환합니다."""
+    depth = 1
+    index = start
+    while index < len(text):
+        char = text[index]
+        if char in "'\"`":
+            index = _js_string_end(text, index)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return len(text)
+
+
+def _js_regex_end(text, start):
+    """start 의 / 로 시작하는 정규식 리터럴(플래그 포함)이 끝나는 위치를 반환합니다."""
+    index = start + 1
+    in_class = False
+    while index < len(text) and text[index] != "\n":
+        char = text[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            index += 1
+            break
+        index += 1
+    while index < len(text) and (text[index].isalnum() or text[index] == "_"):
+        index += 1
+    return index
+
+
+def _minify_js(text):
+    """
+    JavaScript 에서 주석과 들여쓰기, 불필요한 공백을 지웁니다.
+
+    문자열, 템플릿 리터럴, 정규식은 그대로 두고, 자동 세미콜론 삽입(ASI)이
+    바뀌지 않도록 줄바꿈은 {;,( 뒤와 })] 앞에서만 지웁니다. 이름을 줄이는 등의
+    변환은 하지 않습니다.
+    """
+    output = []
+    last = ""  # 마지막으로 출력한 토큰
+    space = newline = False
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char.isspace():
+            newline = newline or char in "\n\r\u2028\u2029"
+            space = True
+            index += 1
+            continue
+        if text.startswith("//", index):
+            end = text.find("\n", index)
+            index = len(text) if end == -1 else end
+            continue
+        if text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            end = len(text) if end == -1 else end + 2
+            newline = newline or "\n" in text[index:end]
+            space = True
+            index = end
+            continue
+
+        if char in "'\"`":
+            end = _js_string_end(text, index)
+        elif char == "/" and (
+            not last or last[-1] in _JS_REGEX_AFTER or last in _JS_REGEX_KEYWORDS
+        ):
+            end = _js_regex_end(text, index)
+        else:
+            word = _JS_WORD.match(text, index)
+            end = word.end() if word else index + 1
+        token = text[index:end]
+
+        if output and space:
+            before, after = last[-1], token[0]
+            if newline and before not in "{;,(" and after not in "})]":
+                output.append("\n")
+            elif before not in _JS_PUNCTUATION and after not in _JS_PUNCTUATION:
+                output.append(" ")
+        output.append(token)
+        last = token
+        space = newline = False
+        index = end
+    return "".join(output) + "\n"
+
+
+MINIFIERS = {".css": _minify_css, ".js": _minify_js}
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    collectstatic 결과를 배포용으로 만드는 정적 파일 저장소입니다.
+
+    - STATIC_MINIFY_PATTERNS 에 맞는 CSS/JS 를 압축(minify)한 뒤
+    - 내용 해시를 이름에 넣은 사본과 매니페스트(staticfiles.json)를 만들고
+    - 해시 이름 파일마다 gzip(.gz)과 brotli(.br) 압축본을 미리 만들어 둡니다.
+
+    {% static %} 은 매니페스트의 해시 이름을 가리키므로 serve_static 이
+    오래 캐시(immutable)해도 파일이 바뀌면 새 URL 로 받게 됩니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._immutable_names = None
+
+    @property
+    def immutable_names(self):
+        """매니페스트의 해시 이름 집합. 요청마다 매니페스트를 훑지 않도록 한 번만 만듭니다."""
+        if self._immutable_names is None:
+            self._immutable_names = frozenset(self.hashed_files.values())
+        return self._immutable_names
+
+    def post_process(self, paths, dry_run=False, **options):
+        """
+        해시 이름을 만들기 전에 CSS/JS 를 압축하고, 만든 뒤에 미리 압축한 파일을 씁니다.
+
+        Args:
+            paths (dict): {STATIC_ROOT 기준 경로: (원본 저장소, 원본 경로)}
+            dry_run (bool): True 면 아무 파일도 쓰지 않습니다.
+
+        Yields:
+            tuple: (원래 이름, 해시 이름, 처리 여부) — ManifestStaticFilesStorage 와 같음
+        """
+        if not dry_run:
+            paths = dict(paths)
+            for name in paths:
+                if self._minify(name):
+                    # 해시와 url() 치환이 압축된 사본을 기준으로 하도록 원본 대신 씁니다.
+                    paths[name] = (self, name)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        self._immutable_names = None
+        if not dry_run:
+            for name in set(self.hashed_files.values()):
+                self._compress(name)
+
+    def _minify(self, name):
+        """STATIC_MINIFY_PATTERNS 에 맞는 파일을 압축해 덮어씁니다. 압축했으면 True"""
+        minify = MINIFIERS.get(os.path.splitext(name)[1])
+        patterns = getattr(settings, "STATIC_MINIFY_PATTERNS", [])
+        if minify is None or not any(fnmatch(name, pattern) for pattern in patterns):
+            return False
+        with self.open(name) as file:
+            text = file.read().decode("utf-8")
+        self._replace(name, minify(text).encode("utf-8"))
+        return True
+
+    def _compress(self, name):
+        """파일의 gzip/brotli 압축본을 만듭니다. 원본보다 작을 때만 남깁니다."""
+        if os.path.splitext(name)[1] not in COMPRESSIBLE_EXTENSIONS:
+            return
+        with self.open(name) as file:
+            content = file.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return
+        variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(content, quality=11)
+        for suffix, compressed in variants.items():
+            if len(compressed) < len(content):
+                self._replace(name + suffix, compressed)
+
+    def _replace(self, name, content):
+        """이미 있는 파일을 content 로 바꿉니다. (save 는 이름을 바꿔 따로 저장합니다)"""
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(content))
+
+
+def _accepted_encodings(request):
+    """Accept-Encoding 에서 q=0 이 아닌 인코딩 이름 집합을 반환합니다."""
+    accepted = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+@require_safe
+def serve_static(request, path):
+    """
+    STATIC_URL 아래의 collectstatic 결과 파일을 응답하는 뷰입니다.
+
+    - Accept-Encoding 에 맞는 미리 압축한 파일(.br, .gz)이 있으면 그 파일을 보냅니다.
+    - 매니페스트의 해시 이름 파일은 1년 동안 재검증 없이(immutable) 캐시합니다.
+    - ETag/Last-Modified 로 조건부 요청에 304 를 돌려줍니다.
+
+    Args:
+        request (HttpRequest): 요청 객체
+        path (str): STATIC_ROOT 기준 파일 경로
+
+    Returns:
+        HttpResponse: 파일 응답 또는 304 응답
+
+    Raises:
+        Http404: 파일이 없거나 잘못된 경로인 경우
+    """
+    if any(part.startswith(".") for part in path.split("/")):
+        raise Http404("파일을 찾을 수 없습니다.")
+    try:
+        file_path = staticfiles_storage.path(path)
+    except SuspiciousFileOperation:
+        raise Http404("파일을 찾을 수 없습니다.")
+    if not os.path.isfile(file_path):
+        raise Http404("파일을 찾을 수 없습니다.")
+
+    content_type, encoding = mimetypes.guess_type(path)
+    if encoding or not content_type:
+        content_type = "application/octet-stream"
+    accepted = _accepted_encodings(request)
+    encoding = None
+    for coding, suffix in ENCODINGS:
+        if coding in accepted and os.path.isfile(file_path + suffix):
+            encoding, file_path = coding, file_path + suffix
+            break
+
+    stat = os.stat(file_path)
+    tag = f"{int(stat.st_mtime):x}-{stat.st_size:x}"
+    etag = f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+    last_modified = int(stat.st_mtime)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = FileResponse(
+            open(file_path, "rb"),
+            content_type=content_type,
+            filename=os.path.basename(path),
+        )
+        if encoding:
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if path in getattr(staticfiles_storage, "immutable_names", ()):
+        patch_cache_control(
+            response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True
+        )
+    else:
+        patch_cache_control(response, public=True, max_age=MUTABLE_MAX_AGE)
+    return response
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+_executor = None
+
+
+def _get_executor():
+    """백그라운드 작업자 스레드 풀을 반환합니다. (설정이 0이면 None)"""
+    global _executor
+    workers = getattr(settings, "BACKGROUND_WORKERS", 2)
+    if not workers:
+        return None
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blog")
+    return _executor
+
+
+def _run_in_worker(func, *args):
+    """작업자 스레드에서 func 를 실행하고 DB 연결을 정리합니다."""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        connection.close()
+
+
+def run_in_background(func, *args):
+    """
+    func(*args) 를 요청 경로 밖(작업자 스레드 풀)에서 실행하도록 예약합니다.
+
+    BACKGROUND_WORKERS 가 0이면 바로 실행합니다. (테스트, 관리 명령 등)
+
+    Args:
+        func (callable): 실행할 함수
+        *args: func 에 넘길 인자
+
+    Returns:
+        Future or object: 작업 Future, 또는 동기 실행 시 func 의 반환값
+    """
+    executor = _get_executor()
+    if executor is None:
+        return func(*args)
+    return executor.submit(_run_in_worker, func, *args)
@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Concat
+
+from .models import Comment
+from .pagination import KeysetPaginator
+
+# 경로는 숫자와 구분자로만 이루어지므로, 하위 댓글의 경로는 모두
+# "부모 경로/" 이상이고 "부모 경로" + (구분자 다음 글자) 미만입니다.
+_DESCENDANT_UPPER = chr(ord(Comment.PATH_SEPARATOR) + 1)
+
+
+def _page_size():
+    """상세 페이지와 댓글 API 에서 한 번에 보여주는 최상위 댓글(답글) 수를 반환합니다."""
+    return getattr(settings, "COMMENT_PAGE_SIZE", 20)
+
+
+def with_reply_count(queryset):
+    """
+    댓글마다 모든 하위 댓글 수를 reply_count 로 붙입니다.
+
+    하위 댓글을 경로 범위로 세므로 (post, path) 색인 범위 조회 한 번이면 됩니다.
+
+    Args:
+        queryset (QuerySet): 댓글 쿼리셋
+
+    Returns:
+        QuerySet: reply_count 가 붙은 쿼리셋
+    """
+    descendants = (
+        Comment.objects.filter(
+            post_id=OuterRef("post_id"),
+            path__gt=Concat(OuterRef("path"), Value(Comment.PATH_SEPARATOR)),
+            path__lt=Concat(OuterRef("path"), Value(_DESCENDANT_UPPER)),
+        )
+        .order_by()
+        .values("post_id")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return queryset.annotate(
+        reply_count=Coalesce(Subquery(descendants, output_field=IntegerField()), 0)
+    )
+
+
+def top_level_page(post_id, cursor=None):
+    """
+    게시물의 최상위 댓글을 작성 순으로 한 페이지 가져옵니다. 답글은 수만 붙입니다.
+
+    Args:
+        post_id (int): 게시물의 기본 키
+        cursor (str, optional): 이전 페이지의 next_cursor (없으면 첫 페이지)
+
+    Returns:
+        KeysetPage: 최상위 댓글 페이지 (잘못된 커서면 첫 페이지)
+    """
+    comments = with_reply_count(
+        Comment.objects.filter(post_id=post_id, parent=None).select_related("author")
+    )
+    # 최상위 댓글의 경로는 자신의 ID 이므로 경로 순서가 곧 작성 순서입니다.
+    paginator = KeysetPaginator(comments, ordering=("path",), per_page=_page_size())
+    return paginator.get_page(cursor)
+
+
+def reply_page(comment, cursor=None):
+    """
+    댓글의 하위 댓글(답글 트리)을 경로 순으로 한 페이지 가져옵니다.
+
+    경로 순서는 트리를 깊이 우선으로 펼친 순서이므로 페이지가 답글 트리 중간에서
+    나뉘어도 다음 페이지의 답글은 모두 앞 페이지까지 나온 댓글의 하위 댓글입니다.
+
+    Args:
+        comment (Comment): 답글을 불러올 댓글
+        cursor (str, optional): 이전 페이지의 next_cursor (없으면 첫 페이지)
+
+    Returns:
+        KeysetPage: 답글 페이지 (잘못된 커서면 첫 페이지)
+    """
+    replies = comment.get_descendants().select_related("author")
+    paginator = KeysetPaginator(replies, ordering=("path",), per_page=_page_size())
+    return paginator.get_page(cursor)
+
+
+def build_comment_tree(comments):
+    """
+    댓글 트리를 구성합니다.
+    경로(path) 순으로 정렬된 댓글은 항상 부모가 자식보다 먼저 나오므로
+    한 번의 순회(O(n))로 트리를 만들 수 있습니다.
+
+    Args:
+        comments (iterable): 경로 순으로 정렬된 댓글 (게시물 전체나 한 댓글의 하위 댓글)
+
+    Returns:
+        list: {"comment", "replies"} 노드 목록. 부모가 목록에 없는 댓글이 뿌리가 됩니다.
+    """
+    comment_tree = []
+    nodes = {}
+    for comment in comments:
+        node = {"comment": comment, "replies": []}
+        nodes[comment.pk] = node
+        parent = nodes.get(comment.parent_id)
+        if parent is not None:
+            parent["replies"].append(node)
+        else:
+            comment_tree.append(node)
+    return comment_tree
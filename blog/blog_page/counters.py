@@ -0,0 +1,250 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+from .background import run_in_background
+from .models import Post, PostViewBuffer
+from .trending import event_weight, score_update
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    게시물 조회수를 모아 두었다가 한 번에 DB에 반영하는 쓰기 지연(write-behind) 버퍼입니다.
+
+    조회가 일어날 때마다 Post 행을 UPDATE 하는 대신 프로세스 메모리의 카운터만 늘리고,
+    누적 조회수가 임계값을 넘거나 일정 시간이 지나면 두 단계로 반영합니다.
+
+    1. stage(): 메모리의 조회수를 모든 프로세스가 함께 쓰는 PostViewBuffer 테이블에 더합니다.
+    2. flush(): 테이블의 조회수를 F() 표현식을 이용한 일괄 UPDATE 로 ``Post.views_count``
+       에 더하고 행을 지웁니다.
+
+    캐시를 쓰지 않으므로 캐시가 가득 차 항목이 밀려나도 조회수가 사라지지 않고,
+    ``flush_view_counts`` 관리 명령은 다른 프로세스가 모은 조회수도 반영합니다.
+    조용한 게시물의 조회수도 주기 타이머와 프로세스 종료 시 stage() 로 테이블에 옮겨집니다.
+    조회 요청이 반영을 기다리지 않도록 자동 반영은 백그라운드 작업자(background.py)가 합니다.
+
+    threshold, interval, timer 를 지정하지 않으면 쓸 때마다 설정
+    (VIEW_COUNT_FLUSH_THRESHOLD, VIEW_COUNT_FLUSH_INTERVAL, VIEW_COUNT_FLUSH_TIMER)을 읽습니다.
+
+    Args:
+        threshold (int, optional): 자동 반영을 일으키는 누적 조회수
+        interval (float, optional): 자동 반영 주기(초)
+        timer (bool, optional): 조회가 없어도 interval 마다 반영하는 타이머 스레드 사용 여부
+    """
+
+    def __init__(self, threshold=None, interval=None, timer=None):
+        self._threshold = threshold
+        self._interval = interval
+        self._timer = timer
+        self._lock = threading.Lock()
+        # DB 반영은 프로세스 안에서 한 스레드씩 합니다.
+        self._flush_lock = threading.Lock()
+        self._counts = Counter()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._started = False
+
+    @property
+    def threshold(self):
+        """자동 반영을 일으키는 누적 조회수"""
+        return self._threshold or getattr(settings, "VIEW_COUNT_FLUSH_THRESHOLD", 100)
+
+    @property
+    def interval(self):
+        """자동 반영 주기(초)"""
+        return self._interval or getattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 30)
+
+    @property
+    def timer(self):
+        """조회가 없어도 interval 마다 반영하는 타이머 스레드 사용 여부"""
+        if self._timer is None:
+            return getattr(settings, "VIEW_COUNT_FLUSH_TIMER", True)
+        return self._timer
+
+    def _start(self):
+        """처음 조회가 들어왔을 때 종료 시 stage() 와 주기 타이머를 등록합니다."""
+        self._started = True
+        atexit.register(self._stage_at_exit)
+        if self.timer:
+            thread = threading.Thread(
+                target=self._run_timer, name="view-count-flush", daemon=True
+            )
+            thread.start()
+
+    def _run_timer(self):
+        """interval 마다 조회가 있었던 경우에만 flush() 합니다."""
+        while True:
+            time.sleep(self.interval)
+            if not self._pending:
+                continue
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("조회수 반영 중 오류가 발생했습니다.")
+            finally:
+                connection.close()
+
+    def _stage_at_exit(self):
+        """프로세스가 끝날 때 메모리에 남은 조회수를 테이블로 옮깁니다."""
+        try:
+            with self._flush_lock:
+                self.stage()
+        except Exception:
+            logger.exception("종료 중 조회수를 저장하지 못했습니다.")
+
+    def incr(self, post_id):
+        """
+        게시물 조회수를 1 증가시킵니다. 반영할 때가 아니면 DB 에 접근하지 않습니다.
+
+        Args:
+            post_id (int): 게시물의 기본 키
+
+        Returns:
+            int: 이 프로세스에서 아직 DB에 옮기지 않은 이 게시물의 조회수
+        """
+        with self._lock:
+            if not self._started:
+                self._start()
+            self._counts[post_id] += 1
+            pending = self._counts[post_id]
+            self._pending += 1
+            due = (
+                self._pending >= self.threshold
+                or time.monotonic() - self._last_flush >= self.interval
+            )
+        # 다른 스레드가 반영 중이면 이번 조회수는 그 반영이나 다음 반영에 실립니다.
+        # 잡은 _flush_lock 은 백그라운드 반영이 끝날 때 풉니다.
+        if due and self._flush_lock.acquire(blocking=False):
+            try:
+                run_in_background(self._flush_in_background)
+            except Exception:
+                self._flush_lock.release()
+                raise
+        return pending
+
+    def _flush_in_background(self):
+        """incr() 가 잡아 둔 _flush_lock 을 가진 채로 반영하고 끝나면 풉니다."""
+        try:
+            self._flush()
+        except Exception:
+            logger.exception("조회수 반영 중 오류가 발생했습니다.")
+        finally:
+            self._flush_lock.release()
+
+    def pending(self, post_id):
+        """
+        아직 Post.views_count 에 반영되지 않은 게시물 조회수를 반환합니다.
+
+        Args:
+            post_id (int): 게시물의 기본 키
+
+        Returns:
+            int: 이 프로세스의 메모리와 공유 버퍼 테이블에서 반영 대기 중인 조회수
+        """
+        with self._lock:
+            local = self._counts.get(post_id, 0)
+        staged = (
+            PostViewBuffer.objects.filter(post_id=post_id)
+            .values_list("views", flat=True)
+            .first()
+        )
+        return local + (staged or 0)
+
+    def clear(self):
+        """메모리에 모은 조회수를 반영하지 않고 버리고 반영 주기를 새로 시작합니다. (테스트용)"""
+        with self._lock:
+            self._counts = Counter()
+            self._pending = 0
+            self._last_flush = time.monotonic()
+
+    def stage(self):
+        """
+        메모리에 모은 조회수를 PostViewBuffer 테이블에 더합니다.
+
+        ``INSERT ... ON CONFLICT DO UPDATE SET views = views + n`` 으로 더하므로
+        여러 프로세스가 동시에 옮겨도 조회수가 사라지지 않습니다.
+
+        Returns:
+            int: 테이블로 옮긴 조회수 합계
+        """
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._pending = 0
+        if not counts:
+            return 0
+        table = connection.ops.quote_name(PostViewBuffer._meta.db_table)
+        try:
+            with connection.cursor() as cursor:
+                cursor.executemany(
+                    f"INSERT INTO {table} (post_id, views) VALUES (%s, %s) "
+                    f"ON CONFLICT (post_id) DO UPDATE SET views = {table}.views + "
+                    "excluded.views",
+                    list(counts.items()),
+                )
+        except Exception:
+            # 옮기지 못한 조회수는 다음 반영 때 다시 시도합니다.
+            with self._lock:
+                self._counts.update(counts)
+                self._pending += sum(counts.values())
+            raise
+        return sum(counts.values())
+
+    def flush(self, chunk_size=1000):
+        """
+        이 프로세스의 조회수를 테이블로 옮긴 뒤, 테이블의 모든 조회수를 DB에 반영합니다.
+
+        같은 증가량을 가진 게시물끼리 묶어 ``UPDATE ... SET views_count =
+        views_count + n`` 형태로 일괄 처리하고, 인기 점수(trending.py)도 함께 올립니다.
+        읽은 행은 같은 트랜잭션에서 잠그고(SQLite 는 IMMEDIATE 트랜잭션) 지우므로
+        여러 프로세스가 동시에 반영해도 같은 조회수를 두 번 더하지 않습니다.
+
+        Args:
+            chunk_size (int): 한 트랜잭션에서 반영할 게시물 수
+
+        Returns:
+            int: DB에 반영된 조회수 합계
+        """
+        with self._flush_lock:
+            return self._flush(chunk_size)
+
+    def _flush(self, chunk_size=1000):
+        """flush() 의 본체입니다. _flush_lock 을 잡은 채로 호출합니다."""
+        self.stage()
+        with self._lock:
+            self._last_flush = time.monotonic()
+
+        total = 0
+        last_post_id = None
+        while True:
+            with transaction.atomic():
+                rows = PostViewBuffer.objects.select_for_update().order_by("post_id")
+                if last_post_id is not None:
+                    rows = rows.filter(post_id__gt=last_post_id)
+                rows = list(rows.values_list("post_id", "views")[:chunk_size])
+                if not rows:
+                    break
+                grouped = defaultdict(list)
+                for post_id, views in rows:
+                    grouped[views].append(post_id)
+                for views, ids in grouped.items():
+                    Post.objects.filter(pk__in=ids).update(
+                        views_count=F("views_count") + views,
+                        trending_score=score_update(event_weight("view") * views),
+                    )
+                PostViewBuffer.objects.filter(
+                    post_id__in=[post_id for post_id, _ in rows]
+                ).delete()
+            total += sum(views for _, views in rows)
+            last_post_id = rows[-1][0]
+        return total
+
+
+view_counter = ViewCountBuffer()
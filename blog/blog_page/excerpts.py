@@ -0,0 +1,70 @@
+import math
+
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# 목록 카드에 보여줄 요약 단어 수
+EXCERPT_WORDS = 30
+
+# 분당 읽는 단어 수 (읽기 시간 계산용)
+WORDS_PER_MINUTE = 200
+
+
+def make_excerpt(content, words=EXCERPT_WORDS):
+    """
+    HTML 본문의 앞부분을 태그 짝이 맞는 요약으로 잘라냅니다.
+
+    Args:
+        content (str): 게시물 본문 (HTML)
+        words (int): 요약에 포함할 단어 수
+
+    Returns:
+        str: 열린 태그가 모두 닫힌 HTML 요약
+    """
+    return Truncator(content).words(words, html=True)
+
+
+def count_words(content):
+    """
+    HTML 태그를 제외한 본문의 단어 수를 셉니다.
+
+    Args:
+        content (str): 게시물 본문 (HTML)
+
+    Returns:
+        int: 공백 기준 단어 수
+    """
+    return len(strip_tags(content).split())
+
+
+def reading_time(word_count):
+    """
+    단어 수로 예상 읽기 시간(분)을 계산합니다. 본문이 있으면 최소 1분입니다.
+
+    Args:
+        word_count (int): 단어 수
+
+    Returns:
+        int: 예상 읽기 시간 (분)
+    """
+    if not word_count:
+        return 0
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+def content_stats(content):
+    """
+    본문으로부터 요약, 단어 수, 읽기 시간을 한 번에 계산합니다.
+
+    Args:
+        content (str): 게시물 본문 (HTML)
+
+    Returns:
+        dict: {"excerpt", "word_count", "reading_time"} 필드 값
+    """
+    word_count = count_words(content)
+    return {
+        "excerpt": make_excerpt(content),
+        "word_count": word_count,
+        "reading_time": reading_time(word_count),
+    }
@@ -0,0 +1,184 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.http import http_date
+
+from .models import Post, Tag
+from .page_cache import _version
+from .replicas import hold_primary
+
+FEED_FORMATS = {"rss": Rss201rev2Feed, "atom": Atom1Feed}
+
+# 모든 피드에 적용되는 버전 범위. 이 버전이 바뀌면 모든 피드와 피드 항목을 다시 만듭니다.
+SITE_SCOPE = "site"
+# 최근 게시물 피드의 버전 범위
+LATEST_SCOPE = "latest"
+# 피드 버전(마지막 변경 시각) 키
+FEED_VERSION_KEY = "feeds:version:{scope}"
+FEED_DOCUMENT_KEY = "feeds:document:{digest}"
+# 게시물 하나를 피드 항목으로 만든 결과 (SITE_SCOPE 버전, 항목)
+FEED_ENTRY_KEY = "feeds:entry:{pk}"
+
+
+def category_scope(slug):
+    """카테고리 피드의 버전 범위 이름을 반환합니다."""
+    return f"category:{slug}"
+
+
+def tag_scope(slug):
+    """태그 피드의 버전 범위 이름을 반환합니다."""
+    return f"tag:{slug}"
+
+
+def _versions(scope):
+    """모든 피드에 적용되는 버전과 scope 피드의 버전(둘 중 나중 것)을 반환합니다."""
+    site = _version(FEED_VERSION_KEY.format(scope=SITE_SCOPE))
+    return site, max(site, _version(FEED_VERSION_KEY.format(scope=scope)))
+
+
+def invalidate_feeds(*scopes, post_ids=(), site=False):
+    """
+    피드 문서를 무효화합니다. 버전만 바꾸므로 이전 문서는 만료 시 사라집니다.
+
+    Args:
+        *scopes (str): 바뀐 게시물이 들어가는 피드 (LATEST_SCOPE, category_scope(), tag_scope())
+        post_ids (iterable): 피드 항목을 다시 만들어야 하는 게시물의 기본 키
+        site (bool): 모든 피드 항목에 들어가는 태그/카테고리 이름이 바뀐 경우 True
+    """
+    if site:
+        scopes = (*scopes, SITE_SCOPE)
+    cache.set_many(
+        {FEED_VERSION_KEY.format(scope=scope): time.time() for scope in scopes}, None
+    )
+    cache.delete_many([FEED_ENTRY_KEY.format(pk=pk) for pk in post_ids])
+    if scopes:
+        # 복제본이 따라잡기 전에 이전 내용으로 문서가 다시 만들어지지 않도록 합니다.
+        hold_primary()
+
+
+def _render_entry(post):
+    """게시물을 피드 항목(Feed.add_item 인자)으로 만듭니다. 링크는 절대 URL 로 바꾸기 전입니다."""
+    return {
+        "title": post.title,
+        "link": post.get_absolute_url(),
+        "description": post.rendered_content,
+        "author_name": post.author.username,
+        "pubdate": post.created_at,
+        "categories": [tag.name for tag in post.tags.all()],
+    }
+
+
+def _load_entries(post_ids, generation):
+    """
+    게시물들의 피드 항목을 캐시에서 가져오고, 없거나 오래된 항목만 DB 에서 읽어 만듭니다.
+
+    Args:
+        post_ids (list): 피드에 들어갈 순서대로 정렬된 게시물의 기본 키
+        generation (float): 모든 피드에 적용되는 버전 (이 버전이 아닐 때 만든 항목은 다시 만듭니다)
+
+    Returns:
+        list: 피드 항목 목록
+    """
+    keys = {pk: FEED_ENTRY_KEY.format(pk=pk) for pk in post_ids}
+    cached = cache.get_many(keys.values())
+    entries = {}
+    for pk, key in keys.items():
+        value = cached.get(key)
+        if value is not None and value[0] == generation:
+            entries[pk] = value[1]
+
+    missing = [pk for pk in post_ids if pk not in entries]
+    if missing:
+        posts = (
+            Post.objects.filter(pk__in=missing)
+            .select_related("author")
+            .prefetch_related(
+                Prefetch(
+                    "tags", queryset=Tag.objects.filter(is_public=True).only("name")
+                )
+            )
+        )
+        rendered = {post.pk: _render_entry(post) for post in posts}
+        entries.update(rendered)
+        cache.set_many(
+            {keys[pk]: (generation, entry) for pk, entry in rendered.items()},
+            getattr(settings, "FEED_CACHE_TIMEOUT", 60 * 60 * 24),
+        )
+    return [entries[pk] for pk in post_ids if pk in entries]
+
+
+def _build_document(request, feed_format, load, generation):
+    """피드 문서(XML)를 만듭니다."""
+    title, link, description, posts = load()
+    post_ids = list(
+        posts.filter(status="published")
+        .order_by("-created_at", "-pk")
+        .values_list("pk", flat=True)[: getattr(settings, "FEED_SIZE", 20)]
+    )
+    feed = FEED_FORMATS[feed_format](
+        title=title,
+        link=request.build_absolute_uri(link),
+        description=description,
+        feed_url=request.build_absolute_uri(request.path),
+        language=settings.LANGUAGE_CODE,
+    )
+    for entry in _load_entries(post_ids, generation):
+        feed.add_item(**{**entry, "link": request.build_absolute_uri(entry["link"])})
+    return feed.writeString("utf-8")
+
+
+def serve_feed(request, scope, feed_format, load):
+    """
+    캐시된 RSS/Atom 피드 문서로 응답합니다.
+
+    피드 버전(마지막 변경 시각)으로 ETag/Last-Modified 를 만들어 조건부 요청에는
+    DB 에 접근하지 않고 304 를 돌려줍니다. 문서는 버전이 바뀐 뒤 처음 요청될 때
+    다시 만들고, 이때도 바뀐 게시물의 항목만 새로 만듭니다. 게시물/태그/카테고리가
+    바뀌면 signals.py 에서 invalidate_feeds() 로 버전을 올립니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        scope (str): 피드 버전 범위 (LATEST_SCOPE, category_scope(), tag_scope())
+        feed_format (str): "rss" 또는 "atom"
+        load (callable): 문서를 새로 만들 때만 호출되며
+            (제목, 링크, 설명, 게시물 쿼리셋) 을 반환합니다. 없는 대상이면 Http404
+
+    Returns:
+        HttpResponse: 피드 문서 또는 304 응답
+
+    Raises:
+        Http404: 지원하지 않는 형식이거나 load 가 대상을 찾지 못한 경우
+    """
+    if feed_format not in FEED_FORMATS:
+        raise Http404("지원하지 않는 피드 형식입니다.")
+    generation, version = _versions(scope)
+    # 쿼리 문자열은 무시하고, 문서에 들어가는 절대 URL 이 다른 호스트끼리는 구분합니다.
+    digest = hashlib.md5(
+        f"{version!r}:{feed_format}:{request.build_absolute_uri(request.path)}".encode()
+    ).hexdigest()
+    etag = f'"{digest}"'
+    last_modified = int(version)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        key = FEED_DOCUMENT_KEY.format(digest=digest)
+        document = cache.get(key)
+        if document is None:
+            document = _build_document(request, feed_format, load, generation)
+            cache.set(
+                key, document, getattr(settings, "FEED_CACHE_TIMEOUT", 60 * 60 * 24)
+            )
+        response = HttpResponse(
+            document, content_type=FEED_FORMATS[feed_format].content_type
+        )
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # 피드는 로그인 여부와 관계없이 같으므로 공유 캐시에 두되 매번 재검증합니다.
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    return response
@@ -1,4 +1,5 @@
 from django import forms
+from django.db import transaction
 from .models import Post, Category, Tag, Comment
 import json
 
@@ -72,22 +73,30 @@ class PostForm(forms.ModelForm):
         """
         instance = super().save(commit=False)
         if commit:
-            instance.save()
-            self.save_tags(instance)
+            with transaction.atomic():
+                instance.save()
+                self.save_tags(instance)
         return instance
 
     def save_tags(self, instance):
         """
         게시물에 태그를 저장합니다.
 
+        기존 태그는 한 번에 조회하고 없는 태그만 일괄 생성한 뒤,
+        현재 태그와 비교해 추가/삭제가 필요한 태그만 반영합니다.
+
         Args:
             instance (Post): 태그를 저장할 Post 인스턴스
         """
-        instance.tags.clear()
         tag_names = self.cleaned_data.get("tags", [])
-        for tag_name in tag_names:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            instance.tags.add(tag)
+        with transaction.atomic():
+            tags = Tag.get_or_create_many(tag_names)
+            wanted = {tag.pk for tag in tags}
+            current = set(instance.tags.values_list("pk", flat=True))
+            if current - wanted:
+                instance.tags.remove(*(current - wanted))
+            if wanted - current:
+                instance.tags.add(*(wanted - current))
 
 
 class CategoryForm(forms.ModelForm):
@@ -0,0 +1,161 @@
+import io
+import logging
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from .background import run_in_background
+from .storage import blob_storage
+
+logger = logging.getLogger(__name__)
+
+# 파생 이미지 이름과 최대 너비(px)
+VARIANTS = {
+    "thumb": 400,
+    "thumb@2x": 800,
+    "detail": 960,
+    "detail@2x": 1920,
+}
+
+# 템플릿에서 사용하는 srcset 묶음과 sizes 속성
+VARIANT_GROUPS = {
+    "list": (("thumb", "thumb@2x"), "(max-width: 600px) 100vw, 400px"),
+    "detail": (("detail", "detail@2x"), "(max-width: 960px) 100vw, 960px"),
+}
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+
+def _encode(image, image_format, **options):
+    """이미지를 지정한 형식으로 인코딩한 바이트를 반환합니다."""
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def build_derivatives(name):
+    """
+    원본 이미지로 크기별 파생 이미지(WebP + JPEG/PNG)를 만들어 원본 옆에 저장합니다.
+    원본은 블롭 스토리지(storage.py)에서 읽고, 파생 이미지는 게시물마다 default_storage 에 저장합니다.
+
+    원본보다 큰 파생 이미지는 만들지 않고, 같은 너비가 나오는 항목은 하나의 파일을 공유합니다.
+
+    Args:
+        name (str): 스토리지 상의 원본 이미지 경로
+
+    Returns:
+        dict: 파생 이미지 이름별 {"width", "webp", "fallback"} 정보
+    """
+    with blob_storage().open(name) as original:
+        image = Image.open(original)
+        image.load()
+    image = ImageOps.exif_transpose(image)
+
+    has_alpha = image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    if has_alpha:
+        image = image.convert("RGBA")
+        fallback_ext, fallback_format = ".png", "PNG"
+        fallback_options = {"optimize": True}
+    else:
+        image = image.convert("RGB")
+        fallback_ext, fallback_format = ".jpg", "JPEG"
+        fallback_options = {
+            "quality": JPEG_QUALITY,
+            "optimize": True,
+            "progressive": True,
+        }
+
+    base, _ = os.path.splitext(name)
+    variants = {}
+    by_width = {}
+    for label, max_width in VARIANTS.items():
+        width = min(max_width, image.width)
+        if width not in by_width:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+            webp = default_storage.save(
+                f"{base}.{width}w.webp",
+                ContentFile(_encode(resized, "WEBP", quality=WEBP_QUALITY, method=6)),
+            )
+            fallback = default_storage.save(
+                f"{base}.{width}w{fallback_ext}",
+                ContentFile(_encode(resized, fallback_format, **fallback_options)),
+            )
+            by_width[width] = {"width": width, "webp": webp, "fallback": fallback}
+        variants[label] = by_width[width]
+    return variants
+
+
+def delete_derivatives(variants):
+    """
+    파생 이미지 파일들을 스토리지에서 삭제합니다.
+
+    Args:
+        variants (dict): build_derivatives 가 반환한 파생 이미지 정보
+    """
+    names = {
+        entry[key]
+        for entry in (variants or {}).values()
+        for key in ("webp", "fallback")
+    }
+    for name in names:
+        default_storage.delete(name)
+
+
+def process_post_image(post_id, name):
+    """
+    게시물 대표 이미지의 파생 이미지를 만들고 Post.head_image_variants 에 기록합니다.
+
+    처리 중에 대표 이미지가 다시 바뀌었다면 만든 파일을 지우고 기록하지 않습니다.
+
+    Args:
+        post_id (int): 게시물의 기본 키
+        name (str): 처리할 원본 이미지 경로
+    """
+    from .models import Post
+
+    try:
+        variants = build_derivatives(name)
+    except Exception:
+        logger.exception("대표 이미지 파생본 생성에 실패했습니다: %s", name)
+        return {}
+
+    previous = (
+        Post.objects.filter(pk=post_id, head_image=name)
+        .values_list("head_image_variants", flat=True)
+        .first()
+    )
+    updated = Post.objects.filter(pk=post_id, head_image=name).update(
+        head_image_variants=variants
+    )
+    if not updated:
+        delete_derivatives(variants)
+        return {}
+    if previous:
+        delete_derivatives(
+            {
+                label: entry
+                for label, entry in previous.items()
+                if entry not in variants.values()
+            }
+        )
+    return variants
+
+
+def schedule_post_image(post_id, name):
+    """
+    대표 이미지 처리를 요청 경로 밖(background.py 작업자 스레드)에서 실행하도록 예약합니다.
+
+    Args:
+        post_id (int): 게시물의 기본 키
+        name (str): 처리할 원본 이미지 경로
+
+    Returns:
+        Future or dict: 작업 Future, 또는 동기 실행 시 파생 이미지 정보
+    """
+    return run_in_background(process_post_image, post_id, name)
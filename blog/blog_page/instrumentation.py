@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 측정값 (비동기 뷰의 sync_to_async 스레드까지 전달됩니다)
+_current = ContextVar("request_metrics", default=None)
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """뷰가 설정된 쿼리 예산(QUERY_BUDGETS)보다 많은 쿼리를 실행했을 때 발생하는 예외입니다."""
+
+
+class RequestMetrics:
+    """
+    요청 하나의 측정값을 담는 클래스입니다.
+
+    Attributes:
+        queries (int): 실행한 SQL 쿼리 수
+        db_time (float): 쿼리 실행에 걸린 총 시간(초)
+        template_time (float): 템플릿 렌더링에 걸린 총 시간(초, 렌더링 중 쿼리 포함)
+        started (float): 요청 시작 시각 (perf_counter)
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.started = time.perf_counter()
+
+    @property
+    def wall_time(self):
+        """요청 시작부터 지금까지 걸린 시간(초)을 반환합니다."""
+        return time.perf_counter() - self.started
+
+
+def _record_query(execute, sql, params, many, context):
+    """모든 DB 연결에 설치되는 execute wrapper 로, 현재 요청의 쿼리 수와 시간을 기록합니다."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def _install_wrapper(connection, **kwargs):
+    """DB 연결에 _record_query 를 한 번만 설치합니다."""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class _TimedTemplate:
+    """render() 에 걸린 시간을 현재 요청의 측정값에 더하는 템플릿 래퍼입니다."""
+
+    def __init__(self, template):
+        self._template = template
+
+    def __getattr__(self, name):
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return self._template.render(context, request)
+        started = time.perf_counter()
+        try:
+            return self._template.render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """
+    최상위 템플릿 렌더링 시간을 측정하는 Django 템플릿 백엔드입니다.
+
+    {% include %} 등 내부 템플릿은 엔진이 직접 불러오므로 중복 측정되지 않습니다.
+    """
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super().get_template(template_name))
+
+
+def get_request_stats():
+    """
+    URL 이름별 누적 측정값을 반환합니다.
+
+    Returns:
+        dict: URL 이름 -> {"requests", "queries", "max_queries", "db_ms",
+            "template_ms", "wall_ms"} (현재 프로세스 기준)
+    """
+    with _stats_lock:
+        return {name: dict(values) for name, values in _stats.items()}
+
+
+def reset_request_stats():
+    """누적 측정값을 모두 지웁니다."""
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record_stats(name, metrics, wall_time):
+    """URL 이름별 누적 측정값에 요청 하나를 더합니다."""
+    with _stats_lock:
+        entry = _stats.setdefault(
+            name,
+            {
+                "requests": 0,
+                "queries": 0,
+                "max_queries": 0,
+                "db_ms": 0.0,
+                "template_ms": 0.0,
+                "wall_ms": 0.0,
+            },
+        )
+        entry["requests"] += 1
+        entry["queries"] += metrics.queries
+        entry["max_queries"] = max(entry["max_queries"], metrics.queries)
+        entry["db_ms"] += metrics.db_time * 1000
+        entry["template_ms"] += metrics.template_time * 1000
+        entry["wall_ms"] += wall_time * 1000
+
+
+class QueryInstrumentationMiddleware:
+    """
+    요청마다 SQL 쿼리 수, DB 시간, 템플릿 렌더링 시간, 전체 시간을 측정하는 미들웨어입니다.
+
+    - 측정값은 URL 이름(예: "blog_page:post_list")별로 누적됩니다. (get_request_stats)
+    - QUERY_BUDGETS 에 정한 쿼리 수를 넘으면 QUERY_BUDGET_ACTION 에 따라
+      경고 로그를 남기거나("log") QueryBudgetExceeded 를 발생시킵니다("raise").
+    - SERVER_TIMING 이 켜져 있으면 Server-Timing 헤더로 브라우저 개발자 도구에 보여줍니다.
+
+    세션/인증 쿼리까지 세도록 MIDDLEWARE 의 앞쪽에 둡니다.
+    동기/비동기 요청을 모두 그대로 처리하므로 비동기 뷰에 스레드 전환이 생기지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        connection_created.connect(
+            _install_wrapper, dispatch_uid="blog_page.instrumentation"
+        )
+        for connection in connections.all(initialized_only=True):
+            _install_wrapper(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.process(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.process(request, response, metrics)
+
+    def process(self, request, response, metrics):
+        """측정값을 기록하고 예산을 확인한 뒤 Server-Timing 헤더를 붙입니다."""
+        wall_time = metrics.wall_time
+        match = request.resolver_match
+        name = match.view_name if match else "<unresolved>"
+        _record_stats(name, metrics, wall_time)
+        logger.debug(
+            "%s %s queries=%d db=%.1fms template=%.1fms total=%.1fms",
+            name,
+            response.status_code,
+            metrics.queries,
+            metrics.db_time * 1000,
+            metrics.template_time * 1000,
+            wall_time * 1000,
+        )
+
+        budget = getattr(settings, "QUERY_BUDGETS", {}).get(name)
+        if budget is not None and metrics.queries > budget:
+            message = f"{name} 에서 쿼리 {metrics.queries}개 실행 (예산 {budget}개)"
+            if getattr(settings, "QUERY_BUDGET_ACTION", "log") == "raise":
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        if getattr(settings, "SERVER_TIMING", False):
+            response["Server-Timing"] = ", ".join(
+                [
+                    f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries"',
+                    f"tpl;dur={metrics.template_time * 1000:.1f}",
+                    f"total;dur={wall_time * 1000:.1f}",
+                ]
+            )
+        return response
@@ -0,0 +1,45 @@
+import contextlib
+import datetime
+import gzip
+import json
+import sys
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# 게시물 JSON Lines(export_posts/import_posts) 형식 버전
+POSTS_FORMAT_VERSION = 1
+
+
+class _Encoder(DjangoJSONEncoder):
+    """시각을 밀리초로 자르지 않고 그대로 기록하는 JSON 인코더입니다."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def dumps(record):
+    """레코드를 한 줄짜리 JSON 문자열로 만듭니다. (날짜/시각은 ISO 8601)"""
+    return json.dumps(record, ensure_ascii=False, cls=_Encoder)
+
+
+def open_jsonl(path, mode="r"):
+    """
+    JSON Lines 파일을 UTF-8 텍스트 스트림으로 엽니다.
+
+    경로가 .gz 로 끝나면 gzip 으로 압축/해제하고, "-" 이면 표준 입출력을 사용합니다.
+
+    Args:
+        path (str): 파일 경로
+        mode (str): "r" 또는 "w"
+
+    Returns:
+        TextIO: 텍스트 스트림 (with 문으로 사용)
+    """
+    if path == "-":
+        # 표준 입출력은 닫지 않습니다.
+        return contextlib.nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    if path.endswith(".gz"):
+        return gzip.open(path, f"{mode}t", encoding="utf-8", newline="\n")
+    return open(path, mode, encoding="utf-8", newline="\n")
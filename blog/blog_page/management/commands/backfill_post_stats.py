@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog_page.models import CONTENT_STAT_FIELDS, Post
+
+
+class Command(BaseCommand):
+    """
+    기존 게시물의 요약(excerpt), 단어 수, 읽기 시간을 계산해 채우는 관리 명령입니다.
+
+    pk 순서로 chunk-size 개씩 본문만 불러와 bulk_update 로 저장합니다.
+
+    사용 예:
+        python manage.py backfill_post_stats --chunk-size 500
+    """
+
+    help = "게시물의 요약, 단어 수, 읽기 시간을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 처리할 게시물 수 (기본값: 500)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        last_pk = 0
+        count = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "content")[:chunk_size]
+            )
+            if not posts:
+                break
+            for post in posts:
+                post.update_content_stats()
+            with transaction.atomic():
+                Post.objects.bulk_update(posts, CONTENT_STAT_FIELDS)
+            last_pk = posts[-1].pk
+            count += len(posts)
+
+        self.stdout.write(self.style.SUCCESS(f"게시물 {count}개를 갱신했습니다."))
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from accounts.models import CustomUser
+from blog_page.models import Post
+
+ENDPOINTS = ("like", "bookmark", "comment")
+AJAX_HEADERS = {"x-requested-with": "XMLHttpRequest"}
+
+
+def _percentile(samples, percent):
+    """정렬된 표본에서 백분위 값을 반환합니다."""
+    index = min(len(samples) - 1, round(len(samples) * percent / 100))
+    return samples[index]
+
+
+class Command(BaseCommand):
+    """
+    좋아요/북마크/댓글 작성 엔드포인트를 동기(WSGI)와 비동기(ASGI) 경로로
+    동시에 호출해 초당 요청 수와 지연 시간 분포를 비교하는 관리 명령입니다.
+
+    동기 경로는 요청마다 작업자 스레드 하나를 점유하는 WSGI 핸들러를
+    --clients 개의 스레드로, 비동기 경로는 ASGI 핸들러를 하나의 이벤트 루프에서
+    --clients 개의 동시 작업으로 호출합니다. 측정용 사용자와 게시물은 끝나면 삭제됩니다.
+
+    사용 예:
+        python manage.py bench_interactions --clients 32 --requests 1000
+        python manage.py bench_interactions --endpoint comment
+    """
+
+    help = "상호작용 엔드포인트의 동기/비동기 처리량과 p99 지연 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clients", type=int, default=16, help="동시 클라이언트 수 (기본값: 16)"
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=400,
+            help="경로별 총 요청 수 (기본값: 400)",
+        )
+        parser.add_argument(
+            "--endpoint",
+            choices=ENDPOINTS,
+            default="like",
+            help="측정할 엔드포인트 (기본값: like)",
+        )
+
+    def handle(self, *args, **options):
+        clients = options["clients"]
+        users = [
+            CustomUser.objects.create_user(username=f"bench-interactions-{i}")
+            for i in range(clients)
+        ]
+        try:
+            post = Post.objects.create(
+                title="bench", content="bench", author=users[0], status="published"
+            )
+            url, data = self.request_for(options["endpoint"], post)
+            per_client = max(1, options["requests"] // clients)
+
+            sync_result = self.run_sync(users, url, data, per_client)
+            async_result = asyncio.run(self.run_async(users, url, data, per_client))
+        finally:
+            close_old_connections()
+            CustomUser.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+        self.stdout.write(
+            f"endpoint={options['endpoint']} clients={clients} "
+            f"requests={per_client * clients}"
+        )
+        self.stdout.write(
+            f"{'path':<8}{'req/s':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'errors':>8}"
+        )
+        for name, (elapsed, samples, errors) in (
+            ("sync", sync_result),
+            ("async", async_result),
+        ):
+            samples.sort()
+            self.stdout.write(
+                f"{name:<8}{len(samples) / elapsed:>10.1f}"
+                f"{_percentile(samples, 50) * 1000:>10.2f}"
+                f"{_percentile(samples, 99) * 1000:>10.2f}{errors:>8}"
+            )
+
+    def request_for(self, endpoint, post):
+        """엔드포인트 이름으로 요청 URL과 POST 데이터를 만듭니다."""
+        if endpoint == "comment":
+            return reverse("blog_page:comment_create", args=[post.pk]), {
+                "content": "벤치마크 댓글"
+            }
+        name = (
+            "blog_page:like_post" if endpoint == "like" else "blog_page:toggle_bookmark"
+        )
+        return reverse(name, args=[post.pk]), {}
+
+    def run_sync(self, users, url, data, per_client):
+        """WSGI 핸들러를 스레드 풀에서 동시에 호출합니다."""
+
+        def worker(user):
+            client = Client()
+            client.force_login(user)
+            samples, errors = [], 0
+            try:
+                for _ in range(per_client):
+                    started = time.perf_counter()
+                    response = client.post(url, data, headers=AJAX_HEADERS)
+                    samples.append(time.perf_counter() - started)
+                    errors += response.status_code != 200
+            finally:
+                close_old_connections()
+            return samples, errors
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(users)) as executor:
+            results = list(executor.map(worker, users))
+        elapsed = time.perf_counter() - started
+        return (
+            elapsed,
+            [sample for samples, _ in results for sample in samples],
+            sum(errors for _, errors in results),
+        )
+
+    async def run_async(self, users, url, data, per_client):
+        """ASGI 핸들러를 하나의 이벤트 루프에서 동시에 호출합니다."""
+        clients = []
+        for user in users:
+            client = AsyncClient()
+            await client.aforce_login(user)
+            clients.append(client)
+
+        async def worker(client):
+            samples, errors = [], 0
+            for _ in range(per_client):
+                started = time.perf_counter()
+                response = await client.post(url, data, headers=AJAX_HEADERS)
+                samples.append(time.perf_counter() - started)
+                errors += response.status_code != 200
+            return samples, errors
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(worker(client) for client in clients))
+        elapsed = time.perf_counter() - started
+        return (
+            elapsed,
+            [sample for samples, _ in results for sample in samples],
+            sum(errors for _, errors in results),
+        )
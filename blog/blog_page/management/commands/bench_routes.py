@@ -0,0 +1,383 @@
+import http.cookiejar
+import json
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.urls import reverse
+
+from blog_page.models import Category, Post, SearchTerm, Tag
+
+READ_ROUTES = (
+    "post_list",
+    "post_detail",
+    "search",
+    "category_page",
+    "tag_list",
+    "tag_page",
+)
+# 로그인이 필요하고 데이터를 바꾸는 경로 (--username 을 줄 때만 사용할 수 있습니다)
+WRITE_ROUTES = ("like_post", "toggle_bookmark", "comment_create")
+
+
+def _percentile(samples, percent):
+    """정렬된 표본에서 백분위 값을 반환합니다."""
+    index = min(len(samples) - 1, round(len(samples) * percent / 100))
+    return samples[index]
+
+
+def summarize(samples, statuses, elapsed):
+    """
+    한 경로의 측정 결과를 요약합니다.
+
+    Args:
+        samples (list): 요청별 응답 시간(초)
+        statuses (list): 요청별 HTTP 상태 코드 (연결 실패는 0)
+        elapsed (float): 경로 전체 측정 시간(초)
+
+    Returns:
+        dict: 요청 수, 오류 수, 상태 코드 분포, 초당 요청 수, 지연 시간 백분위(ms)
+    """
+    samples = sorted(samples)
+    codes = {}
+    for status in statuses:
+        codes[str(status)] = codes.get(str(status), 0) + 1
+    result = {
+        "requests": len(samples),
+        "errors": sum(1 for status in statuses if not 200 <= status < 400),
+        "status_codes": codes,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+    }
+    if samples:
+        result.update(
+            {
+                "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+                "p50_ms": round(_percentile(samples, 50) * 1000, 2),
+                "p90_ms": round(_percentile(samples, 90) * 1000, 2),
+                "p99_ms": round(_percentile(samples, 99) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2),
+            }
+        )
+    return result
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """리디렉션을 따라가지 않고 3xx 응답을 그대로 돌려받게 합니다."""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class _Session:
+    """쿠키(세션, CSRF)를 유지하는 HTTP 클라이언트입니다. 클라이언트마다 하나씩 만듭니다."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect()
+        )
+
+    def csrf_token(self):
+        """CSRF 쿠키 값을 반환합니다."""
+        for cookie in self.cookies:
+            if cookie.name == "csrftoken":
+                return cookie.value
+        return ""
+
+    def request(self, path, data=None):
+        """
+        요청을 보내고 (상태 코드, 응답 시간)을 반환합니다. 리디렉션은 따라가지 않습니다.
+
+        Args:
+            path (str): 요청 경로 (쿼리 문자열 포함)
+            data (dict, optional): 주면 폼 데이터로 POST 합니다.
+
+        Returns:
+            tuple: (HTTP 상태 코드, 응답 시간(초)). 연결 실패는 상태 코드 0
+        """
+        url = self.base_url + path
+        headers = {}
+        body = None
+        if data is not None:
+            body = urllib.parse.urlencode(data).encode()
+            headers = {
+                "X-CSRFToken": self.csrf_token(),
+                "X-Requested-With": "XMLHttpRequest",
+                "Referer": url,
+            }
+        request = urllib.request.Request(url, data=body, headers=headers)
+        started = time.perf_counter()
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as error:
+            error.read()
+            status = error.code
+        except (urllib.error.URLError, OSError):
+            status = 0
+        return status, time.perf_counter() - started
+
+    def login(self, username, password):
+        """로그인 페이지에서 CSRF 쿠키를 받은 뒤 로그인합니다."""
+        path = reverse("accounts:login")
+        self.request(path)
+        self.request(
+            path,
+            {
+                "username": username,
+                "password": password,
+                "csrfmiddlewaretoken": self.csrf_token(),
+            },
+        )
+        return any(cookie.name == "sessionid" for cookie in self.cookies)
+
+
+class Command(BaseCommand):
+    """
+    실행 중인 로컬 서버(runserver, gunicorn, uvicorn 등)에 blog_page 의 주요 URL 을
+    동시 클라이언트로 요청해 경로별 처리량과 지연 시간 백분위를 측정하는 관리 명령입니다.
+
+    요청할 게시물/카테고리/태그/검색어는 데이터베이스에서 골라 여러 개를 돌려가며 씁니다.
+    (generate_load_data 로 만든 데이터를 쓰면 운영 규모를 재현할 수 있습니다)
+    결과는 --output 에 JSON 으로 저장하고, --compare 로 이전 결과와 비교할 수 있습니다.
+
+    익명 요청은 페이지 캐시(page_cache.py)를 거치므로, 뷰 자체를 재려면
+    --username/--password 로 로그인해서 측정합니다.
+
+    사용 예:
+        python manage.py bench_routes --clients 32 --requests 2000 --output before.json
+        python manage.py bench_routes --output after.json --compare before.json
+        python manage.py bench_routes --username load-user-0 \\
+            --password load-test-password --route post_detail --route like_post
+    """
+
+    help = "로컬 서버에 주요 URL 을 동시에 요청해 처리량과 지연 시간을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000",
+            help="측정할 서버 주소 (기본값: http://127.0.0.1:8000)",
+        )
+        parser.add_argument(
+            "--clients", type=int, default=16, help="동시 클라이언트 수 (기본값: 16)"
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="경로별 총 요청 수 (기본값: 500)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=10,
+            help="측정 전에 경로별로 보낼 요청 수 (기본값: 10)",
+        )
+        parser.add_argument(
+            "--route",
+            action="append",
+            dest="routes",
+            choices=READ_ROUTES + WRITE_ROUTES,
+            help="측정할 URL 이름 (여러 번 지정 가능, 기본값: 읽기 경로 전체)",
+        )
+        parser.add_argument("--username", help="로그인해서 측정할 사용자 이름")
+        parser.add_argument("--password", default="", help="로그인 비밀번호")
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=50,
+            help="경로별로 돌려가며 쓸 대상(게시물 등) 수 (기본값: 50)",
+        )
+        parser.add_argument(
+            "--timeout", type=float, default=30, help="요청 제한 시간(초) (기본값: 30)"
+        )
+        parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+
+    def handle(self, *args, **options):
+        routes = options["routes"] or list(READ_ROUTES)
+        if options["username"] is None and set(routes) & set(WRITE_ROUTES):
+            raise CommandError(
+                f"{', '.join(WRITE_ROUTES)} 는 --username 으로 로그인해야 측정할 수 있습니다."
+            )
+        if options["clients"] < 1 or options["requests"] < 1:
+            raise CommandError("--clients 와 --requests 는 1 이상이어야 합니다.")
+        baseline = self.load(options["compare"]) if options["compare"] else None
+
+        sessions = self.open_sessions(options)
+        targets = self.targets(options["samples"])
+        results = {}
+        for route in routes:
+            requests = targets[route]
+            if not requests:
+                self.stderr.write(f"{route}: 요청할 대상이 없어 건너뜁니다.")
+                continue
+            self.run(sessions, requests, options["warmup"])
+            results[route] = self.run(sessions, requests, options["requests"])
+            results[route]["example"] = requests[0][0]
+
+        report = {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "base_url": options["base_url"],
+            "clients": options["clients"],
+            "requests_per_route": options["requests"],
+            "authenticated": options["username"] is not None,
+            "routes": results,
+        }
+        self.print_report(report, baseline)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과를 {options['output']} 에 저장했습니다.")
+
+    def load(self, path):
+        """이전 결과 JSON 을 읽습니다."""
+        try:
+            with open(path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as error:
+            raise CommandError(f"{path} 를 읽을 수 없습니다: {error}")
+
+    def open_sessions(self, options):
+        """클라이언트 수만큼 세션을 만들고, --username 이 있으면 각각 로그인합니다."""
+        sessions = [
+            _Session(options["base_url"], options["timeout"])
+            for _ in range(options["clients"])
+        ]
+        if options["username"] is not None:
+            with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+                logged_in = list(
+                    executor.map(
+                        lambda session: session.login(
+                            options["username"], options["password"]
+                        ),
+                        sessions,
+                    )
+                )
+            if not all(logged_in):
+                raise CommandError(f"{options['username']} 로 로그인하지 못했습니다.")
+        return sessions
+
+    def targets(self, count):
+        """
+        경로별로 돌려가며 요청할 (경로, POST 데이터) 목록을 데이터베이스에서 만듭니다.
+
+        Args:
+            count (int): 경로별 최대 대상 수
+
+        Returns:
+            dict: URL 이름 -> [(경로, POST 데이터 또는 None), ...]
+        """
+        post_ids = list(
+            Post.objects.filter(status="published")
+            .order_by("-comments_count")
+            .values_list("pk", flat=True)[:count]
+        )
+        terms = list(
+            SearchTerm.objects.order_by("-df").values_list("term", flat=True)[:count]
+        )
+        category_slugs = list(
+            Category.objects.filter(is_public=True).values_list("slug", flat=True)[
+                :count
+            ]
+        )
+        tag_slugs = list(
+            Tag.objects.filter(is_public=True)
+            .annotate(posts=Count("post"))
+            .order_by("-posts")
+            .values_list("slug", flat=True)[:count]
+        )
+
+        def url(name, *args):
+            return reverse(f"blog_page:{name}", args=args)
+
+        return {
+            "post_list": [(url("post_list"), None)],
+            "post_detail": [(url("post_detail", pk), None) for pk in post_ids],
+            "search": [
+                (f"{url('search')}?{urllib.parse.urlencode({'q': term})}", None)
+                for term in terms
+            ],
+            "category_page": [
+                (url("category_page", slug), None) for slug in category_slugs
+            ],
+            "tag_list": [(url("tag_list"), None)],
+            "tag_page": [(url("tag_page", slug), None) for slug in tag_slugs],
+            "like_post": [(url("like_post", pk), {}) for pk in post_ids],
+            "toggle_bookmark": [(url("toggle_bookmark", pk), {}) for pk in post_ids],
+            "comment_create": [
+                (url("comment_create", pk), {"content": "부하 테스트 댓글"})
+                for pk in post_ids
+            ],
+        }
+
+    def run(self, sessions, requests, total):
+        """
+        total 개의 요청을 클라이언트들에 나눠 동시에 보내고 결과를 요약합니다.
+
+        Args:
+            sessions (list): 클라이언트 세션 목록
+            requests (list): 돌려가며 보낼 (경로, POST 데이터) 목록
+            total (int): 보낼 요청 수
+
+        Returns:
+            dict: summarize() 의 반환값
+        """
+
+        def worker(index):
+            session = sessions[index]
+            samples, statuses = [], []
+            for n in range(index, total, len(sessions)):
+                path, data = requests[n % len(requests)]
+                status, elapsed = session.request(path, data)
+                samples.append(elapsed)
+                statuses.append(status)
+            return samples, statuses
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            results = list(executor.map(worker, range(len(sessions))))
+        elapsed = time.perf_counter() - started
+        return summarize(
+            [sample for samples, _ in results for sample in samples],
+            [status for _, statuses in results for status in statuses],
+            elapsed,
+        )
+
+    def print_report(self, report, baseline=None):
+        """경로별 결과 표를 출력합니다. 이전 결과가 있으면 변화율을 함께 출력합니다."""
+        previous = (baseline or {}).get("routes", {})
+        self.stdout.write(
+            f"{report['base_url']} clients={report['clients']} "
+            f"requests/route={report['requests_per_route']} "
+            f"authenticated={report['authenticated']}"
+        )
+        self.stdout.write(
+            f"{'route':<18}{'req/s':>9}{'p50(ms)':>10}{'p90(ms)':>10}"
+            f"{'p99(ms)':>10}{'errors':>8}"
+            + (f"{'Δreq/s':>10}{'Δp99':>10}" if baseline else "")
+        )
+        for route, result in report["routes"].items():
+            line = (
+                f"{route:<18}{result['rps']:>9.1f}{result.get('p50_ms', 0):>10.2f}"
+                f"{result.get('p90_ms', 0):>10.2f}{result.get('p99_ms', 0):>10.2f}"
+                f"{result['errors']:>8}"
+            )
+            before = previous.get(route)
+            if before and before.get("rps") and before.get("p99_ms"):
+                line += (
+                    f"{(result['rps'] / before['rps'] - 1) * 100:>+9.1f}%"
+                    f"{(result.get('p99_ms', 0) / before['p99_ms'] - 1) * 100:>+9.1f}%"
+                )
+            self.stdout.write(line)
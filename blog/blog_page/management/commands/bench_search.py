@@ -0,0 +1,122 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from accounts.models import CustomUser
+from blog_page.models import Post, SearchPosting, SearchTerm
+from blog_page.search import rebuild_index, search_posts
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+
+class Command(BaseCommand):
+    """
+    기존 icontains 검색과 역색인 검색의 응답 시간을 비교하는 관리 명령입니다.
+
+    --posts 를 주면 임시 게시물을 만들어 측정한 뒤 트랜잭션을 되돌리므로
+    데이터베이스에는 아무것도 남지 않습니다.
+
+    사용 예:
+        python manage.py bench_search --posts 100000 --repeat 5
+    """
+
+    help = "icontains 검색과 역색인 검색의 성능을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--posts",
+            type=int,
+            default=0,
+            help="측정용으로 임시 생성할 게시물 수 (기본값: 0, 기존 데이터 사용)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="검색어당 반복 횟수 (기본값: 5)"
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="측정할 검색어 (여러 번 지정 가능)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["posts"]:
+                self.create_corpus(options["posts"])
+            queries = options["queries"] or self.default_queries()
+            self.run(queries, options["repeat"])
+            if options["posts"]:
+                transaction.set_rollback(True)
+
+    def default_queries(self):
+        """자주 나오는 단어, 드문 단어, 없는 단어를 섞은 기본 검색어를 고릅니다."""
+        by_frequency = SearchTerm.objects.values_list("term", flat=True)
+        frequent = list(by_frequency.order_by("-df", "term")[:2])
+        rare = list(by_frequency.order_by("df", "term")[:2])
+        return frequent + rare + [" ".join(frequent), "없는단어"]
+
+    def create_corpus(self, count):
+        """측정용 게시물과 색인을 만듭니다."""
+        rng = random.Random(0)
+        # 실제 글처럼 소수의 단어가 자주 나오는 지프(Zipf) 분포의 어휘를 만듭니다.
+        vocabulary = [
+            (
+                "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+                if i % 2
+                else "".join(rng.choices(LATIN, k=rng.randint(3, 8)))
+            )
+            for i in range(5000)
+        ]
+        weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+        author, _ = CustomUser.objects.get_or_create(username="bench-search")
+        started = time.perf_counter()
+        Post.objects.bulk_create(
+            (
+                Post(
+                    title=" ".join(rng.choices(vocabulary, weights, k=5)),
+                    content=" ".join(
+                        rng.choices(vocabulary, weights, k=rng.randint(30, 150))
+                    ),
+                    author=author,
+                    status="published",
+                )
+                for _ in range(count)
+            ),
+            batch_size=1000,
+        )
+        rebuild_index()
+        self.stdout.write(
+            f"게시물 {count}개, 색인 {SearchPosting.objects.count()}건 생성 "
+            f"({time.perf_counter() - started:.1f}s)"
+        )
+
+    def run(self, queries, repeat):
+        """검색어마다 두 방식의 응답 시간을 측정해 출력합니다."""
+        for query in queries:
+            legacy = self.measure(
+                lambda: Post.objects.filter(
+                    Q(title__icontains=query)
+                    | Q(content__icontains=query)
+                    | Q(tags__name__icontains=query)
+                ).distinct()[:20],
+                repeat,
+            )
+            indexed = self.measure(lambda: search_posts(query)[:20], repeat)
+            self.stdout.write(
+                f"{query!r}: icontains {legacy * 1000:.1f}ms, "
+                f"역색인 {indexed * 1000:.1f}ms (x{legacy / max(indexed, 1e-9):.1f})"
+            )
+
+    def measure(self, build_queryset, repeat):
+        """쿼리셋을 repeat 번 평가해 중앙값(초)을 반환합니다."""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(build_queryset())
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
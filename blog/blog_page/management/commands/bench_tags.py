@@ -0,0 +1,84 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser
+from blog_page.forms import PostForm
+from blog_page.models import Post, Tag
+
+
+def legacy_save_tags(post, tag_names):
+    """이전 방식: 전부 지우고 태그마다 get_or_create 와 add 를 실행합니다."""
+    post.tags.clear()
+    for tag_name in tag_names:
+        tag, _ = Tag.objects.get_or_create(name=tag_name)
+        post.tags.add(tag)
+
+
+def bulk_save_tags(post, tag_names):
+    """새 방식: PostForm.save_tags 의 일괄 동기화를 사용합니다."""
+    form = PostForm(instance=post)
+    form.cleaned_data = {"tags": tag_names}
+    form.save_tags(post)
+
+
+class Command(BaseCommand):
+    """
+    태그가 많은 게시물을 저장할 때 이전 방식과 일괄 동기화 방식을 비교하는 관리 명령입니다.
+
+    측정이 끝나면 트랜잭션을 되돌리므로 데이터베이스에는 아무것도 남지 않습니다.
+
+    사용 예:
+        python manage.py bench_tags --tags 15 --repeat 20
+    """
+
+    help = "게시물 태그 저장의 쿼리 수와 소요 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tags", type=int, default=15, help="게시물당 태그 수 (기본값: 15)"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="반복 횟수 (기본값: 20)"
+        )
+
+    def handle(self, *args, **options):
+        count, repeat = options["tags"], options["repeat"]
+        with transaction.atomic():
+            author, _ = CustomUser.objects.get_or_create(username="bench-tags")
+            post = Post.objects.create(title="bench", content="bench", author=author)
+            for label, save_tags in (
+                ("get_or_create", legacy_save_tags),
+                ("bulk sync", bulk_save_tags),
+            ):
+                self.measure(label, save_tags, post, count, repeat)
+            transaction.set_rollback(True)
+
+    def measure(self, label, save_tags, post, count, repeat):
+        """새 태그 저장, 동일 태그 재저장, 절반 교체의 쿼리 수와 시간을 출력합니다."""
+        scenarios = {
+            "new": lambda i: [f"{label}-{i}-{n}" for n in range(count)],
+            "same": lambda i: [f"{label}-{i}-{n}" for n in range(count)],
+            "half": lambda i: [f"{label}-{i}-{n}" for n in range(count // 2, count)]
+            + [f"{label}-{i}-x{n}" for n in range(count // 2)],
+        }
+        results = {name: ([], []) for name in scenarios}
+        for i in range(repeat):
+            for name, names in scenarios.items():
+                queries, timings = results[name]
+                connection.queries_log.clear()
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    save_tags(post, names(i))
+                    timings.append(time.perf_counter() - started)
+                queries.append(len(captured))
+
+        summary = ", ".join(
+            f"{name} {statistics.median(queries):.0f}q/"
+            f"{statistics.median(timings) * 1000:.1f}ms"
+            for name, (queries, timings) in results.items()
+        )
+        self.stdout.write(f"{label} (태그 {count}개): {summary}")
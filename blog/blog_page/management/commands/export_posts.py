@@ -0,0 +1,151 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from blog_page.jsonl import POSTS_FORMAT_VERSION, dumps, open_jsonl
+from blog_page.models import Bookmark, Comment, Like, Post
+
+
+def _group_by_post(rows):
+    """values() 결과를 post_id 별로 묶습니다. (post_id 키는 빼고 저장)"""
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.pop("post_id")].append(row)
+    return grouped
+
+
+class Command(BaseCommand):
+    """
+    게시물을 태그, 카테고리, 댓글, 좋아요, 북마크, 첨부 파일 경로와 함께
+    한 줄에 게시물 하나씩 JSON Lines 로 내보내는 관리 명령입니다.
+
+    dumpdata 와 달리 기본 키 순서로 --chunk-size 개씩 읽고 바로 써서
+    게시물 수와 관계없이 메모리 사용량이 일정합니다. 묶음마다 쿼리는 5번입니다.
+    사용자와 카테고리/태그는 기본 키 대신 사용자 이름과 이름/슬러그로 기록하므로
+    다른 데이터베이스에 import_posts 로 가져올 수 있습니다.
+    첨부 파일/대표 이미지는 스토리지 경로만 기록하므로 MEDIA_ROOT 는 따로 복사해야 합니다.
+
+    사용 예:
+        python manage.py export_posts posts.jsonl.gz
+        python manage.py export_posts - --status published | gzip > posts.jsonl.gz
+        python manage.py export_posts rest.jsonl --after-id 120000
+    """
+
+    help = "게시물과 관련 데이터를 JSON Lines 로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output", help="출력 파일 경로 (.gz 면 gzip 압축, - 면 표준 출력)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 읽을 게시물 수 (기본값: 500)",
+        )
+        parser.add_argument(
+            "--status",
+            choices=[value for value, _ in Post.STATUS_CHOICES],
+            help="이 상태의 게시물만 내보냅니다.",
+        )
+        parser.add_argument(
+            "--after-id",
+            type=int,
+            default=0,
+            help="이 기본 키보다 큰 게시물부터 내보냅니다. (중단된 내보내기 이어서 하기)",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size 는 1 이상이어야 합니다.")
+        posts = Post.objects.order_by("pk")
+        if options["status"]:
+            posts = posts.filter(status=options["status"])
+
+        count = 0
+        last_id = options["after_id"]
+        with open_jsonl(options["output"], "w") as output:
+            while True:
+                chunk = list(
+                    posts.filter(pk__gt=last_id)
+                    .select_related("author", "category")
+                    .prefetch_related("tags")[: options["chunk_size"]]
+                )
+                if not chunk:
+                    break
+                for record in self.serialize(chunk):
+                    output.write(dumps(record) + "\n")
+                count += len(chunk)
+                last_id = chunk[-1].pk
+
+        # 표준 출력으로 내보낼 때는 결과 메시지가 데이터에 섞이지 않게 합니다.
+        log = self.stderr if options["output"] == "-" else self.stdout
+        log.write(f"게시물 {count}개를 내보냈습니다. (마지막 id: {last_id})")
+
+    def serialize(self, posts):
+        """게시물 묶음과 관련 데이터를 JSON 으로 바꿀 수 있는 딕셔너리로 만듭니다."""
+        ids = [post.pk for post in posts]
+        # 부모 댓글이 먼저 오도록 경로 순으로 기록합니다.
+        comments = _group_by_post(
+            Comment.objects.filter(post_id__in=ids)
+            .order_by("post_id", "path")
+            .values(
+                "post_id",
+                "id",
+                "parent_id",
+                "author__username",
+                "content",
+                "created_at",
+                "updated_at",
+            )
+        )
+        reactions = {
+            key: _group_by_post(
+                model.objects.filter(post_id__in=ids)
+                .order_by("pk")
+                .values("post_id", "user__username", "created_at")
+            )
+            for key, model in (("likes", Like), ("bookmarks", Bookmark))
+        }
+
+        for post in posts:
+            category = post.category
+            yield {
+                "version": POSTS_FORMAT_VERSION,
+                "id": post.pk,
+                "title": post.title,
+                "content": post.content,
+                "status": post.status,
+                "author": post.author.username,
+                "category": (
+                    {"name": category.name, "slug": category.slug} if category else None
+                ),
+                "tags": [
+                    {"name": tag.name, "slug": tag.slug} for tag in post.tags.all()
+                ],
+                "head_image": post.head_image.name,
+                "head_image_variants": post.head_image_variants,
+                "file_upload": post.file_upload.name,
+                "file_name": post.file_name,
+                "views_count": post.views_count,
+                "created_at": post.created_at,
+                "updated_at": post.updated_at,
+                "comments": [
+                    {
+                        "id": comment["id"],
+                        "parent": comment["parent_id"],
+                        "author": comment["author__username"],
+                        "content": comment["content"],
+                        "created_at": comment["created_at"],
+                        "updated_at": comment["updated_at"],
+                    }
+                    for comment in comments.get(post.pk, [])
+                ],
+                **{
+                    key: [
+                        {"user": row["user__username"], "created_at": row["created_at"]}
+                        for row in rows.get(post.pk, [])
+                    ]
+                    for key, rows in reactions.items()
+                },
+            }
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from blog_page.counters import view_counter
+
+
+class Command(BaseCommand):
+    """
+    버퍼(PostViewBuffer)에 누적된 게시물 조회수를 즉시 DB에 반영하는 관리 명령입니다.
+
+    웹 서버 등 다른 프로세스가 모아 둔 조회수도 반영합니다. (각 프로세스는 주기적으로,
+    그리고 종료할 때 메모리의 조회수를 버퍼 테이블로 옮깁니다)
+
+    사용 예:
+        python manage.py flush_view_counts
+    """
+
+    help = "버퍼에 누적된 게시물 조회수를 Post.views_count 에 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 트랜잭션에서 반영할 게시물 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        total = view_counter.flush(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"조회수 {total}건을 반영했습니다."))
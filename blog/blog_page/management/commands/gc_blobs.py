@@ -0,0 +1,145 @@
+import os
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog_page.models import BLOB_FIELDS, Blob, Post
+from blog_page.storage import (
+    BLOB_PREFIX,
+    STAGING_DIR,
+    blob_storage,
+    collect_blobs,
+    is_blob,
+)
+
+
+class Command(BaseCommand):
+    """
+    내용 주소 스토리지(storage.py)의 참조 수를 게시물 기준으로 다시 맞추고
+    참조가 없는 블롭을 지우는 관리 명령입니다.
+
+    1. 게시물이 실제로 가리키는 블롭 수로 Blob.references 를 고칩니다.
+    2. 참조가 0인 블롭(파일과 행)을 지웁니다.
+    3. Blob 행이 없는 블롭 파일과 오래된 업로드 임시 파일을 지웁니다.
+       (파일 저장 후 트랜잭션이 실패한 경우 등)
+
+    --import-legacy 를 주면 이전 날짜별 경로(blog/images/%Y/%m/%d/ 등)의 파일을
+    블롭으로 옮겨 같은 내용의 파일을 하나로 합칩니다.
+    유예 시간(BLOB_GC_GRACE)보다 최근에 쓰인 파일은 업로드 중일 수 있어 건드리지 않습니다.
+
+    사용 예:
+        python manage.py gc_blobs --dry-run
+        python manage.py gc_blobs --import-legacy
+    """
+
+    help = "블롭 참조 수를 다시 맞추고 참조가 없는 블롭을 지웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="지우지 않고 대상만 출력합니다."
+        )
+        parser.add_argument(
+            "--import-legacy",
+            action="store_true",
+            help="날짜별 경로의 기존 파일을 블롭으로 옮깁니다.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        if options["import_legacy"] and not dry_run:
+            self.import_legacy()
+
+        references = self.count_references()
+        fixed = self.sync_references(references, dry_run)
+        self.stdout.write(f"참조 수를 고친 블롭: {fixed}개")
+
+        if dry_run:
+            orphans = Blob.objects.filter(references=0).count()
+            self.stdout.write(f"참조가 없는 블롭: {orphans}개 (dry-run)")
+        else:
+            self.stdout.write(f"지운 블롭: {collect_blobs()}개")
+
+        stray = self.stray_files(set(Blob.objects.values_list("name", flat=True)))
+        for name in stray:
+            if not dry_run:
+                blob_storage().delete(name)
+        self.stdout.write(f"{'지울' if dry_run else '지운'} 고아 파일: {len(stray)}개")
+
+    def count_references(self):
+        """게시물 파일 필드가 가리키는 블롭별 참조 수를 셉니다."""
+        references = Counter()
+        for field in BLOB_FIELDS:
+            for name in Post.objects.exclude(**{field: ""}).values_list(
+                field, flat=True
+            ):
+                if is_blob(name):
+                    references[name] += 1
+        return references
+
+    def sync_references(self, references, dry_run):
+        """Blob.references 를 실제 참조 수로 맞추고 고친 블롭 수를 반환합니다."""
+        storage = blob_storage()
+        current = dict(Blob.objects.values_list("name", "references"))
+        fixed = 0
+        for name in current.keys() | references.keys():
+            count = references.get(name, 0)
+            if current.get(name) == count:
+                continue
+            fixed += 1
+            if dry_run:
+                self.stdout.write(f"  {name}: {current.get(name)} -> {count}")
+            elif name in current:
+                Blob.objects.filter(name=name).update(references=count)
+            elif storage.exists(name):
+                Blob.objects.create(
+                    name=name, size=storage.size(name), references=count
+                )
+        return fixed
+
+    def stray_files(self, known):
+        """Blob 행이 없는 블롭 파일과 오래된 임시 파일 경로를 찾습니다."""
+        storage = blob_storage()
+        threshold = time.time() - getattr(settings, "BLOB_GC_GRACE", 300)
+        root = storage.path(BLOB_PREFIX)
+        stray = []
+        for directory, _, files in os.walk(root):
+            for filename in files:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, storage.location).replace(os.sep, "/")
+                if os.path.getmtime(path) > threshold:
+                    continue
+                if name.startswith(f"{STAGING_DIR}/") or (
+                    is_blob(name) and name not in known
+                ):
+                    stray.append(name)
+        return stray
+
+    def import_legacy(self):
+        """날짜별 경로의 게시물 파일을 블롭으로 옮기고, 더 이상 쓰지 않는 원본을 지웁니다."""
+        storage = blob_storage()
+        moved = Counter()
+        for field in BLOB_FIELDS:
+            posts = Post.objects.exclude(**{field: ""}).values_list("pk", field)
+            for pk, name in list(posts):
+                if is_blob(name) or not storage.exists(name):
+                    continue
+                with storage.open(name) as original:
+                    blob = storage.save(name, original)
+                updates = {field: blob}
+                if field == "file_upload":
+                    updates["file_name"] = os.path.basename(name)
+                # 참조 수는 이어지는 sync_references 에서 맞춥니다.
+                Post.objects.filter(pk=pk).update(**updates)
+                moved[name] += 1
+
+        still_used = {
+            name
+            for field in BLOB_FIELDS
+            for name in Post.objects.values_list(field, flat=True)
+        }
+        for name in moved:
+            if name not in still_used:
+                storage.delete(name)
+        self.stdout.write(f"블롭으로 옮긴 파일: {sum(moved.values())}개")
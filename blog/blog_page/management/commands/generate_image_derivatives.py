@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from blog_page.images import process_post_image
+from blog_page.models import Post
+
+
+def _process(post_id, name):
+    """작업자 스레드에서 한 게시물을 처리하고 DB 연결을 닫습니다."""
+    try:
+        return bool(process_post_image(post_id, name))
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    """
+    기존 게시물 대표 이미지의 파생 이미지(썸네일, WebP)를 만드는 관리 명령입니다.
+
+    사용 예:
+        python manage.py generate_image_derivatives --workers 4
+        python manage.py generate_image_derivatives --force
+    """
+
+    help = "대표 이미지의 크기별/WebP 파생 이미지를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=4, help="작업자 스레드 수 (기본값: 4)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="한 번에 불러올 게시물 수 (기본값: 200)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="이미 파생 이미지가 있는 게시물도 다시 생성합니다.",
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(head_image="").order_by("pk")
+        if not options["force"]:
+            posts = posts.filter(head_image_variants={})
+        rows = posts.values_list("pk", "head_image").iterator(
+            chunk_size=options["chunk_size"]
+        )
+
+        done = failed = 0
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            for ok in executor.map(lambda row: _process(*row), rows):
+                if ok:
+                    done += 1
+                else:
+                    failed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"파생 이미지 생성 완료: {done}개, 실패: {failed}개")
+        )
@@ -0,0 +1,437 @@
+import itertools
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from blog_page.models import (
+    Bookmark,
+    Category,
+    Comment,
+    Like,
+    Post,
+    PostRecommendation,
+    SearchPosting,
+    Tag,
+)
+from blog_page.page_cache import invalidate_pages
+from blog_page.rendering import render_fields
+from blog_page.search import rebuild_document_frequency, rebuild_index
+from blog_page.tag_index import invalidate_tag_index
+
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호"
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+# 발행 상태 비율 (발행됨, 초안, 보류 중)
+STATUS_WEIGHTS = (("published", 0.85), ("draft", 0.1), ("pending", 0.05))
+
+
+def _distribute(total, weights, rng, cap=None):
+    """
+    total 을 가중치에 비례하게 나눕니다. 나머지는 가중치에 따라 무작위로 배분합니다.
+
+    Args:
+        total (int): 나눌 총 개수
+        weights (list): 항목별 가중치
+        rng (Random): 난수 생성기
+        cap (int, optional): 항목별 최대 개수
+
+    Returns:
+        list: 항목별 개수
+    """
+    weight_sum = sum(weights)
+    counts = [int(total * weight / weight_sum) for weight in weights]
+    remainder = total - sum(counts)
+    if remainder > 0:
+        for index in rng.choices(range(len(weights)), weights, k=remainder):
+            counts[index] += 1
+    if cap is not None:
+        counts = [min(count, cap) for count in counts]
+    return counts
+
+
+class Command(BaseCommand):
+    """
+    운영 규모의 데이터를 로컬에서 재현하기 위해 사용자, 카테고리, 태그, 게시물,
+    댓글(깊은 대댓글 포함), 좋아요, 북마크를 bulk_create 로 대량 생성하는 관리 명령입니다.
+
+    - 게시물 인기도는 지프(Zipf) 분포를 따라 소수의 게시물에 댓글/좋아요가 몰립니다.
+    - 댓글의 일부는 바로 앞 댓글에 답하는 대댓글 사슬로 만들어 --max-depth 까지 깊어집니다.
+    - 시그널을 거치지 않으므로 카운터, 요약/읽기 시간, 경로(path)는 직접 채우고
+      마지막에 검색 색인을 다시 만듭니다.
+    - 게시물 --chunk-size 개 단위로 관련 데이터를 만들고 저장하므로 메모리 사용량이 일정합니다.
+
+    생성한 사용자/태그/카테고리 이름은 --prefix 로 시작하며, --clear 로 지울 수 있습니다.
+    생성한 사용자는 모두 --password 로 로그인할 수 있습니다. (bench_routes 참고)
+
+    사용 예:
+        python manage.py generate_load_data
+        python manage.py generate_load_data --posts 1000 --comments 20000 --users 100
+        python manage.py generate_load_data --clear
+    """
+
+    help = "부하 테스트용 사용자/게시물/댓글/좋아요/북마크/태그를 대량 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=5000, help="사용자 수 (기본값: 5000)"
+        )
+        parser.add_argument(
+            "--posts", type=int, default=100000, help="게시물 수 (기본값: 100000)"
+        )
+        parser.add_argument(
+            "--comments",
+            type=int,
+            default=2000000,
+            help="댓글 수 (대댓글 포함, 기본값: 2000000)",
+        )
+        parser.add_argument(
+            "--likes", type=int, default=1000000, help="좋아요 수 (기본값: 1000000)"
+        )
+        parser.add_argument(
+            "--bookmarks",
+            type=int,
+            default=200000,
+            help="북마크 수 (기본값: 200000)",
+        )
+        parser.add_argument(
+            "--tags", type=int, default=3000, help="태그 수 (기본값: 3000)"
+        )
+        parser.add_argument(
+            "--categories", type=int, default=30, help="카테고리 수 (기본값: 30)"
+        )
+        parser.add_argument(
+            "--reply-ratio",
+            type=float,
+            default=0.6,
+            help="대댓글 비율 (기본값: 0.6)",
+        )
+        parser.add_argument(
+            "--max-depth",
+            type=int,
+            default=30,
+            help="대댓글 최대 깊이 (기본값: 30)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="게시물 작성일을 흩뿌릴 기간(일) (기본값: 365)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 번에 생성할 게시물 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--prefix", default="load-", help="생성할 이름의 접두사 (기본값: load-)"
+        )
+        parser.add_argument(
+            "--password",
+            default="load-test-password",
+            help="생성할 사용자의 비밀번호 (기본값: load-test-password)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본값: 0)")
+        parser.add_argument(
+            "--skip-index",
+            action="store_true",
+            help="검색 색인을 다시 만들지 않습니다.",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="--prefix 로 생성한 데이터를 지우고 끝냅니다.",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if options["clear"]:
+            self.clear(prefix)
+            return
+        if CustomUser.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(
+                f"'{prefix}' 로 시작하는 사용자가 이미 있습니다. "
+                "--clear 로 지우거나 --prefix 를 바꾸세요."
+            )
+        if options["max_depth"] < 0:
+            raise CommandError("--max-depth 는 0 이상이어야 합니다.")
+        if options["users"] < 1 or options["posts"] < 0:
+            raise CommandError("--users 는 1 이상, --posts 는 0 이상이어야 합니다.")
+
+        self.rng = random.Random(options["seed"])
+        self.options = options
+        started = time.perf_counter()
+
+        self.vocabulary = self.make_vocabulary()
+        with transaction.atomic():
+            self.user_ids = self.create_users(prefix, options["users"])
+            self.category_ids = self.create_categories(prefix, options["categories"])
+            self.tag_ids = self.create_tags(prefix, options["tags"])
+        self.step(started, f"사용자 {len(self.user_ids)}명, 태그 {len(self.tag_ids)}개")
+
+        self.create_posts()
+        self.step(started, f"게시물 {options['posts']}개와 관련 데이터")
+
+        if not options["skip_index"]:
+            rebuild_index()
+            self.step(started, "검색 색인")
+        invalidate_pages(site=True)
+        invalidate_tag_index()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"생성 완료 ({time.perf_counter() - started:.1f}s): "
+                f"게시물 {Post.objects.count()}, 댓글 {Comment.objects.count()}, "
+                f"좋아요 {Like.objects.count()}, 북마크 {Bookmark.objects.count()}"
+            )
+        )
+
+    def step(self, started, label):
+        """단계별 누적 소요 시간을 출력합니다."""
+        self.stdout.write(f"[{time.perf_counter() - started:7.1f}s] {label}")
+
+    def clear(self, prefix):
+        """--prefix 로 생성한 사용자(게시물/댓글 등 포함), 태그, 카테고리를 지웁니다."""
+        users = CustomUser.objects.filter(username__startswith=prefix)
+        posts = Post.objects.filter(author__in=users)
+        # 수백만 건을 Collector 와 시그널로 한 건씩 지우지 않도록 참조하는 테이블부터
+        # 한 번의 DELETE 로 지웁니다. 남은 게시물의 카운터는 바뀌지 않습니다.
+        related = [
+            Post.related_posts.through.objects.filter(from_post__in=posts),
+            Post.related_posts.through.objects.filter(to_post__in=posts),
+            PostRecommendation.objects.filter(post__in=posts),
+            PostRecommendation.objects.filter(related__in=posts),
+            Post.tags.through.objects.filter(post__in=posts),
+            SearchPosting.objects.filter(post__in=posts),
+            Like.objects.filter(post__in=posts),
+            Bookmark.objects.filter(post__in=posts),
+            Comment.objects.filter(post__in=posts),
+        ]
+        with transaction.atomic():
+            for queryset in related:
+                queryset._raw_delete(connection.alias)
+            posts._raw_delete(connection.alias)
+            users.delete()
+            Tag.objects.filter(name__startswith=prefix).delete()
+            Category.objects.filter(name__startswith=prefix).delete()
+        # 색인 항목을 시그널 없이 지웠으므로 토큰별 문서 빈도를 다시 셉니다.
+        rebuild_document_frequency()
+        invalidate_pages(site=True)
+        invalidate_tag_index()
+        self.stdout.write(self.style.SUCCESS(f"'{prefix}' 데이터를 지웠습니다."))
+
+    def make_vocabulary(self):
+        """자주 쓰는 단어와 드문 단어가 섞인 지프 분포의 어휘를 만듭니다."""
+        rng = self.rng
+        words = [
+            (
+                "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+                if i % 2
+                else "".join(rng.choices(LATIN, k=rng.randint(3, 8)))
+            )
+            for i in range(5000)
+        ]
+        # choices() 가 호출마다 누적 가중치를 다시 계산하지 않도록 미리 만들어 둡니다.
+        self.word_weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(words)))
+        )
+        return words
+
+    def words(self, count):
+        """어휘에서 count 개의 단어를 뽑아 공백으로 잇습니다."""
+        return " ".join(
+            self.rng.choices(self.vocabulary, cum_weights=self.word_weights, k=count)
+        )
+
+    def create_users(self, prefix, count):
+        """사용자를 만들고 기본 키 목록을 반환합니다. 비밀번호 해시는 한 번만 계산합니다."""
+        password = make_password(self.options["password"])
+        CustomUser.objects.bulk_create(
+            (
+                CustomUser(
+                    username=f"{prefix}user-{i}",
+                    nickname=self.words(1)[:30],
+                    password=password,
+                )
+                for i in range(count)
+            ),
+            batch_size=1000,
+        )
+        return list(
+            CustomUser.objects.filter(username__startswith=prefix)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+    def create_categories(self, prefix, count):
+        """카테고리를 만들고 기본 키 목록을 반환합니다."""
+        Category.objects.bulk_create(
+            Category(name=f"{prefix}category-{i}", slug=f"{prefix}category-{i}")
+            for i in range(count)
+        )
+        return list(
+            Category.objects.filter(name__startswith=prefix).values_list(
+                "pk", flat=True
+            )
+        )
+
+    def create_tags(self, prefix, count):
+        """태그를 만들고 인기순(지프 분포의 앞쪽부터) 기본 키 목록을 반환합니다."""
+        names = [f"{prefix}{self.words(1)[:12]}{i}" for i in range(count)]
+        Tag.objects.bulk_create(
+            (Tag(name=name, slug=Tag.make_slug(name)) for name in names),
+            batch_size=1000,
+        )
+        by_name = dict(
+            Tag.objects.filter(name__startswith=prefix).values_list("name", "pk")
+        )
+        return [by_name[name] for name in names]
+
+    def create_posts(self):
+        """게시물을 chunk_size 개씩 만들고, 각 묶음의 관련 데이터를 함께 저장합니다."""
+        options = self.options
+        rng = self.rng
+        total = options["posts"]
+        if not total:
+            return
+
+        # 게시물별 인기도 (무작위 순서의 지프 분포)
+        popularity = [1 / (rank + 1) ** 0.8 for rank in range(total)]
+        rng.shuffle(popularity)
+        users = len(self.user_ids)
+        comment_counts = _distribute(options["comments"], popularity, rng)
+        like_counts = _distribute(options["likes"], popularity, rng, cap=users)
+        bookmark_counts = _distribute(options["bookmarks"], popularity, rng, cap=users)
+
+        # 댓글 경로를 저장 전에 만들 수 있도록 기본 키를 직접 정합니다.
+        next_post_id = (Post.objects.aggregate(pk=Max("pk"))["pk"] or 0) + 1
+        self.next_comment_id = (Comment.objects.aggregate(pk=Max("pk"))["pk"] or 0) + 1
+        now = timezone.now()
+        chunk_size = options["chunk_size"]
+        statuses, status_weights = zip(*STATUS_WEIGHTS)
+
+        for start in range(0, total, chunk_size):
+            indexes = range(start, min(start + chunk_size, total))
+            posts = []
+            for index in indexes:
+                title = self.words(rng.randint(3, 8))[:100]
+                paragraphs = [
+                    f"<p>{self.words(rng.randint(20, 120))}</p>"
+                    for _ in range(rng.randint(1, 8))
+                ]
+                content = "\n".join(paragraphs)
+                posts.append(
+                    Post(
+                        pk=next_post_id + index,
+                        title=title,
+                        content=content,
+                        **render_fields(content),
+                        author_id=rng.choice(self.user_ids),
+                        category_id=(
+                            rng.choice(self.category_ids)
+                            if self.category_ids and rng.random() < 0.9
+                            else None
+                        ),
+                        status=rng.choices(statuses, status_weights)[0],
+                        views_count=int(popularity[index] * 100000)
+                        + rng.randint(0, 50),
+                        likes_count=like_counts[index],
+                        bookmarks_count=bookmark_counts[index],
+                        comments_count=comment_counts[index],
+                    )
+                )
+
+            with transaction.atomic():
+                Post.objects.bulk_create(posts, batch_size=500)
+                # auto_now_add 는 bulk_create 에서도 현재 시각으로 채워지므로 따로 흩뿌립니다.
+                for post in posts:
+                    post.created_at = now - timedelta(
+                        seconds=rng.randint(0, options["days"] * 86400)
+                    )
+                Post.objects.bulk_update(posts, ["created_at"], batch_size=500)
+                self.create_post_tags(posts)
+                self.create_comments(posts, [comment_counts[i] for i in indexes])
+                self.create_reactions(Like, posts, [like_counts[i] for i in indexes])
+                self.create_reactions(
+                    Bookmark, posts, [bookmark_counts[i] for i in indexes]
+                )
+            self.stdout.write(f"  게시물 {indexes.stop}/{total}")
+
+        # 기본 키를 직접 넣었으므로 PostgreSQL 등의 시퀀스를 맞춰 둡니다.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Post, Comment]):
+                cursor.execute(sql)
+
+    def create_post_tags(self, posts):
+        """게시물마다 인기 태그 위주로 0~5개의 태그를 붙입니다."""
+        if not self.tag_ids:
+            return
+        weights = list(
+            itertools.accumulate(1 / (rank + 1) for rank in range(len(self.tag_ids)))
+        )
+        through = Post.tags.through
+        links = []
+        for post in posts:
+            tag_ids = set(
+                self.rng.choices(
+                    self.tag_ids, cum_weights=weights, k=self.rng.randint(0, 5)
+                )
+            )
+            links.extend(through(post_id=post.pk, tag_id=tag_id) for tag_id in tag_ids)
+        through.objects.bulk_create(links, batch_size=1000)
+
+    def create_comments(self, posts, counts):
+        """
+        게시물마다 댓글을 만듭니다.
+
+        대댓글은 대부분 바로 앞 댓글에 달아 긴 대화 사슬을 만들고,
+        나머지는 앞선 댓글 중 무작위로 고릅니다. --max-depth 에 닿으면 최상위 댓글이 됩니다.
+        """
+        rng = self.rng
+        reply_ratio = self.options["reply_ratio"]
+        max_depth = self.options["max_depth"]
+        separator = Comment.PATH_SEPARATOR
+        comments = []
+        for post, count in zip(posts, counts):
+            thread = []
+            for _ in range(count):
+                comment_id = self.next_comment_id
+                self.next_comment_id += 1
+                step = str(comment_id).zfill(Comment.PATH_STEP_WIDTH)
+                parent = None
+                if thread and rng.random() < reply_ratio:
+                    parent = thread[-1] if rng.random() < 0.7 else rng.choice(thread)
+                    if parent.depth >= max_depth:
+                        parent = None
+                comment = Comment(
+                    pk=comment_id,
+                    post_id=post.pk,
+                    author_id=rng.choice(self.user_ids),
+                    content=self.words(rng.randint(3, 40)),
+                    parent=parent,
+                    path=f"{parent.path}{separator}{step}" if parent else step,
+                    depth=parent.depth + 1 if parent else 0,
+                )
+                thread.append(comment)
+                comments.append(comment)
+            if len(comments) >= 5000:
+                Comment.objects.bulk_create(comments, batch_size=1000)
+                comments = []
+        Comment.objects.bulk_create(comments, batch_size=1000)
+
+    def create_reactions(self, model, posts, counts):
+        """게시물마다 서로 다른 사용자 count 명의 좋아요/북마크를 만듭니다."""
+        rows = []
+        for post, count in zip(posts, counts):
+            rows.extend(
+                model(post_id=post.pk, user_id=user_id)
+                for user_id in self.rng.sample(self.user_ids, count)
+            )
+        model.objects.bulk_create(rows, batch_size=1000)
@@ -0,0 +1,384 @@
+import itertools
+import json
+import os
+from collections import Counter
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max, Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+from accounts.models import CustomUser
+from blog_page.feeds import LATEST_SCOPE, invalidate_feeds
+from blog_page.jsonl import POSTS_FORMAT_VERSION, open_jsonl
+from blog_page.models import (
+    BLOB_FIELDS,
+    Bookmark,
+    Category,
+    Comment,
+    Like,
+    Post,
+    SearchPosting,
+    Tag,
+)
+from blog_page.page_cache import invalidate_pages
+from blog_page.rendering import render_fields
+from blog_page.search import adjust_document_frequency, build_postings
+from blog_page.sitemaps import invalidate_sitemap
+from blog_page.sidebar import invalidate_category_sidebar
+from blog_page.storage import acquire_blobs, blob_storage, is_blob
+from blog_page.tag_index import invalidate_tag_index
+
+
+def _insert_raw(model, objects):
+    """
+    auto_now/auto_now_add 를 적용하지 않고 객체의 값 그대로 INSERT 합니다.
+
+    bulk_create 는 생성/수정 시각을 현재 시각으로 덮어써 원래 값으로 되돌리려면
+    bulk_update 가 필요한데, 행마다 CASE 식을 만드는 비용이 가져오기 시간의 대부분을
+    차지합니다. loaddata 처럼 raw 로 저장해 한 번의 INSERT 로 끝냅니다.
+
+    Args:
+        model (Model): 모델 클래스
+        objects (list): 저장할 객체 (기본 키가 없으면 데이터베이스가 정합니다)
+    """
+    if not objects:
+        return
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not (field.primary_key and objects[0].pk is None)
+    ]
+    batch_size = connection.ops.bulk_batch_size(fields, objects)
+    for start in range(0, len(objects), batch_size):
+        model._base_manager._insert(
+            objects[start : start + batch_size], fields=fields, raw=True
+        )
+
+
+class Command(BaseCommand):
+    """
+    export_posts 로 내보낸 JSON Lines 파일에서 게시물과 관련 데이터를 가져오는 관리 명령입니다.
+
+    - 파일을 한 줄씩 읽어 --batch-size 개 게시물마다 한 트랜잭션에서 여러 행을 한 번에
+      INSERT 하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    - 묶음이 커밋될 때마다 처리한 줄 번호를 체크포인트 파일에 기록합니다. 중간에
+      실패하면 실패한 묶음만 롤백되고, --resume 으로 그다음 줄부터 이어서 가져옵니다.
+    - 게시물과 댓글은 새 기본 키로 저장합니다. 댓글 경로를 미리 만들 수 있도록 묶음마다
+      현재 최대 기본 키 다음 번호를 직접 정하므로, 사이트에 글이 쓰이는 중에 가져오다
+      기본 키가 겹치면 그 묶음은 롤백되고 --resume 으로 다시 가져오면 됩니다.
+    - 사용자는 사용자 이름, 카테고리는 슬러그(또는 이름), 태그는 이름으로 찾고
+      없으면 만듭니다.
+      새로 만든 사용자는 비밀번호가 없으므로 비밀번호 재설정으로 로그인해야 합니다.
+    - 시그널을 거치지 않으므로 카운터, 요약/읽기 시간, 댓글 경로, 검색 색인, 블롭 참조 수를
+      직접 채우고, 묶음마다 피드/사이트맵을, 끝나면 페이지/사이드바/태그 캐시를 무효화합니다.
+      관련 게시물은 가져오지 않으므로 update_related_posts 를 따로 실행합니다.
+    - 첨부 파일/대표 이미지는 경로만 가져옵니다. MEDIA_ROOT 를 먼저 복사해 두면
+      블롭 참조 수가 함께 기록되고, 나중에 복사했다면 gc_blobs 로 맞춥니다.
+
+    사용 예:
+        python manage.py import_posts posts.jsonl.gz
+        python manage.py import_posts posts.jsonl.gz --resume
+    """
+
+    help = "export_posts 로 내보낸 JSON Lines 파일에서 게시물을 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "input", help="입력 파일 경로 (.gz 면 gzip 압축, - 면 표준 입력)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 트랜잭션에서 저장할 게시물 수 (기본값: 500)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="체크포인트 파일 경로 (기본값: <입력 파일>.checkpoint)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="체크포인트에 기록된 줄 다음부터 이어서 가져옵니다.",
+        )
+        parser.add_argument(
+            "--skip-index",
+            action="store_true",
+            help="검색 색인을 만들지 않습니다. (rebuild_search_index 로 따로 만듭니다)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size 는 1 이상이어야 합니다.")
+        path = options["input"]
+        checkpoint = options["checkpoint"]
+        if checkpoint is None and path != "-":
+            checkpoint = f"{path}.checkpoint"
+        self.options = options
+
+        done = 0
+        if options["resume"]:
+            if not checkpoint or not os.path.exists(checkpoint):
+                raise CommandError("이어서 가져올 체크포인트 파일이 없습니다.")
+            with open(checkpoint, encoding="utf-8") as file:
+                state = json.load(file)
+            if state["input"] != os.path.abspath(path):
+                raise CommandError(
+                    f"체크포인트는 다른 파일({state['input']})의 것입니다."
+                )
+            done = state["line"]
+            self.stdout.write(f"{done}번째 줄까지 가져온 상태에서 이어서 가져옵니다.")
+
+        imported = 0
+        self.missing_files = 0
+        with open_jsonl(path) as lines:
+            # 이미 가져온 줄은 파싱하지 않고 건너뜁니다.
+            numbered = itertools.islice(enumerate(lines, 1), done, None)
+            while batch := list(itertools.islice(numbered, options["batch_size"])):
+                records = [self.parse(number, line) for number, line in batch]
+                records = [record for record in records if record]
+                with transaction.atomic():
+                    changed = self.import_batch(records)
+                # 커밋된 묶음은 바로 피드와 사이트맵에 보이도록 합니다.
+                invalidate_feeds(LATEST_SCOPE, post_ids=changed["posts"], site=True)
+                for section, pks in changed.items():
+                    invalidate_sitemap(section, *pks)
+                done = batch[-1][0]
+                imported += len(records)
+                if checkpoint:
+                    self.save_checkpoint(checkpoint, path, done)
+                self.stdout.write(f"  {done}번째 줄까지 게시물 {imported}개")
+
+        invalidate_pages(site=True)
+        invalidate_category_sidebar()
+        invalidate_tag_index()
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        if self.missing_files:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"스토리지에 없는 파일 {self.missing_files}개는 참조 수를 기록하지 "
+                    "않았습니다. 파일을 복사한 뒤 gc_blobs 를 실행하세요."
+                )
+            )
+        self.stdout.write(self.style.SUCCESS(f"게시물 {imported}개를 가져왔습니다."))
+
+    def parse(self, number, line):
+        """한 줄을 게시물 레코드로 읽습니다. 빈 줄이면 None 을 반환합니다."""
+        if not line.strip():
+            return None
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise CommandError(f"{number}번째 줄을 읽을 수 없습니다: {error}")
+        if record.get("version") != POSTS_FORMAT_VERSION:
+            raise CommandError(
+                f"{number}번째 줄의 형식 버전({record.get('version')})을 지원하지 않습니다."
+            )
+        return record
+
+    def save_checkpoint(self, checkpoint, path, line):
+        """가져온 마지막 줄 번호를 기록합니다. 쓰는 도중에 멈춰도 깨지지 않도록 바꿔치기합니다."""
+        temp = f"{checkpoint}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump({"input": os.path.abspath(path), "line": line}, file)
+        os.replace(temp, checkpoint)
+
+    def import_batch(self, records):
+        """
+        게시물 묶음과 관련 데이터를 저장합니다.
+
+        Returns:
+            dict: 사이트맵 구역별로 저장하거나 사용한 객체의 기본 키
+                ({"posts": [...], "categories": [...], "tags": [...]})
+        """
+        users = self.resolve_users(
+            {record["author"] for record in records}
+            | {
+                item.get("author") or item.get("user")
+                for record in records
+                for key in ("comments", "likes", "bookmarks")
+                for item in record[key]
+            }
+        )
+        categories = self.resolve_categories(
+            [record["category"] for record in records if record["category"]]
+        )
+        tags = {
+            tag.name: tag
+            for tag in Tag.get_or_create_many(
+                [tag["name"] for record in records for tag in record["tags"]]
+            )
+        }
+
+        # 댓글 경로를 저장 전에 만들 수 있도록 기본 키를 직접 정합니다.
+        next_post_id = (Post.objects.aggregate(pk=Max("pk"))["pk"] or 0) + 1
+        self.next_comment_id = (Comment.objects.aggregate(pk=Max("pk"))["pk"] or 0) + 1
+        posts, comments, likes, bookmarks = [], [], [], []
+        for post_id, record in enumerate(records, next_post_id):
+            reactions = {}
+            for key, model, rows in (
+                ("likes", Like, likes),
+                ("bookmarks", Bookmark, bookmarks),
+            ):
+                # 같은 사용자의 좋아요/북마크는 하나만 남깁니다.
+                items = {item["user"]: item for item in record[key]}.values()
+                reactions[key] = [
+                    model(
+                        post_id=post_id,
+                        user=users[item["user"]],
+                        created_at=parse_datetime(item["created_at"]),
+                    )
+                    for item in items
+                ]
+                rows.extend(reactions[key])
+            comments.extend(self.build_comments(post_id, record["comments"], users))
+            posts.append(
+                Post(
+                    pk=post_id,
+                    title=record["title"],
+                    content=record["content"],
+                    **render_fields(record["content"]),
+                    status=record["status"],
+                    author=users[record["author"]],
+                    category=(
+                        categories.get(record["category"]["slug"])
+                        if record["category"]
+                        else None
+                    ),
+                    head_image=record["head_image"],
+                    head_image_variants=record["head_image_variants"],
+                    file_upload=record["file_upload"],
+                    file_name=record["file_name"],
+                    views_count=record["views_count"],
+                    likes_count=len(reactions["likes"]),
+                    bookmarks_count=len(reactions["bookmarks"]),
+                    comments_count=len(record["comments"]),
+                    created_at=parse_datetime(record["created_at"]),
+                    updated_at=parse_date(record["updated_at"][:10]),
+                )
+            )
+
+        _insert_raw(Post, posts)
+        through = Post.tags.through
+        through.objects.bulk_create(
+            through(post_id=post.pk, tag_id=tags[tag["name"]].pk)
+            for post, record in zip(posts, records)
+            for tag in {tag["name"]: tag for tag in record["tags"]}.values()
+        )
+        _insert_raw(Comment, comments)
+        _insert_raw(Like, likes)
+        _insert_raw(Bookmark, bookmarks)
+        # 기본 키를 직접 넣었으므로 PostgreSQL 등의 시퀀스를 맞춰 둡니다.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Post, Comment]):
+                cursor.execute(sql)
+
+        self.acquire_files(posts)
+        if not self.options["skip_index"]:
+            self.index(posts)
+        # 새로 만든 카테고리/태그를 따로 구분하지 않고 묶음에서 쓴 것을 모두 돌려줍니다.
+        return {
+            "posts": [post.pk for post in posts],
+            "categories": [category.pk for category in categories.values()],
+            "tags": [tag.pk for tag in tags.values()],
+        }
+
+    def resolve_users(self, usernames):
+        """사용자 이름 -> 사용자 딕셔너리를 만듭니다. 없는 사용자는 비밀번호 없이 만듭니다."""
+        usernames.discard(None)
+        users = {
+            user.username: user
+            for user in CustomUser.objects.filter(username__in=usernames)
+        }
+        missing = usernames - users.keys()
+        if missing:
+            CustomUser.objects.bulk_create(
+                CustomUser(username=username, password=make_password(None))
+                for username in missing
+            )
+            users.update(
+                (user.username, user)
+                for user in CustomUser.objects.filter(username__in=missing)
+            )
+            self.stdout.write(f"  사용자 {len(missing)}명을 새로 만들었습니다.")
+        return users
+
+    def resolve_categories(self, categories):
+        """슬러그 -> 카테고리 딕셔너리를 만듭니다. 슬러그나 이름이 같은 카테고리를 재사용합니다."""
+        wanted = {category["slug"]: category["name"] for category in categories}
+        if not wanted:
+            return {}
+        query = Q(slug__in=wanted) | Q(name__in=wanted.values())
+        existing = list(Category.objects.filter(query))
+        by_slug = {category.slug: category for category in existing}
+        by_name = {category.name: category for category in existing}
+        missing = [
+            Category(name=name, slug=slug)
+            for slug, name in wanted.items()
+            if slug not in by_slug and name not in by_name
+        ]
+        if missing:
+            Category.objects.bulk_create(missing, ignore_conflicts=True)
+            for category in Category.objects.filter(query):
+                by_slug.setdefault(category.slug, category)
+                by_name.setdefault(category.name, category)
+        return {
+            slug: by_slug.get(slug) or by_name.get(name)
+            for slug, name in wanted.items()
+        }
+
+    def build_comments(self, post_id, items, users):
+        """
+        게시물 하나의 댓글 객체를 만듭니다. 기본 키와 경로(path)를 미리 정합니다.
+
+        내보낸 파일은 경로 순이라 부모 댓글이 항상 먼저 나옵니다.
+        부모를 찾을 수 없는 댓글은 최상위 댓글로 가져옵니다.
+        """
+        separator = Comment.PATH_SEPARATOR
+        created = {}
+        for item in items:
+            comment_id = self.next_comment_id
+            self.next_comment_id += 1
+            step = str(comment_id).zfill(Comment.PATH_STEP_WIDTH)
+            parent = created.get(item["parent"])
+            comment = Comment(
+                pk=comment_id,
+                post_id=post_id,
+                author=users[item["author"]],
+                content=item["content"],
+                parent=parent,
+                path=f"{parent.path}{separator}{step}" if parent else step,
+                depth=parent.depth + 1 if parent else 0,
+                created_at=parse_datetime(item["created_at"]),
+                updated_at=parse_datetime(item["updated_at"]),
+            )
+            created[item["id"]] = comment
+            yield comment
+
+    def acquire_files(self, posts):
+        """게시물이 가리키는 블롭의 참조 수를 늘립니다. 스토리지에 없는 파일은 셉니다."""
+        storage = blob_storage()
+        names = [
+            getattr(post, field).name
+            for post in posts
+            for field in BLOB_FIELDS
+            if is_blob(getattr(post, field).name)
+        ]
+        present = [name for name in names if storage.exists(name)]
+        self.missing_files += len(names) - len(present)
+        acquire_blobs(*present)
+
+    def index(self, posts):
+        """가져온 게시물의 검색 색인 항목을 만들고 토큰별 문서 빈도를 늘립니다."""
+        posts = Post.objects.filter(pk__in=[post.pk for post in posts])
+        postings = [
+            SearchPosting(term=term, post=post, weight=weight)
+            for post in posts.prefetch_related("tags")
+            for term, weight in build_postings(post).items()
+        ]
+        SearchPosting.objects.bulk_create(postings, batch_size=500)
+        adjust_document_frequency(Counter(posting.term for posting in postings))
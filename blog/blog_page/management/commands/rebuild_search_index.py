@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from blog_page.search import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    게시물 검색 역색인을 처음부터 다시 만드는 관리 명령입니다.
+
+    사용 예:
+        python manage.py rebuild_search_index --chunk-size 500
+    """
+
+    help = "모든 게시물의 검색 색인(SearchPosting)을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 처리할 게시물 수 (기본값: 500)",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_index(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"게시물 {count}개를 색인했습니다."))
@@ -0,0 +1,68 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from blog_page.models import Comment, Like, Post
+from blog_page.trending import initial_score
+
+
+class Command(BaseCommand):
+    """
+    모든 게시물의 인기 점수(trending_score)를 좋아요/댓글 기록으로 다시 계산하는 관리 명령입니다.
+
+    평소에는 이벤트마다 점수가 바뀌므로 필요 없고, 처음 도입할 때나
+    TRENDING_HALF_LIFE / TRENDING_WEIGHTS 를 바꾼 뒤에 실행합니다.
+    조회는 시각을 기록하지 않으므로 조회수 전체를 게시물 작성 시각에 일어난 것으로 봅니다.
+
+    사용 예:
+        python manage.py rebuild_trending_scores --chunk-size 500
+    """
+
+    help = "게시물의 인기 점수를 좋아요/댓글 기록으로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 처리할 게시물 수 (기본값: 500)",
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        chunk_size = options["chunk_size"]
+        last_pk = 0
+        count = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "status", "created_at", "views_count")[:chunk_size]
+            )
+            if not posts:
+                break
+            ids = [post.pk for post in posts]
+            events = defaultdict(list)
+            for event, model in (("like", Like), ("comment", Comment)):
+                rows = model.objects.filter(post_id__in=ids).values_list(
+                    "post_id", "created_at"
+                )
+                for post_id, created_at in rows.iterator():
+                    events[post_id].append((event, created_at, 1))
+            for post in posts:
+                post_events = events[post.pk]
+                if post.views_count:
+                    post_events.append(("view", post.created_at, post.views_count))
+                if post.status == "published":
+                    post_events.append(("publish", post.created_at, 1))
+                post.trending_score = initial_score(post_events, now)
+            with transaction.atomic():
+                Post.objects.bulk_update(posts, ["trending_score"])
+            last_pk = posts[-1].pk
+            count += len(posts)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"게시물 {count}개의 점수를 계산했습니다.")
+        )
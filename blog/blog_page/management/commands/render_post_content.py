@@ -0,0 +1,106 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog_page.feeds import invalidate_feeds
+from blog_page.models import CONTENT_STAT_FIELDS, Post
+from blog_page.page_cache import invalidate_pages
+from blog_page.rendering import content_hash, render_fields
+
+
+class Command(BaseCommand):
+    """
+    게시물 본문을 다시 렌더링(rendering.py)해 content_html, 목차, 요약 등을 저장하는 관리 명령입니다.
+
+    기본으로는 본문이나 RENDER_VERSION 이 저장된 렌더링 결과와 다른 게시물만 렌더링합니다.
+    렌더링은 DB 를 쓰지 않는 순수 파이썬 작업이므로 여러 프로세스에 나눠 실행하고,
+    DB 읽기와 bulk_update 는 이 프로세스에서만 합니다.
+
+    사용 예:
+        python manage.py render_post_content --processes 4 --chunk-size 500
+        python manage.py render_post_content --force
+    """
+
+    help = "게시물 본문을 여러 프로세스에서 다시 렌더링합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="한 번에 읽고 저장할 게시물 수 (기본값: 500)",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="렌더링할 프로세스 수, 1 이면 이 프로세스에서 렌더링 (기본값: CPU 수)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="렌더링 결과가 최신인 게시물도 다시 렌더링합니다.",
+        )
+
+    def handle(self, *args, **options):
+        processes = max(1, options["processes"])
+        if processes == 1:
+            self.render_all(map, options)
+            return
+        # 작업 프로세스에서도 요약 계산(번역 등)에 쓰는 설정을 불러옵니다.
+        with ProcessPoolExecutor(processes, initializer=django.setup) as pool:
+            self.render_all(
+                lambda function, contents: pool.map(
+                    function, contents, chunksize=max(1, len(contents) // processes)
+                ),
+                options,
+            )
+
+    def render_all(self, render_map, options):
+        """
+        pk 순서로 게시물을 읽어 오래된 렌더링 결과만 render_map 으로 다시 렌더링해 저장합니다.
+
+        Args:
+            render_map (callable): map 과 같은 형태로 본문 목록을 렌더링하는 함수
+            options (dict): 명령 옵션
+        """
+        chunk_size = options["chunk_size"]
+        last_pk = 0
+        checked = rendered = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "content", "content_hash")[:chunk_size]
+            )
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+            checked += len(posts)
+            stale = [
+                post
+                for post in posts
+                if options["force"] or post.content_hash != content_hash(post.content)
+            ]
+            if not stale:
+                continue
+            results = render_map(render_fields, [post.content for post in stale])
+            for post, fields in zip(stale, results):
+                for field, value in fields.items():
+                    setattr(post, field, value)
+            with transaction.atomic():
+                Post.objects.bulk_update(stale, CONTENT_STAT_FIELDS)
+            # 시그널을 거치지 않으므로 캐시된 페이지와 피드 항목을 직접 무효화합니다.
+            pks = [post.pk for post in stale]
+            invalidate_pages(*pks)
+            invalidate_feeds(post_ids=pks, site=True)
+            rendered += len(stale)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"게시물 {checked}개 중 {rendered}개를 다시 렌더링했습니다."
+            )
+        )
@@ -0,0 +1,69 @@
+import sqlite3
+import time
+from contextlib import closing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 복제본 파일의 잠금을 기다리는 시간(초)
+BUSY_TIMEOUT = 20
+
+
+class Command(BaseCommand):
+    """
+    주 SQLite DB 를 읽기 복제본 파일로 복사하는 관리 명령입니다.
+
+    SQLite 온라인 백업 API 를 사용하므로 사이트가 동작하는 중에도 일관된 사본이 만들어지고,
+    WAL 모드에서는 복사하는 동안에도 주 DB 의 쓰기가 막히지 않습니다.
+    --interval 을 주면 그 간격으로 계속 복사해 복제 지연이 있는 복제본을 흉내 냅니다.
+    PostgreSQL 등에서는 데이터베이스의 복제 기능을 사용하고 이 명령은 쓰지 않습니다.
+
+    사용 예:
+        REPLICA_DB_NAME=db.replica.sqlite3 python manage.py sync_replica
+        python manage.py sync_replica --target db.replica.sqlite3 --interval 2
+    """
+
+    help = "주 SQLite DB 를 읽기 복제본 파일로 복사합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            help="복제본 파일 경로 (기본값: REPLICA_DATABASE 의 NAME)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="이 간격(초)마다 계속 복사합니다. (Ctrl+C 로 멈춤)",
+        )
+
+    def handle(self, *args, **options):
+        source = connections[DEFAULT_DB_ALIAS].settings_dict
+        if source["ENGINE"] != "django.db.backends.sqlite3":
+            raise CommandError("SQLite 주 DB 에서만 사용할 수 있습니다.")
+        target = options["target"]
+        if target is None:
+            alias = getattr(settings, "REPLICA_DATABASE", None)
+            if alias is None:
+                raise CommandError(
+                    "--target 을 주거나 REPLICA_DB_NAME 환경 변수를 설정하세요."
+                )
+            target = connections[alias].settings_dict["NAME"]
+
+        while True:
+            started = time.perf_counter()
+            self.copy(str(source["NAME"]), str(target))
+            self.stdout.write(
+                f"{target} 에 복사했습니다. ({time.perf_counter() - started:.2f}s)"
+            )
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    def copy(self, source, target):
+        """source DB 의 현재 상태를 target 파일로 복사합니다."""
+        # 테스트 DB 처럼 URI(file:...) 로 된 이름도 열 수 있게 합니다.
+        with closing(sqlite3.connect(source, uri=source.startswith("file:"))) as src:
+            # 복제본을 읽는 연결이 있으면 잠금이 풀릴 때까지 기다립니다.
+            with closing(sqlite3.connect(target, timeout=BUSY_TIMEOUT)) as dst:
+                src.backup(dst)
@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog_page.recommend import (
+    BATCH_SIZE,
+    TOP_K,
+    rebuild_related_posts,
+    update_related_posts,
+)
+
+
+class Command(BaseCommand):
+    """
+    TF-IDF 유사도로 게시물의 관련 게시물(related_posts)을 채우는 관리 명령입니다.
+
+    관리자가 직접 지정한 관련 게시물은 그대로 두고 자동 추천 항목만 교체합니다.
+
+    사용 예:
+        python manage.py update_related_posts
+        python manage.py update_related_posts --post 12 --post 15
+    """
+
+    help = "게시물의 관련 게시물을 TF-IDF 유사도로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--post",
+            type=int,
+            action="append",
+            dest="posts",
+            help="이 게시물이 바뀐 것으로 보고 영향받는 추천만 갱신합니다. (여러 번 지정 가능)",
+        )
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=TOP_K,
+            help=f"게시물당 추천 수 (기본값: {TOP_K})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"한 번의 행렬 곱으로 계산할 게시물 수 (기본값: {BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options["posts"]:
+            count = sum(
+                update_related_posts(post_id, k=options["top_k"])
+                for post_id in options["posts"]
+            )
+        else:
+            count = rebuild_related_posts(
+                k=options["top_k"], batch_size=options["batch_size"]
+            )
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"게시물 {count}개의 관련 게시물을 갱신했습니다. ({elapsed:.2f}초)"
+            )
+        )
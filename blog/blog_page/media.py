@@ -0,0 +1,207 @@
+import hashlib
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date
+from django.views.decorators.http import require_safe
+
+from .storage import blob_storage, is_blob
+
+# 내용 해시 경로(blobs/)의 파일은 내용이 바뀌지 않으므로 1년 동안 재검증 없이 캐시합니다.
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+# 이전 날짜별 경로의 파일은 같은 경로에 다른 내용이 올 수 있어 짧게 캐시하고 재검증합니다.
+MUTABLE_MAX_AGE = 60 * 60
+
+# 브라우저에서 바로 열어도 되는 형식 (그 밖의 형식은 다운로드로 내려보냅니다)
+INLINE_TYPES = ("image/", "video/", "audio/", "application/pdf")
+# 스크립트를 실행할 수 있어 이미지라도 다운로드로 내려보내는 형식
+UNSAFE_TYPES = ("image/svg+xml",)
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _RangeNotSatisfiable(Exception):
+    """요청한 범위가 파일 크기를 벗어났을 때 발생하는 예외입니다."""
+
+
+def _parse_range(header, size):
+    """
+    Range 헤더를 해석합니다.
+
+    여러 범위를 요청하면 파일 전체를 보내도 되므로(RFC 9110) 단일 범위만 처리합니다.
+
+    Args:
+        header (str): Range 헤더 값
+        size (int): 파일 크기
+
+    Returns:
+        tuple or None: (시작, 끝) 바이트 위치(끝 포함), 처리하지 않으면 None
+
+    Raises:
+        _RangeNotSatisfiable: 범위가 파일 밖에 있는 경우
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if last and int(last) < start:
+            return None
+    else:
+        # bytes=-500 은 마지막 500 바이트입니다.
+        start, end = max(0, size - int(last)), size - 1
+        if int(last) == 0:
+            raise _RangeNotSatisfiable
+    if start >= size:
+        raise _RangeNotSatisfiable
+    return start, end
+
+
+def _read_range(path, start, length):
+    """파일의 start 부터 length 바이트를 CHUNK_SIZE 씩 읽어 돌려줍니다."""
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _validators(name, stat):
+    """파일의 ETag 와 Last-Modified 값을 만듭니다."""
+    if is_blob(name):
+        # 경로에 내용 해시가 들어 있으므로 경로 자체가 강한 검증자입니다.
+        tag = hashlib.md5(name.encode()).hexdigest()
+    else:
+        tag = f"{int(stat.st_mtime):x}-{stat.st_size:x}"
+    return f'"{tag}"', int(stat.st_mtime)
+
+
+def _sendfile(response, name, path):
+    """MEDIA_SENDFILE 설정에 따라 파일 전송을 앞단 프록시(Apache, nginx)에 넘깁니다."""
+    backend = getattr(settings, "MEDIA_SENDFILE", None)
+    if backend == "x-sendfile":
+        response["X-Sendfile"] = path
+    elif backend == "x-accel-redirect":
+        prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+        response["X-Accel-Redirect"] = prefix + quote(name)
+    else:
+        return False
+    return True
+
+
+def serve_file(request, name, filename=None):
+    """
+    미디어 파일 하나를 응답합니다.
+
+    - ETag/Last-Modified 로 조건부 요청에 304 를 돌려줍니다.
+    - Range 요청에 206 (부분 응답)으로 답해 이어받기와 동영상 탐색을 지원합니다.
+    - MEDIA_SENDFILE 이 설정되어 있으면 본문은 앞단 프록시가 보내도록
+      X-Sendfile / X-Accel-Redirect 헤더만 붙여 돌려줍니다. (Range 도 프록시가 처리)
+    - 내용 해시 경로의 블롭(is_blob)만 immutable 로 오래 캐시합니다.
+
+    Args:
+        request (HttpRequest): 요청 객체
+        name (str): MEDIA_ROOT 기준 파일 경로
+        filename (str, optional): 다운로드 시 사용할 파일 이름 (주면 항상 첨부로 내려보냄)
+
+    Returns:
+        HttpResponse: 파일 응답
+
+    Raises:
+        Http404: 파일이 없거나 잘못된 경로인 경우
+    """
+    if any(part.startswith(".") for part in name.split("/")):
+        raise Http404("파일을 찾을 수 없습니다.")
+    try:
+        path = blob_storage().path(name)
+        stat = os.stat(path)
+    except (SuspiciousFileOperation, OSError):
+        raise Http404("파일을 찾을 수 없습니다.")
+    if not os.path.isfile(path):
+        raise Http404("파일을 찾을 수 없습니다.")
+
+    etag, last_modified = _validators(name, stat)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _file_response(request, name, path, stat.st_size, etag)
+
+    content_type, encoding = mimetypes.guess_type(name)
+    if encoding or not content_type:
+        content_type = "application/octet-stream"
+    if response.status_code in (200, 206):
+        response["Content-Type"] = content_type
+        inline = (
+            content_type.startswith(INLINE_TYPES) and content_type not in UNSAFE_TYPES
+        )
+        if filename or not inline:
+            response["Content-Disposition"] = content_disposition_header(
+                True, filename or os.path.basename(name)
+            )
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    # blobs/ 아래라도 파생 이미지(*.640w.webp 등)는 다시 만들면 내용이 바뀔 수 있습니다.
+    if is_blob(name):
+        patch_cache_control(
+            response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True
+        )
+    else:
+        patch_cache_control(response, public=True, max_age=MUTABLE_MAX_AGE)
+    return response
+
+
+def _file_response(request, name, path, size, etag):
+    """전체 또는 부분(Range) 파일 응답을 만듭니다."""
+    response = HttpResponse()
+    if _sendfile(response, name, path):
+        return response
+
+    header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    # If-Range 가 현재 검증자와 다르면 파일이 바뀐 것이므로 전체를 보냅니다.
+    if header and (if_range is None or if_range == etag):
+        try:
+            byte_range = _parse_range(header, size)
+        except _RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _read_range(path, start, end - start + 1), status=206
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(end - start + 1)
+            return response
+
+    # WSGI 서버가 지원하면 wsgi.file_wrapper(sendfile)로 전송됩니다.
+    return FileResponse(open(path, "rb"))
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    MEDIA_URL 아래의 업로드 파일을 응답하는 뷰입니다. (serve_file 참고)
+
+    Args:
+        request (HttpRequest): 요청 객체
+        path (str): MEDIA_ROOT 기준 파일 경로
+
+    Returns:
+        HttpResponse: 파일 응답
+    """
+    return serve_file(request, path)
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:22
+
+from django.db import migrations, models
+
+
+def fill_comment_paths(apps, schema_editor):
+    """
+    기존 댓글의 경로(path)와 깊이(depth)를 부모 관계로부터 계산합니다.
+
+    최상위 댓글부터 한 깊이씩 내려가며 그 깊이의 댓글을 bulk_update 로 한 번에 저장합니다.
+    """
+    Comment = apps.get_model('blog_page', 'Comment')
+    width = 10
+    children = {}
+    for comment_id, parent_id in Comment.objects.values_list('id', 'parent_id'):
+        children.setdefault(parent_id, []).append(comment_id)
+
+    # 부모 ID -> 자식 경로의 앞부분 (최상위 댓글의 부모는 None)
+    prefixes = {None: ''}
+    depth = 0
+    while prefixes:
+        level = [
+            Comment(
+                id=comment_id,
+                path=prefix + str(comment_id).zfill(width),
+                depth=depth,
+            )
+            for parent_id, prefix in prefixes.items()
+            for comment_id in children.get(parent_id, ())
+        ]
+        Comment.objects.bulk_update(level, ['path', 'depth'], batch_size=500)
+        prefixes = {comment.id: f'{comment.path}/' for comment in level}
+        depth += 1
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0008_tag_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='path',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(fill_comment_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'path'], name='blog_page_c_post_id_b3314a_idx'),
+        ),
+    ]
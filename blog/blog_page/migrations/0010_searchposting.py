@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0009_comment_path_depth'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=50)),
+                ('weight', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='blog_page.post')),
+            ],
+            options={
+                'unique_together': {('term', 'post')},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:32
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_post_counters(apps, schema_editor):
+    """기존 좋아요/북마크/댓글 수로 게시물 카운터를 채웁니다."""
+    Post = apps.get_model('blog_page', 'Post')
+    for related, field in (('Like', 'likes_count'), ('Bookmark', 'bookmarks_count'), ('Comment', 'comments_count')):
+        Model = apps.get_model('blog_page', related)
+        counts = (
+            Model.objects.filter(post=models.OuterRef('pk'))
+            .values('post')
+            .annotate(count=models.Count('pk'))
+            .values('count')
+        )
+        Post.objects.update(**{field: Coalesce(models.Subquery(counts), 0)})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0010_searchposting'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='bookmarks_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_post_counters, migrations.RunPython.noop),
+    ]
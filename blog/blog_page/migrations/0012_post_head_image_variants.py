@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0011_post_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='head_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0013_post_content_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='blog_page.post')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog_page.post')),
+            ],
+            options={
+                'unique_together': {('post', 'related')},
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:20
+
+import blog_page.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0014_postrecommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('references', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='file_upload',
+            field=models.FileField(blank=True, storage=blog_page.storage.blob_storage, upload_to='blog/files/%Y/%m/%d/'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='head_image',
+            field=models.ImageField(blank=True, storage=blog_page.storage.blob_storage, upload_to='blog/images/%Y/%m/%d/'),
+        ),
+    ]
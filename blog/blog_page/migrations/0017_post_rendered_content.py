@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0016_post_trending_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_toc',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0017_post_rendered_content'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostViewBuffer',
+            fields=[
+                ('post_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('views', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:36
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_search_terms(apps, schema_editor):
+    """기존 색인 항목으로 토큰별 문서 빈도를 계산합니다."""
+    SearchPosting = apps.get_model('blog_page', 'SearchPosting')
+    SearchTerm = apps.get_model('blog_page', 'SearchTerm')
+    rows = (
+        SearchPosting.objects.values('term')
+        .annotate(df=Count('post'))
+        .values_list('term', 'df')
+    )
+    SearchTerm.objects.bulk_create(
+        (SearchTerm(term=term, df=df) for term, df in rows.iterator()),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0018_post_view_buffer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('term', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('df', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchposting',
+            index=models.Index(fields=['term', 'weight', 'post'], name='searchposting_rank_idx'),
+        ),
+        migrations.RunPython(fill_search_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0019_search_term'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationNorm',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='recommendation_norm', serialize=False, to='blog_page.post')),
+                ('norm', models.FloatField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog_page', '0020_recommendation_norm'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='path',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -1,8 +1,65 @@
-from django.db import models
+import os
+
+from django.db import models, transaction
 from accounts.models import CustomUser
 from django.utils.text import slugify
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from .images import VARIANT_GROUPS
+from .rendering import content_hash, render_fields
+from .storage import blob_storage
+
+# 본문에서 계산되어 함께 저장되는 필드 (렌더링된 본문과 목차, 그 HTML 로 계산한 요약 등)
+CONTENT_STAT_FIELDS = (
+    "content_html",
+    "content_toc",
+    "content_hash",
+    "excerpt",
+    "word_count",
+    "reading_time",
+)
+
+# 내용 주소 스토리지(storage.py)에 저장되는 파일 필드
+BLOB_FIELDS = ("head_image", "file_upload")
+
+
+class PostQuerySet(models.QuerySet):
+    """Post 모델의 쿼리셋 클래스입니다."""
+
+    def with_user_state(self, user):
+        """
+        사용자별 좋아요/북마크 여부를 is_liked, is_bookmarked 로 주석 처리합니다.
+
+        EXISTS 서브쿼리를 사용하므로 게시물 수와 관계없이 목록 쿼리 한 번으로 해결됩니다.
+
+        Args:
+            user (CustomUser): 현재 사용자 (익명 사용자면 모두 False)
+
+        Returns:
+            QuerySet: is_liked, is_bookmarked 가 추가된 쿼리셋
+        """
+        if not user.is_authenticated:
+            return self.annotate(
+                is_liked=models.Value(False), is_bookmarked=models.Value(False)
+            )
+        return self.annotate(
+            is_liked=models.Exists(
+                Like.objects.filter(post=models.OuterRef("pk"), user=user)
+            ),
+            is_bookmarked=models.Exists(
+                Bookmark.objects.filter(post=models.OuterRef("pk"), user=user)
+            ),
+        )
+
+    def for_listing(self):
+        """
+        목록 화면용으로 본문(content)과 렌더링된 본문을 불러오지 않는 쿼리셋을 반환합니다.
+        목록에서는 미리 계산된 excerpt 를 사용합니다.
+
+        Returns:
+            QuerySet: 본문 필드가 지연 로딩되는 쿼리셋
+        """
+        return self.defer("content", "content_html", "content_toc")
 
 
 class Post(models.Model):
@@ -11,9 +68,17 @@ class Post(models.Model):
 
     Attributes:
         title (str): 게시물 제목
-        content (str): 게시물 내용
-        head_image (ImageField): 게시물 대표 이미지
-        file_upload (FileField): 첨부 파일
+        content (str): 게시물 내용 (작성자가 입력한 HTML)
+        content_html (str): 정리하고 제목 앵커를 붙인 본문 HTML (rendering.py, 저장 시 계산)
+        content_toc (list): 본문 제목으로 만든 목차 (저장 시 계산)
+        content_hash (str): content_html 을 만든 본문과 파이프라인 버전의 해시
+        excerpt (str): 렌더링된 본문 앞부분의 HTML 요약 (저장 시 계산)
+        word_count (int): 본문 단어 수 (저장 시 계산)
+        reading_time (int): 예상 읽기 시간(분) (저장 시 계산)
+        head_image (ImageField): 게시물 대표 이미지 (storage.py 의 내용 주소 블롭)
+        head_image_variants (dict): 대표 이미지의 크기별 파생 이미지 정보 (images.py)
+        file_upload (FileField): 첨부 파일 (storage.py 의 내용 주소 블롭)
+        file_name (str): 첨부 파일의 원래 이름 (블롭 경로에는 해시만 남으므로 따로 저장)
         created_at (datetime): 게시물 생성 시간
         updated_at (date): 게시물 최종 수정 일자
         related_posts (ManyToManyField): 관련 게시물들
@@ -22,12 +87,28 @@ class Post(models.Model):
         category (ForeignKey): 게시물 카테고리
         tags (ManyToManyField): 게시물 태그들
         views_count (int): 조회수
+        likes_count (int): 좋아요 수 (Like 생성/삭제 시 갱신)
+        bookmarks_count (int): 북마크 수 (Bookmark 생성/삭제 시 갱신)
+        comments_count (int): 댓글 수 (Comment 생성/삭제 시 갱신)
+        trending_score (float): 시간 감쇠 인기 점수 (trending.py, 이벤트마다 갱신)
     """
 
     title = models.CharField(max_length=100)
     content = models.TextField()
-    head_image = models.ImageField(upload_to="blog/images/%Y/%m/%d/", blank=True)
-    file_upload = models.FileField(upload_to="blog/files/%Y/%m/%d/", blank=True)
+    content_html = models.TextField(blank=True, editable=False)
+    content_toc = models.JSONField(default=list, blank=True, editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    excerpt = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)
+    head_image = models.ImageField(
+        upload_to="blog/images/%Y/%m/%d/", storage=blob_storage, blank=True
+    )
+    head_image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    file_upload = models.FileField(
+        upload_to="blog/files/%Y/%m/%d/", storage=blob_storage, blank=True
+    )
+    file_name = models.CharField(max_length=255, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateField(auto_now=True)
     related_posts = models.ManyToManyField("self", blank=True, symmetrical=False)
@@ -43,26 +124,140 @@ class Post(models.Model):
     )
     tags = models.ManyToManyField("Tag", blank=True)
     views_count = models.PositiveIntegerField(default=0)
+    likes_count = models.PositiveIntegerField(default=0, editable=False)
+    bookmarks_count = models.PositiveIntegerField(default=0, editable=False)
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    trending_score = models.FloatField(default=0.0, editable=False)
+
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 인기 게시물 상위 N 개를 정렬 없이 읽기 위한 인덱스 (trending.py)
+            models.Index(
+                fields=["status", "-trending_score", "-id"],
+                name="post_trending_idx",
+            ),
+        ]
 
     def __str__(self):
         """게시물의 문자열 표현을 반환합니다."""
         return f"[{self.pk}]{self.title} :: {self.author}"
 
+    def save(self, *args, **kwargs):
+        """
+        본문이 저장될 때 본문을 렌더링하고 요약, 단어 수, 읽기 시간을 다시 계산해 함께 저장합니다.
+        본문이 지연 로딩된 상태이거나 update_fields 에 본문이 없으면 계산하지 않습니다.
+        새 첨부 파일이 올라오면 블롭 경로로 바뀌기 전에 원래 파일 이름을 기록합니다.
+        """
+        update_fields = kwargs.get("update_fields")
+        if "file_upload" not in self.get_deferred_fields():
+            if self.file_upload and not self.file_upload._committed:
+                self.file_name = os.path.basename(self.file_upload.name)
+            elif not self.file_upload:
+                self.file_name = ""
+            if update_fields is not None and "file_upload" in update_fields:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "file_name"}
+        if "content" not in self.get_deferred_fields() and (
+            update_fields is None or "content" in update_fields
+        ):
+            self.update_content_stats()
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *kwargs["update_fields"],
+                    *CONTENT_STAT_FIELDS,
+                }
+        super().save(*args, **kwargs)
+
+    def update_content_stats(self):
+        """
+        본문을 렌더링(rendering.py)하고, 렌더링된 HTML 로 excerpt, word_count,
+        reading_time 을 계산해 설정합니다.
+        """
+        for field, value in render_fields(self.content).items():
+            setattr(self, field, value)
+
+    def _ensure_rendered(self):
+        """
+        본문이나 렌더링 파이프라인 버전이 저장된 렌더링 결과와 다르면 지금 렌더링해 저장합니다.
+
+        save() 를 거치지 않고 바뀐 본문(QuerySet.update, 가져오기 등)이나 RENDER_VERSION 을
+        올린 뒤 아직 render_post_content 를 실행하지 않은 게시물을 처음 보여줄 때 한 번만
+        렌더링합니다.
+        """
+        if self.content_hash == content_hash(self.content):
+            return
+        self.update_content_stats()
+        Post.objects.filter(pk=self.pk).update(
+            **{field: getattr(self, field) for field in CONTENT_STAT_FIELDS}
+        )
+
+    @property
+    def rendered_content(self):
+        """정리하고 제목 앵커를 붙인 본문 HTML 을 반환합니다."""
+        self._ensure_rendered()
+        return self.content_html
+
+    @property
+    def table_of_contents(self):
+        """본문 제목으로 만든 목차({"level", "id", "title"} 목록)를 반환합니다."""
+        self._ensure_rendered()
+        return self.content_toc
+
     def get_absolute_url(self):
         """게시물의 절대 URL을 반환합니다."""
         return f"/blog/{self.pk}/"
 
     def get_file_name(self):
         """첨부 파일의 이름을 반환합니다."""
-        return self.file_upload.name.split("/")[-1]
+        return self.file_name or self.file_upload.name.split("/")[-1]
 
     def get_file_ext(self):
         """첨부 파일의 확장자를 반환합니다."""
         return self.get_file_name().split(".")[-1]
 
+    def get_head_image_srcset(self, group="list", image_format="webp"):
+        """
+        대표 이미지의 srcset 속성 값을 반환합니다.
+
+        Args:
+            group (str): 파생 이미지 묶음 이름 ("list" 또는 "detail")
+            image_format (str): "webp" 또는 "fallback"(JPEG/PNG)
+
+        Returns:
+            str: "URL 400w, URL 800w" 형식의 문자열 (파생 이미지가 없으면 빈 문자열)
+        """
+        labels, _ = VARIANT_GROUPS[group]
+        entries = []
+        for label in labels:
+            entry = self.head_image_variants.get(label)
+            if entry and entry not in entries:
+                entries.append(entry)
+        return ", ".join(
+            f"{self.head_image.storage.url(entry[image_format])} {entry['width']}w"
+            for entry in entries
+        )
+
+    def get_head_image_src(self, group="list"):
+        """
+        대표 이미지의 기본 src URL을 반환합니다.
+        파생 이미지가 아직 없으면 원본 URL을 반환합니다.
+
+        Args:
+            group (str): 파생 이미지 묶음 이름 ("list" 또는 "detail")
+
+        Returns:
+            str: 이미지 URL
+        """
+        labels, _ = VARIANT_GROUPS[group]
+        entry = self.head_image_variants.get(labels[0])
+        if entry:
+            return self.head_image.storage.url(entry["fallback"])
+        return self.head_image.url
+
     def total_likes(self):
         """게시물의 총 좋아요 수를 반환합니다."""
-        return self.like_set.count()
+        return self.likes_count
 
     def is_liked_by(self, user):
         """
@@ -134,9 +329,51 @@ class Tag(models.Model):
         태그를 저장할 때 슬러그를 자동으로 생성합니다.
         """
         if not self.slug:
-            self.slug = slugify(self.name, allow_unicode=True)
+            self.slug = self.make_slug(self.name)
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def make_slug(name):
+        """태그 이름으로 슬러그를 만듭니다."""
+        return slugify(name, allow_unicode=True)
+
+    @classmethod
+    def get_or_create_many(cls, names):
+        """
+        여러 태그를 한 번에 가져오고, 없는 태그는 bulk_create 로 만듭니다.
+
+        이름이 달라도 슬러그가 같은 태그(예: "Django" 와 "django")는 기존 태그를 사용합니다.
+
+        Args:
+            names (list): 태그 이름 리스트
+
+        Returns:
+            list: names 순서(중복 제거)대로 정렬된 Tag 리스트
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        by_name = {tag.name: tag for tag in cls.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in by_name]
+        if missing:
+            slugs = {name: cls.make_slug(name) for name in missing}
+            # 동시에 같은 태그를 만드는 요청이 있어도 충돌 없이 넘어가도록 합니다.
+            cls.objects.bulk_create(
+                [cls(name=name, slug=slugs[name]) for name in missing],
+                ignore_conflicts=True,
+            )
+            created = cls.objects.filter(
+                models.Q(name__in=missing) | models.Q(slug__in=slugs.values())
+            )
+            by_slug = {}
+            for tag in created:
+                by_name.setdefault(tag.name, tag)
+                by_slug[tag.slug] = tag
+            for name in missing:
+                if name not in by_name:
+                    by_name[name] = by_slug[slugs[name]]
+        return [by_name[name] for name in names]
+
     def __str__(self):
         """태그의 문자열 표현을 반환합니다."""
         return self.name
@@ -157,8 +394,13 @@ class Comment(models.Model):
         created_at (datetime): 생성 시간
         updated_at (datetime): 최종 수정 시간
         parent (ForeignKey): 부모 댓글 (대댓글인 경우)
+        path (str): 루트 댓글부터 자신까지의 ID 경로 (예: "0000000012/0000000034")
+        depth (int): 댓글 깊이 (최상위 댓글은 0)
     """
 
+    PATH_STEP_WIDTH = 10
+    PATH_SEPARATOR = "/"
+
     post = models.ForeignKey(Post, on_delete=models.CASCADE)
     author = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     content = models.TextField()
@@ -167,6 +409,31 @@ class Comment(models.Model):
     parent = models.ForeignKey(
         "self", null=True, blank=True, related_name="replies", on_delete=models.CASCADE
     )
+    # 단계마다 PATH_STEP_WIDTH + 1 글자씩 늘어나므로 깊이에 제한이 없도록 길이 제한을 두지 않습니다.
+    path = models.TextField(blank=True, editable=False)
+    depth = models.PositiveIntegerField(default=0, editable=False)
+
+    def save(self, *args, **kwargs):
+        """
+        댓글을 저장하고, 새 댓글이면 경로(path)와 깊이(depth)를 기록합니다.
+
+        경로는 ID가 정해진 뒤에야 만들 수 있으므로 처음 저장한 직후 한 번 더 갱신합니다.
+        두 쿼리는 한 트랜잭션으로 묶여 경로 없는 댓글이 남지 않습니다.
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not self.path:
+                step = str(self.pk).zfill(self.PATH_STEP_WIDTH)
+                if self.parent_id:
+                    parent = self.parent
+                    self.path = f"{parent.path}{self.PATH_SEPARATOR}{step}"
+                    self.depth = parent.depth + 1
+                else:
+                    self.path = step
+                    self.depth = 0
+                Comment.objects.filter(pk=self.pk).update(
+                    path=self.path, depth=self.depth
+                )
 
     def __str__(self):
         """댓글의 문자열 표현을 반환합니다."""
@@ -174,10 +441,23 @@ class Comment(models.Model):
 
     def get_absolute_url(self):
         """댓글의 절대 URL을 반환합니다."""
-        return f"/blog/{self.post.pk}/#comment-{self.pk}"
+        return f"/blog/{self.post_id}/#comment-{self.pk}"
+
+    def get_descendants(self):
+        """
+        이 댓글의 모든 하위 댓글을 트리 순서대로 반환합니다.
+
+        Returns:
+            QuerySet: 경로 순으로 정렬된 하위 댓글 쿼리셋
+        """
+        return Comment.objects.filter(
+            post_id=self.post_id,
+            path__startswith=f"{self.path}{self.PATH_SEPARATOR}",
+        ).order_by("path")
 
     class Meta:
         ordering = ["-id"]
+        indexes = [models.Index(fields=["post", "path"])]
 
 
 class Like(models.Model):
@@ -218,3 +498,151 @@ class Bookmark(models.Model):
     def __str__(self):
         """북마크의 문자열 표현을 반환합니다."""
         return f"{self.user.username} bookmarked {self.post.title}"
+
+
+class SearchPosting(models.Model):
+    """
+    검색용 역색인(inverted index)의 한 항목을 나타내는 모델 클래스입니다.
+
+    게시물의 제목, 본문, 태그 이름을 토큰으로 나눈 뒤 (토큰, 게시물) 쌍마다
+    필드 가중치를 반영한 출현 점수를 저장합니다.
+
+    Attributes:
+        term (str): 색인 토큰
+        post (ForeignKey): 토큰이 나타난 게시물
+        weight (int): 필드 가중치를 곱한 토큰 출현 횟수
+    """
+
+    term = models.CharField(max_length=50)
+    post = models.ForeignKey("Post", on_delete=models.CASCADE)
+    weight = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("term", "post")
+        indexes = [
+            # 토큰 하나로 검색할 때 가중치 순으로 색인만 읽고 LIMIT 에서 멈추기 위한 색인
+            models.Index(
+                fields=["term", "weight", "post"], name="searchposting_rank_idx"
+            ),
+        ]
+
+    def __str__(self):
+        """색인 항목의 문자열 표현을 반환합니다."""
+        return f"{self.term} -> {self.post_id} ({self.weight})"
+
+
+class SearchTerm(models.Model):
+    """
+    검색 토큰별 문서 빈도(df)를 미리 계산해 두는 모델 클래스입니다.
+
+    검색할 때 IDF 계산과 가장 드문 토큰 고르기, 영문 접두어 확장에 쓰며
+    색인 항목이 바뀔 때 search.py 가 함께 고칩니다.
+
+    Attributes:
+        term (str): 색인 토큰
+        df (int): 토큰이 나타난 게시물 수
+    """
+
+    term = models.CharField(max_length=50, primary_key=True)
+    df = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """토큰의 문자열 표현을 반환합니다."""
+        return f"{self.term} ({self.df})"
+
+
+class PostRecommendation(models.Model):
+    """
+    추천 엔진(recommend.py)이 related_posts 에 자동으로 추가한 관련 게시물을 기록하는 모델 클래스입니다.
+
+    이 모델에 없는 related_posts 항목은 관리자가 직접 지정한 것으로 보고 건드리지 않습니다.
+
+    Attributes:
+        post (ForeignKey): 추천을 받는 게시물
+        related (ForeignKey): 추천된 게시물
+        score (float): TF-IDF 코사인 유사도
+    """
+
+    post = models.ForeignKey(
+        "Post", on_delete=models.CASCADE, related_name="recommendations"
+    )
+    related = models.ForeignKey("Post", on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("post", "related")
+
+    def __str__(self):
+        """추천 항목의 문자열 표현을 반환합니다."""
+        return f"{self.post_id} -> {self.related_id} ({self.score:.3f})"
+
+
+class RecommendationNorm(models.Model):
+    """
+    추천 엔진(recommend.py)이 계산한 게시물 TF-IDF 벡터의 크기(L2 노름)를 저장하는 모델 클래스입니다.
+
+    게시물 몇 개의 추천만 다시 계산할 때 후보 게시물의 벡터를 모두 읽지 않고
+    내적만 구해 이 값으로 나눕니다. 게시물의 추천을 다시 계산하거나
+    전체를 다시 계산할 때 갱신됩니다.
+
+    Attributes:
+        post (OneToOneField): 게시물
+        norm (float): 정규화 전 TF-IDF 벡터의 L2 노름
+    """
+
+    post = models.OneToOneField(
+        "Post",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="recommendation_norm",
+    )
+    norm = models.FloatField()
+
+    def __str__(self):
+        """노름의 문자열 표현을 반환합니다."""
+        return f"{self.post_id}: {self.norm:.3f}"
+
+
+class Blob(models.Model):
+    """
+    내용 주소 스토리지(storage.py)에 저장된 파일 하나와 그 참조 수를 나타내는 모델 클래스입니다.
+
+    게시물의 첨부 파일/대표 이미지가 블롭을 가리키게 되면 참조 수가 늘고,
+    바뀌거나 게시물이 삭제되면 줄어듭니다. 참조 수가 0이 된 블롭은 파일과 함께 지워집니다.
+
+    Attributes:
+        name (str): 스토리지 상의 경로 (blobs/ab/cd/<sha256><확장자>)
+        size (int): 파일 크기(바이트)
+        references (int): 이 블롭을 가리키는 게시물 필드 수
+        created_at (datetime): 처음 참조된 시간
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveBigIntegerField(default=0)
+    references = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        """블롭의 문자열 표현을 반환합니다."""
+        return f"{self.name} ({self.references})"
+
+
+class PostViewBuffer(models.Model):
+    """
+    아직 Post.views_count 에 반영되지 않은 조회수를 모든 프로세스가 함께 쓰는 버퍼 모델 클래스입니다.
+
+    각 프로세스는 조회수를 메모리에 모았다가 일정 주기로 이 테이블에 더하고(counters.py),
+    flush 가 이 테이블의 조회수를 게시물에 반영한 뒤 행을 지웁니다.
+    게시물이 지워져도 반영만 건너뛰면 되므로 외래 키를 두지 않습니다.
+
+    Attributes:
+        post_id (int): 게시물의 기본 키
+        views (int): 반영 대기 중인 조회수
+    """
+
+    post_id = models.BigIntegerField(primary_key=True)
+    views = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """버퍼 항목의 문자열 표현을 반환합니다."""
+        return f"{self.post_id}: +{self.views}"
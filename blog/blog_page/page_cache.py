@@ -0,0 +1,152 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+from .replicas import hold_primary
+
+# 페이지 캐시 버전(마지막 변경 시각) 키
+SITE_VERSION_KEY = "page_cache:site"  # 사이드바, 카테고리, 태그
+LIST_VERSION_KEY = "page_cache:list"  # 게시물 목록
+POST_VERSION_KEY = "page_cache:post:{pk}"  # 게시물 상세
+PAGE_KEY = "page_cache:page:{digest}"
+
+
+def _version(key):
+    """키에 기록된 마지막 변경 시각을 반환합니다. 없으면 지금 시각으로 초기화합니다."""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time(), None)
+        version = cache.get(key, time.time())
+    return version
+
+
+def page_version(post_id=None):
+    """
+    페이지의 마지막 변경 시각을 반환합니다.
+
+    Args:
+        post_id (int, optional): 게시물 상세 페이지면 게시물의 기본 키, 목록 페이지면 None
+
+    Returns:
+        float: 페이지 내용에 영향을 주는 마지막 변경 시각 (UNIX 타임스탬프)
+    """
+    scope = LIST_VERSION_KEY if post_id is None else POST_VERSION_KEY.format(pk=post_id)
+    return max(_version(SITE_VERSION_KEY), _version(scope))
+
+
+def invalidate_pages(*post_ids, site=False):
+    """
+    캐시된 페이지를 무효화합니다. 버전만 바꾸므로 이전 페이지는 만료 시 사라집니다.
+
+    Args:
+        *post_ids (int): 바뀐 게시물의 기본 키 (목록 페이지도 함께 무효화)
+        site (bool): 모든 페이지에 들어가는 사이드바/카테고리/태그가 바뀐 경우 True
+    """
+    now = time.time()
+    versions = {POST_VERSION_KEY.format(pk=pk): now for pk in post_ids}
+    if post_ids:
+        versions[LIST_VERSION_KEY] = now
+    if site:
+        versions[SITE_VERSION_KEY] = now
+    cache.set_many(versions, None)
+    if versions:
+        # 복제본이 따라잡기 전에 이전 내용이 다시 캐시되지 않도록 합니다.
+        hold_primary()
+
+
+def _is_cacheable(request):
+    """익명 사용자의 GET/HEAD 요청이고 보여줄 메시지가 없는지 확인합니다."""
+    return (
+        request.method in ("GET", "HEAD")
+        and not request.user.is_authenticated
+        and not get_messages(request)
+    )
+
+
+def _finalize(response, etag, last_modified):
+    """응답에 검증자(ETag, Last-Modified)와 캐시 헤더를 붙입니다."""
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # 브라우저/프록시는 보관하되 매번 재검증하고, 로그인 사용자의 응답과 섞이지 않게 합니다.
+    patch_cache_control(response, max_age=0, must_revalidate=True)
+    patch_vary_headers(response, ("Cookie",))
+    return response
+
+
+def cache_anonymous_page(on_hit=None):
+    """
+    익명 사용자의 페이지를 URL(쿼리 문자열 포함)별로 캐시하는 뷰 데코레이터입니다.
+
+    페이지 버전(마지막 변경 시각)으로 ETag/Last-Modified 를 만들어 조건부 요청에는
+    뷰를 실행하지 않고 304 를 돌려줍니다. 게시물/댓글/좋아요 등이 바뀌면
+    signals.py 에서 invalidate_pages() 로 버전을 올려 무효화합니다.
+
+    Args:
+        on_hit (callable, optional): 뷰를 실행하지 않고 응답한 경우(캐시 적중, 304)
+            뷰와 같은 인자로 호출됩니다. (예: 조회수 집계)
+
+    Returns:
+        callable: 뷰 데코레이터
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _is_cacheable(request):
+                return view(request, *args, **kwargs)
+
+            version = page_version(kwargs.get("pk"))
+            digest = hashlib.md5(
+                f"{version!r}:{request.get_full_path()}".encode()
+            ).hexdigest()
+            etag = f'"{digest}"'
+            last_modified = int(version)
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is not None:
+                if on_hit and response.status_code == 304:
+                    on_hit(request, *args, **kwargs)
+                return _finalize(response, etag, last_modified)
+
+            key = PAGE_KEY.format(digest=digest)
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                response = HttpResponse(content, content_type=content_type)
+                response["X-Page-Cache"] = "hit"
+                if on_hit:
+                    on_hit(request, *args, **kwargs)
+                return _finalize(response, etag, last_modified)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if hasattr(response, "render"):
+                response.render()
+            # CSRF 토큰이 들어간 페이지는 다른 방문자에게 줄 수 없습니다.
+            if request.META.get("CSRF_COOKIE_NEEDS_UPDATE") or response.cookies:
+                return response
+            cache.set(
+                key,
+                (response.content, response["Content-Type"]),
+                getattr(settings, "PAGE_CACHE_TIMEOUT", 300),
+            )
+            response["X-Page-Cache"] = "miss"
+            return _finalize(response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
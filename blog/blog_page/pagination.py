@@ -0,0 +1,237 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    """커서 문자열을 해석할 수 없을 때 발생하는 예외입니다."""
+
+
+class KeysetPage:
+    """
+    키셋 페이지네이션의 한 페이지를 나타내는 클래스입니다.
+
+    Attributes:
+        object_list (list): 이 페이지의 객체 리스트
+        has_next (bool): 다음 페이지 존재 여부
+        has_previous (bool): 이전 페이지 존재 여부
+        next_cursor (str): 다음 페이지 커서 (없으면 None)
+        previous_cursor (str): 이전 페이지 커서 (없으면 None)
+    """
+
+    def __init__(self, object_list, has_next, has_previous, paginator):
+        self.object_list = object_list
+        # 비어 있는 페이지에는 커서를 만들 기준 행이 없습니다.
+        self.has_next = has_next and bool(object_list)
+        self.has_previous = has_previous and bool(object_list)
+        self.paginator = paginator
+        self.next_cursor = (
+            paginator.encode_cursor(object_list[-1]) if self.has_next else None
+        )
+        self.previous_cursor = (
+            paginator.encode_cursor(object_list[0], reverse=True)
+            if self.has_previous
+            else None
+        )
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_other_pages(self):
+        """이전 또는 다음 페이지가 있는지 반환합니다."""
+        return self.has_next or self.has_previous
+
+
+class KeysetPaginator:
+    """
+    OFFSET 대신 마지막 행의 정렬 키를 기준으로 다음 페이지를 가져오는 페이지네이터입니다.
+
+    ``WHERE (created_at, pk) < (마지막 값)`` 형태로 조회하므로 몇 번째 페이지든
+    페이지 크기만큼만 읽습니다. 정렬 키의 마지막 항목은 유일해야 합니다(보통 pk).
+
+    Args:
+        queryset (QuerySet): 페이지를 나눌 쿼리셋
+        ordering (tuple): 정렬 필드 목록 (예: ("-created_at", "-pk"))
+        per_page (int): 페이지당 객체 수
+    """
+
+    def __init__(self, queryset, ordering=("-pk",), per_page=10):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields = [field.lstrip("-") for field in self.ordering]
+
+    def encode_cursor(self, obj, reverse=False):
+        """
+        객체의 정렬 키 값으로 URL에 넣을 수 있는 커서 문자열을 만듭니다.
+
+        Args:
+            obj (Model): 기준이 되는 객체
+            reverse (bool): 이전 페이지 방향 커서 여부
+
+        Returns:
+            str: URL-safe base64 로 인코딩된 커서
+        """
+        values = []
+        for field in self.fields:
+            value = getattr(obj, field)
+            if isinstance(value, datetime):
+                value = {"dt": value.isoformat()}
+            values.append(value)
+        payload = json.dumps({"v": values, "r": reverse}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """
+        커서 문자열을 (정렬 키 값 목록, 역방향 여부)로 해석합니다.
+
+        Raises:
+            InvalidCursor: 커서 형식이 잘못된 경우
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            values = [
+                (
+                    datetime.fromisoformat(value["dt"])
+                    if isinstance(value, dict)
+                    else value
+                )
+                for value in payload["v"]
+            ]
+            reverse = bool(payload.get("r"))
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise InvalidCursor(cursor)
+        if len(values) != len(self.fields):
+            raise InvalidCursor(cursor)
+        try:
+            values = [
+                self._field(name).to_python(value)
+                for name, value in zip(self.fields, values)
+            ]
+        except (ValidationError, ValueError, TypeError):
+            # 조작된 커서의 값이 필드 형식과 맞지 않으면 쿼리 단계에서 500 이 납니다.
+            raise InvalidCursor(cursor)
+        return values, reverse
+
+    def _field(self, name):
+        """정렬 키 이름에 해당하는 모델 필드(또는 annotate 한 값의 output_field)를 반환합니다."""
+        opts = self.queryset.model._meta
+        if name == "pk":
+            return opts.pk
+        try:
+            return opts.get_field(name)
+        except FieldDoesNotExist:
+            return self.queryset.query.annotations[name].output_field
+
+    def _after(self, values, reverse):
+        """
+        정렬 순서상 values 뒤(reverse 면 앞)에 오는 행을 고르는 Q 객체를 만듭니다.
+
+        OR 로 묶인 조건은 색인 범위 검색을 쓰지 못하므로 첫 정렬 키의 범위 조건
+        (``a <= v``)을 AND 로 함께 겁니다. 결과는 같습니다.
+        """
+        condition = Q()
+        for index, order in enumerate(self.ordering):
+            descending = order.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            step = Q(**{f"{self.fields[index]}__{lookup}": values[index]})
+            for field, value in zip(self.fields[:index], values[:index]):
+                step &= Q(**{field: value})
+            condition |= step
+        descending = self.ordering[0].startswith("-") != reverse
+        bound = Q(**{f"{self.fields[0]}__{'lte' if descending else 'gte'}": values[0]})
+        return bound & condition
+
+    def page(self, cursor=None):
+        """
+        커서 위치의 페이지를 반환합니다.
+
+        Args:
+            cursor (str, optional): 커서 문자열 (없으면 첫 페이지)
+
+        Returns:
+            KeysetPage: 요청한 페이지
+
+        Raises:
+            InvalidCursor: 커서 형식이 잘못된 경우
+        """
+        queryset = self.queryset
+        reverse = False
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._after(values, reverse))
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [
+                field[1:] if field.startswith("-") else f"-{field}"
+                for field in ordering
+            ]
+        rows = list(queryset.order_by(*ordering)[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if reverse:
+            rows.reverse()
+            return KeysetPage(
+                rows, has_next=True, has_previous=has_more, paginator=self
+            )
+        return KeysetPage(
+            rows, has_next=has_more, has_previous=bool(cursor), paginator=self
+        )
+
+    def get_page(self, cursor=None):
+        """
+        page() 와 같지만, 잘못된 커서가 오면 첫 페이지를 반환합니다.
+
+        Args:
+            cursor (str, optional): 커서 문자열
+
+        Returns:
+            KeysetPage: 요청한 페이지 또는 첫 페이지
+        """
+        try:
+            return self.page(cursor)
+        except InvalidCursor:
+            return self.page()
+
+
+class KeysetPaginationMixin:
+    """
+    ListView 의 OFFSET 페이지네이션을 키셋 페이지네이션으로 바꾸는 믹스인입니다.
+
+    Attributes:
+        paginate_by (int): 페이지당 객체 수
+        cursor_param (str): 커서를 담는 GET 파라미터 이름
+        keyset_ordering (tuple): 정렬 키 목록
+    """
+
+    paginate_by = 10
+    cursor_param = "cursor"
+    keyset_ordering = ("-pk",)
+
+    def get_keyset_ordering(self):
+        """키셋 정렬 키 목록을 반환합니다."""
+        return self.keyset_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        쿼리셋을 키셋 방식으로 나눕니다. ListView 의 반환 형식을 그대로 따릅니다.
+
+        Returns:
+            tuple: (paginator, page, object_list, is_paginated)
+        """
+        paginator = KeysetPaginator(queryset, self.get_keyset_ordering(), page_size)
+        page = paginator.get_page(self.request.GET.get(self.cursor_param))
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -0,0 +1,557 @@
+import math
+import threading
+from collections import defaultdict
+
+import numpy as np
+from django.db import connection, transaction
+from django.db.models import Count, Min
+
+from .background import run_in_background
+from .models import (
+    Post,
+    PostRecommendation,
+    RecommendationNorm,
+    SearchPosting,
+    SearchTerm,
+)
+from .page_cache import invalidate_pages
+
+# 게시물마다 자동으로 채울 관련 게시물 수
+TOP_K = 5
+
+# 코사인 유사도가 이 값보다 낮은 게시물은 추천하지 않습니다.
+MIN_SCORE = 0.05
+
+# 특징으로 쓸 최대 토큰 수 (문서 빈도 상위부터)
+MAX_FEATURES = 4096
+
+# 전체 게시물 중 이 비율보다 많이 나오는 토큰은 변별력이 없어 제외합니다.
+MAX_DF_RATIO = 0.5
+
+# 한 번의 행렬 곱으로 유사도를 계산할 게시물 수
+BATCH_SIZE = 256
+
+# 기본 키 목록으로 조회할 때 한 쿼리에 넣을 최대 개수
+CHUNK_SIZE = 1000
+
+# 일부 게시물의 유사도를 DB 에서 합산할 때 한 쿼리에 넣을 최대 (게시물, 토큰) 수
+MAX_QUERY_TERMS = 3000
+
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def _features(total, max_features=MAX_FEATURES):
+    """
+    특징으로 쓸 토큰과 토큰별 IDF 를 SearchTerm 의 문서 빈도로 정합니다.
+
+    Args:
+        total (int): 전체 게시물 수
+        max_features (int): 최대 토큰 수 (문서 빈도 상위부터)
+
+    Returns:
+        tuple: (토큰 -> 열 번호 딕셔너리, 열 순서대로의 IDF 배열)
+    """
+    # 한 게시물에만 나오는 토큰은 유사도에 기여하지 않으므로 제외합니다.
+    vocabulary = list(
+        SearchTerm.objects.filter(df__gte=2, df__lte=max(2, int(total * MAX_DF_RATIO)))
+        .order_by("-df", "term")
+        .values_list("term", "df")[:max_features]
+    )
+    columns = {term: col for col, (term, _) in enumerate(vocabulary)}
+    df = np.array([df for _, df in vocabulary], dtype=np.float32)
+    return columns, np.log((1 + total) / (1 + df)) + 1
+
+
+def _tf(weights):
+    """색인 가중치를 로그 스케일 TF 로 바꿉니다. (한 토큰이 과도하게 반복되어도 지배하지 않도록)"""
+    return 1 + np.log(np.maximum(np.asarray(weights, dtype=np.float32), 1))
+
+
+def _norm(vector):
+    """{토큰: 값} 벡터의 L2 노름을 반환합니다."""
+    return math.sqrt(sum(value * value for value in vector.values()))
+
+
+def _store_norms(norms):
+    """
+    게시물별 TF-IDF 노름(RecommendationNorm)을 저장하거나 바꿉니다.
+
+    Args:
+        norms (dict): 게시물 기본 키 -> 노름
+    """
+    RecommendationNorm.objects.bulk_create(
+        [RecommendationNorm(post_id=pk, norm=norm) for pk, norm in norms.items()],
+        batch_size=CHUNK_SIZE,
+        update_conflicts=True,
+        update_fields=["norm"],
+        unique_fields=["post"],
+    )
+
+
+def _top_k(scores, post_ids, k, excluded):
+    """
+    유사도가 높은 순으로 제외할 게시물을 빼고 최대 k 개를 고릅니다.
+
+    argpartition 으로 상위 항목만 골라 정렬합니다.
+
+    Args:
+        scores (ndarray): 열마다의 유사도 (추천하지 않을 열은 -inf)
+        post_ids (ndarray): 열 순서대로의 게시물 기본 키
+        k (int): 추천 수
+        excluded (set): 제외할 게시물 기본 키
+
+    Returns:
+        list: [(관련 게시물 기본 키, 유사도), ...] (유사도 내림차순)
+    """
+    # 제외할 항목이 상위에 섞여 있어도 k 개를 채울 수 있도록 여유를 둡니다.
+    width = min(len(scores), k + len(excluded))
+    picks = []
+    if width:
+        top = np.argpartition(-scores, width - 1)[:width]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        for col in top.tolist():
+            if scores[col] == -np.inf or len(picks) == k:
+                break
+            related = int(post_ids[col])
+            if related not in excluded:
+                picks.append((related, float(scores[col])))
+    return picks
+
+
+class TfidfIndex:
+    """
+    검색 역색인(SearchPosting)으로 만든 게시물 TF-IDF 행렬입니다.
+
+    SearchPosting 의 가중치에는 제목/태그/본문 가중치가 이미 반영되어 있으므로
+    다시 토큰화하지 않고 (게시물 x 토큰) 행렬로 옮긴 뒤 행마다 L2 정규화합니다.
+    정규화된 두 행의 내적이 곧 코사인 유사도입니다.
+
+    Attributes:
+        post_ids (ndarray): 행 순서대로의 게시물 기본 키
+        rows (dict): 게시물 기본 키 -> 행 번호
+        candidates (ndarray): 추천 대상이 될 수 있는(발행된) 행인지 여부
+        norms (ndarray): 행마다 정규화 전 TF-IDF 벡터의 L2 노름
+        matrix (ndarray): L2 정규화된 TF-IDF 행렬 (float32)
+    """
+
+    def __init__(self, max_features=MAX_FEATURES):
+        posts = list(Post.objects.order_by("pk").values_list("pk", "status"))
+        self.post_ids = np.array([pk for pk, _ in posts], dtype=np.int64)
+        self.rows = {pk: row for row, (pk, _) in enumerate(posts)}
+        self.candidates = np.array(
+            [status == "published" for _, status in posts], dtype=bool
+        )
+        columns, idf = _features(len(posts), max_features)
+
+        post_rows, term_cols, weights = [], [], []
+        postings = SearchPosting.objects.values_list("post_id", "term", "weight")
+        for post_id, term, weight in postings.iterator(chunk_size=10000):
+            col = columns.get(term)
+            row = self.rows.get(post_id)
+            if col is not None and row is not None:
+                post_rows.append(row)
+                term_cols.append(col)
+                weights.append(weight)
+
+        self.matrix = np.zeros((len(posts), len(columns)), dtype=np.float32)
+        if weights:
+            self.matrix[post_rows, term_cols] = _tf(weights)
+        self.matrix *= idf
+        self.norms = np.linalg.norm(self.matrix, axis=1)
+        self.matrix /= np.where(self.norms == 0, 1, self.norms)[:, np.newaxis]
+
+    def similarities(self, rows):
+        """
+        주어진 행들과 모든 행 사이의 코사인 유사도를 계산합니다.
+
+        Args:
+            rows (list): 행 번호 목록
+
+        Returns:
+            ndarray: (len(rows) x 게시물 수) 유사도 행렬
+        """
+        return self.matrix[rows] @ self.matrix.T
+
+    def nearest(self, post_ids, k=TOP_K, exclude=None, batch_size=BATCH_SIZE):
+        """
+        게시물마다 가장 비슷한 발행 게시물을 최대 k 개 찾습니다.
+
+        batch_size 개씩 묶어 한 번의 행렬 곱으로 유사도를 구합니다.
+
+        Args:
+            post_ids (list): 추천을 계산할 게시물 기본 키 목록
+            k (int): 게시물당 추천 수
+            exclude (dict, optional): 게시물별로 제외할 게시물 기본 키 집합
+            batch_size (int): 한 번에 계산할 게시물 수
+
+        Returns:
+            dict: 게시물 기본 키 -> [(관련 게시물 기본 키, 유사도), ...] (유사도 내림차순)
+        """
+        exclude = exclude or {}
+        rows = [self.rows[pk] for pk in post_ids if pk in self.rows]
+        result = {}
+        for start in range(0, len(rows), batch_size):
+            batch = np.array(rows[start : start + batch_size])
+            scores = self.similarities(batch)
+            scores[:, ~self.candidates] = -np.inf
+            scores[np.arange(len(batch)), batch] = -np.inf
+            scores[scores < MIN_SCORE] = -np.inf
+
+            for row, row_scores in zip(batch.tolist(), scores):
+                post_id = int(self.post_ids[row])
+                result[post_id] = _top_k(
+                    row_scores, self.post_ids, k, exclude.get(post_id, ())
+                )
+        return result
+
+
+class SparseTfidfIndex:
+    """
+    일부 게시물의 추천만 다시 계산할 때 쓰는 TF-IDF 인덱스입니다.
+
+    TfidfIndex 와 같은 특징과 가중치를 쓰지만 (게시물 x 토큰) 행렬을 만들지 않습니다.
+    대상 게시물의 벡터만 읽고, 후보 게시물과의 내적은 대상 벡터의 토큰이 들어 있는
+    색인 항목만으로 DB 에서 합산한 뒤 저장된 노름(RecommendationNorm)으로 나눕니다.
+    토큰을 공유하지 않는 게시물은 유사도가 0 이므로 읽지 않습니다.
+
+    다른 게시물의 노름은 마지막으로 계산할 때의 문서 빈도 기준이므로, 그 사이 문서 빈도가
+    바뀐 만큼 유사도가 조금 다를 수 있습니다. rebuild_related_posts 가 모두 다시 맞춥니다.
+
+    Attributes:
+        post_ids (list): 대상 게시물 기본 키 (존재하는 게시물만)
+        rows (dict): 대상 게시물 기본 키 -> 행 번호
+        candidate_ids (ndarray): 후보(대상과 토큰을 공유하는 발행) 게시물 기본 키 (오름차순)
+        scores (ndarray): (대상 게시물 x 후보) 코사인 유사도 행렬
+    """
+
+    def __init__(self, post_ids, max_features=MAX_FEATURES):
+        self.post_ids = list(
+            Post.objects.filter(pk__in=post_ids)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        self.rows = {pk: row for row, pk in enumerate(self.post_ids)}
+        self.columns, self.idf = _features(Post.objects.count(), max_features)
+
+        vectors = self._vectors(self.post_ids)
+        _store_norms({pk: _norm(vector) for pk, vector in vectors.items()})
+
+        dots = defaultdict(dict)
+        norms = {}
+        missing = set()
+        for post_id, candidate, dot, norm in self._dot_products(vectors):
+            dots[candidate][post_id] = dots[candidate].get(post_id, 0.0) + dot
+            norms[candidate] = norm
+            if not norm:
+                missing.add(candidate)
+
+        # 노름이 없거나 0 인(그때는 특징 토큰이 없던) 게시물만 벡터를 읽어 계산합니다.
+        computed = {pk: _norm(vector) for pk, vector in self._vectors(missing).items()}
+        _store_norms(computed)
+        norms.update(computed)
+
+        self.candidate_ids = np.array(sorted(dots), dtype=np.int64)
+        self.scores = np.zeros(
+            (len(self.post_ids), len(self.candidate_ids)), dtype=np.float32
+        )
+        for col, candidate in enumerate(self.candidate_ids.tolist()):
+            if norms[candidate]:
+                for post_id, dot in dots[candidate].items():
+                    self.scores[self.rows[post_id], col] = dot / norms[candidate]
+
+    def _dot_products(self, vectors):
+        """
+        대상 벡터(정규화)와 토큰을 공유하는 발행 게시물의 벡터(정규화 전)의 내적을 구합니다.
+
+        대상 벡터의 (게시물, 토큰, 계수) 를 VALUES 목록으로 넘겨 (term, weight, post) 색인에서
+        그 토큰의 항목만 읽고 게시물별로 합산한 뒤, 합산된 행에만 게시물 상태와 저장된 노름을
+        붙입니다. 한 쿼리에는 MAX_QUERY_TERMS 개까지 넣으므로 한 대상 게시물의 내적이
+        여러 행으로 나뉠 수 있습니다. (호출하는 쪽에서 더합니다)
+
+        Args:
+            vectors (dict): 게시물 기본 키 -> {토큰: tf * idf}
+
+        Yields:
+            tuple: (대상 게시물 기본 키, 후보 게시물 기본 키, 내적, 저장된 노름 또는 None)
+        """
+        quote = connection.ops.quote_name
+        postings = quote(SearchPosting._meta.db_table)
+        posts = quote(Post._meta.db_table)
+        norms = quote(RecommendationNorm._meta.db_table)
+        # 후보 벡터의 값은 tf * idf 이므로 대상 쪽 계수에 idf 를 미리 곱해 둡니다.
+        coefficients = [
+            (post_id, term, value * float(self.idf[self.columns[term]]) / norm)
+            for post_id, vector in vectors.items()
+            if (norm := _norm(vector))
+            for term, value in vector.items()
+        ]
+        for start in range(0, len(coefficients), MAX_QUERY_TERMS):
+            batch = coefficients[start : start + MAX_QUERY_TERMS]
+            values = ", ".join(["(%s, %s, %s)"] * len(batch))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"WITH q(target, term, coefficient) AS (VALUES {values}), "
+                    "dots AS (SELECT q.target, p.post_id, "
+                    "SUM(q.coefficient * (1 + LN(p.weight))) AS dot "
+                    f"FROM q JOIN {postings} p ON p.term = q.term "
+                    "GROUP BY q.target, p.post_id) "
+                    "SELECT dots.target, dots.post_id, dots.dot, n.norm FROM dots "
+                    f"JOIN {posts} post ON post.id = dots.post_id "
+                    f"LEFT JOIN {norms} n ON n.post_id = dots.post_id "
+                    "WHERE post.status = %s",
+                    [value for row in batch for value in row] + ["published"],
+                )
+                yield from cursor.fetchall()
+
+    def _vectors(self, post_ids):
+        """
+        게시물들의 정규화 전 TF-IDF 벡터를 색인 항목으로 만듭니다.
+
+        Args:
+            post_ids (iterable): 게시물 기본 키
+
+        Returns:
+            dict: 게시물 기본 키 -> {토큰: tf * idf} (특징 토큰만)
+        """
+        post_ids = list(post_ids)
+        vectors = {pk: {} for pk in post_ids}
+        for start in range(0, len(post_ids), CHUNK_SIZE):
+            postings = SearchPosting.objects.filter(
+                post_id__in=post_ids[start : start + CHUNK_SIZE]
+            ).values_list("post_id", "term", "weight")
+            for post_id, term, weight in postings:
+                col = self.columns.get(term)
+                if col is not None:
+                    vectors[post_id][term] = float(_tf(weight) * self.idf[col])
+        return vectors
+
+    def similarities(self, post_id):
+        """
+        게시물과 후보 게시물 사이의 코사인 유사도를 반환합니다.
+
+        Args:
+            post_id (int): 대상 게시물 기본 키
+
+        Returns:
+            dict: 후보 게시물 기본 키 -> 유사도
+        """
+        return dict(
+            zip(self.candidate_ids.tolist(), self.scores[self.rows[post_id]].tolist())
+        )
+
+    def nearest(self, post_ids, k=TOP_K, exclude=None):
+        """
+        게시물마다 가장 비슷한 발행 게시물을 최대 k 개 찾습니다. (TfidfIndex.nearest 와 같음)
+
+        Args:
+            post_ids (list): 추천을 계산할 게시물 기본 키 목록 (대상 게시물 중에서)
+            k (int): 게시물당 추천 수
+            exclude (dict, optional): 게시물별로 제외할 게시물 기본 키 집합
+
+        Returns:
+            dict: 게시물 기본 키 -> [(관련 게시물 기본 키, 유사도), ...] (유사도 내림차순)
+        """
+        exclude = exclude or {}
+        result = {}
+        for post_id in post_ids:
+            if post_id not in self.rows:
+                continue
+            scores = self.scores[self.rows[post_id]].copy()
+            scores[self.candidate_ids == post_id] = -np.inf
+            scores[scores < MIN_SCORE] = -np.inf
+            result[post_id] = _top_k(
+                scores, self.candidate_ids, k, exclude.get(post_id, ())
+            )
+        return result
+
+
+def _manual_related(post_ids=None):
+    """
+    게시물별로 관리자가 직접 지정한 related_posts 항목을 반환합니다.
+
+    PostRecommendation 에 기록되지 않은 related_posts 항목이 수동 항목입니다.
+
+    Args:
+        post_ids (list, optional): 대상 게시물 기본 키 목록 (없으면 전체)
+
+    Returns:
+        dict: 게시물 기본 키 -> 수동 지정된 관련 게시물 기본 키 집합
+    """
+    links = Post.related_posts.through.objects.all()
+    auto = PostRecommendation.objects.all()
+    if post_ids is not None:
+        links = links.filter(from_post_id__in=post_ids)
+        auto = auto.filter(post_id__in=post_ids)
+    auto_pairs = set(auto.values_list("post_id", "related_id"))
+    manual = defaultdict(set)
+    for pair in links.values_list("from_post_id", "to_post_id"):
+        if pair not in auto_pairs:
+            manual[pair[0]].add(pair[1])
+    return manual
+
+
+def _save(results, post_ids=None):
+    """
+    계산한 추천으로 PostRecommendation 과 related_posts 를 교체합니다.
+    수동 지정 항목은 그대로 둡니다.
+
+    Args:
+        results (dict): nearest() 의 반환값
+        post_ids (list, optional): 교체할 게시물 기본 키 목록 (없으면 전체)
+    """
+    through = Post.related_posts.through
+    links = through.objects.all()
+    auto = PostRecommendation.objects.all()
+    if post_ids is not None:
+        links = links.filter(from_post_id__in=post_ids)
+        auto = auto.filter(post_id__in=post_ids)
+
+    with transaction.atomic():
+        old_pairs = set(auto.values_list("post_id", "related_id"))
+        stale = [
+            link_id
+            for link_id, from_id, to_id in links.values_list(
+                "id", "from_post_id", "to_post_id"
+            )
+            if (from_id, to_id) in old_pairs
+        ]
+        for start in range(0, len(stale), 500):
+            through.objects.filter(id__in=stale[start : start + 500]).delete()
+        auto.delete()
+
+        PostRecommendation.objects.bulk_create(
+            PostRecommendation(post_id=post_id, related_id=related, score=score)
+            for post_id, picks in results.items()
+            for related, score in picks
+        )
+        through.objects.bulk_create(
+            (
+                through(from_post_id=post_id, to_post_id=related)
+                for post_id, picks in results.items()
+                for related, _ in picks
+            ),
+            ignore_conflicts=True,
+        )
+    # related_posts 는 일괄 쿼리로 바뀌어 시그널이 없으므로 직접 무효화합니다.
+    invalidate_pages(*results)
+
+
+def rebuild_related_posts(k=TOP_K, batch_size=BATCH_SIZE):
+    """
+    모든 게시물의 자동 관련 게시물을 처음부터 다시 계산합니다.
+
+    Args:
+        k (int): 게시물당 추천 수
+        batch_size (int): 한 번의 행렬 곱으로 계산할 게시물 수
+
+    Returns:
+        int: 추천을 계산한 게시물 수
+    """
+    index = TfidfIndex()
+    results = index.nearest(
+        index.post_ids.tolist(), k, _manual_related(), batch_size=batch_size
+    )
+    _save(results)
+    _store_norms(dict(zip(index.post_ids.tolist(), index.norms.tolist())))
+    return len(results)
+
+
+def update_related_posts(post_id, k=TOP_K):
+    """
+    한 게시물이 바뀌었을 때 영향을 받는 게시물의 추천만 다시 계산합니다.
+
+    전체 행렬을 만들지 않고 SparseTfidfIndex 로 바뀐 게시물만 토큰을 공유하는 후보와
+    비교합니다. 다른 게시물의 벡터는 그대로이므로 영향받는 게시물의 추천 목록은
+    현재 목록에 바뀐 게시물의 새 점수를 합쳐 고칩니다.
+
+    - 바뀐 게시물 자신: 새로 계산
+    - 바뀐 게시물과의 유사도가 현재 추천 목록의 최저 점수보다 높거나,
+      추천 목록이 아직 k 개가 안 되는 게시물: 목록에 합침
+    - 바뀐 게시물을 이미 추천 목록에 가진 게시물: 점수를 바꿔 합치되, 꽉 찬 목록에서
+      최저 점수 아래로 떨어지면 목록 밖의 게시물이 대신 들어갈 수 있으므로 새로 계산
+
+    Args:
+        post_id (int): 바뀐 게시물의 기본 키
+        k (int): 게시물당 추천 수
+
+    Returns:
+        int: 추천을 다시 계산한 게시물 수
+    """
+    index = SparseTfidfIndex([post_id])
+    results = index.nearest(index.post_ids, k, _manual_related(index.post_ids))
+    scores = index.similarities(post_id) if post_id in index.rows else {}
+    # 후보에 자신이 없으면 발행되지 않은 게시물이므로 다른 게시물에 추천되지 않습니다.
+    if post_id not in scores:
+        scores = {}
+    similar = {
+        other: score
+        for other, score in scores.items()
+        if score >= MIN_SCORE and other != post_id
+    }
+    holders = set(
+        PostRecommendation.objects.filter(related_id=post_id).values_list(
+            "post_id", flat=True
+        )
+    )
+
+    targets = list(holders | similar.keys())
+    current = defaultdict(list)
+    for start in range(0, len(targets), CHUNK_SIZE):
+        for pk, related, score in PostRecommendation.objects.filter(
+            post__in=targets[start : start + CHUNK_SIZE]
+        ).values_list("post", "related", "score"):
+            current[pk].append((related, score))
+
+    # 다른 게시물의 벡터는 그대로이므로 목록에 바뀐 게시물의 새 점수만 합치면 됩니다.
+    rescan, merge = [], []
+    for other in targets:
+        picks = current[other]
+        lowest = min((score for _, score in picks), default=0.0)
+        score = similar.get(other)
+        if other in holders:
+            if len(picks) >= k and (score is None or score < lowest):
+                rescan.append(other)
+            else:
+                merge.append(other)
+        elif len(picks) < k or score > lowest:
+            merge.append(other)
+
+    manual = _manual_related(merge)
+    for other in merge:
+        picks = [pick for pick in current[other] if pick[0] != post_id]
+        if other in similar and post_id not in manual.get(other, ()):
+            picks.append((post_id, similar[other]))
+        results[other] = sorted(picks, key=lambda pick: -pick[1])[:k]
+
+    if rescan:
+        index = SparseTfidfIndex(rescan)
+        results.update(
+            index.nearest(index.post_ids, k, _manual_related(index.post_ids))
+        )
+    _save(results, list(results))
+    return len(results)
+
+
+def _update_pending(post_id):
+    """예약된 게시물의 추천을 갱신합니다."""
+    with _pending_lock:
+        _pending.discard(post_id)
+    return update_related_posts(post_id)
+
+
+def schedule_related_posts(post_id):
+    """
+    게시물의 관련 게시물 갱신을 작업자 스레드에서 실행하도록 예약합니다.
+
+    아직 실행되지 않은 같은 게시물의 예약이 있으면 다시 예약하지 않습니다.
+    (저장과 태그 변경이 연달아 일어나는 경우 등)
+
+    Args:
+        post_id (int): 바뀐 게시물의 기본 키
+    """
+    with _pending_lock:
+        if post_id in _pending:
+            return None
+        _pending.add(post_id)
+    return run_in_background(_update_pending, post_id)
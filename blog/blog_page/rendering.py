@@ -0,0 +1,202 @@
+import hashlib
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.utils.text import slugify
+
+from .excerpts import content_stats
+
+# 렌더링 파이프라인 버전. 처리 방식을 바꾸면 올려서 모든 본문이 다시 렌더링되게 합니다.
+RENDER_VERSION = 1
+
+# 본문에 남길 태그와 속성 (그 밖의 태그는 태그만 지우고 글자는 남깁니다)
+ALLOWED_TAGS = {
+    "a", "abbr", "b", "blockquote", "br", "caption", "code", "dd", "del", "div",
+    "dl", "dt", "em", "figcaption", "figure", "h1", "h2", "h3", "h4", "h5", "h6",
+    "hr", "i", "img", "ins", "kbd", "li", "mark", "ol", "p", "pre", "s", "small",
+    "span", "strong", "sub", "sup", "table", "tbody", "td", "tfoot", "th", "thead",
+    "tr", "u", "ul",
+}  # fmt: skip
+GLOBAL_ATTRIBUTES = {"title", "lang", "dir"}
+ALLOWED_ATTRIBUTES = {
+    "a": {"href", "target", "rel"},
+    "img": {"src", "alt", "width", "height"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan", "scope"},
+    "ol": {"start", "reversed"},
+    "code": {"class"},
+    "pre": {"class"},
+}
+# 내용까지 통째로 지우는 태그
+DROP_CONTENT_TAGS = {
+    "script", "style", "iframe", "object", "embed", "template", "noscript",
+    "textarea", "select", "svg", "math",
+}  # fmt: skip
+VOID_TAGS = {"br", "hr", "img"}
+URL_ATTRIBUTES = {"href", "src"}
+# 링크/이미지에 허용하는 URL 스킴 (스킴이 없는 상대 경로와 #앵커는 항상 허용)
+ALLOWED_SCHEMES = {"http", "https", "mailto", "tel"}
+# 목차에 넣는 제목 수준 (h1 은 게시물 제목과 겹치므로 제외)
+TOC_LEVELS = {"h2": 2, "h3": 3, "h4": 4}
+
+
+def content_hash(content):
+    """본문과 파이프라인 버전으로 렌더링 결과를 식별하는 해시를 만듭니다."""
+    return hashlib.sha256(f"{RENDER_VERSION}\0{content}".encode()).hexdigest()
+
+
+def _safe_url(value):
+    """스킴이 허용된 URL 이면 True (공백/제어 문자로 스킴을 숨긴 경우도 막습니다)"""
+    value = "".join(ch for ch in value if ch > " ")
+    try:
+        scheme = urlsplit(value).scheme
+    except ValueError:
+        return False
+    return not scheme or scheme.lower() in ALLOWED_SCHEMES
+
+
+class _ContentRenderer(HTMLParser):
+    """
+    본문 HTML 을 허용 목록으로 정리하면서 제목에 앵커(id)를 달고 목차를 모으는 파서입니다.
+
+    - 허용되지 않은 태그는 지우고(스크립트 등은 내용까지) 속성은 허용 목록만 남깁니다.
+    - h2~h4 제목에 제목 글자로 만든 고유 id 를 붙이고 목차 항목으로 모읍니다.
+    - 이미지에는 loading="lazy", decoding="async" 를 붙입니다.
+    - 닫히지 않은 태그는 끝에서 닫아 본문 밖 레이아웃이 깨지지 않게 합니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.output = []
+        self.open_tags = []
+        self.dropping = 0
+        self.toc = []
+        self.used_ids = set()
+        # 렌더링 중인 제목: (output 위치, 태그, 속성 문자열, 글자 목록)
+        self.heading = None
+
+    def _attributes(self, tag, attrs):
+        allowed = GLOBAL_ATTRIBUTES | ALLOWED_ATTRIBUTES.get(tag, set())
+        result = {}
+        for name, value in attrs:
+            if name not in allowed or name in result:
+                continue
+            value = value or ""
+            if name in URL_ATTRIBUTES and not _safe_url(value):
+                continue
+            result[name] = value
+        if tag == "img":
+            result["loading"] = "lazy"
+            result["decoding"] = "async"
+        if tag == "a" and result.get("target") == "_blank":
+            # 새 창에서 열린 페이지가 window.opener 로 이 페이지를 바꾸지 못하게 합니다.
+            rel = set(result.get("rel", "").split()) | {"noopener", "noreferrer"}
+            result["rel"] = " ".join(sorted(rel))
+        return "".join(
+            f' {name}="{escape(value, quote=True)}"' for name, value in result.items()
+        )
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        attributes = self._attributes(tag, attrs)
+        if tag in VOID_TAGS:
+            self.output.append(f"<{tag}{attributes}>")
+            return
+        if tag in TOC_LEVELS and self.heading is None:
+            # id 는 제목 글자를 모두 읽은 뒤에 정하므로 자리만 잡아 둡니다.
+            self.heading = (len(self.output), tag, attributes, [])
+            self.output.append(None)
+        else:
+            self.output.append(f"<{tag}{attributes}>")
+        self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            return
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            self.dropping = max(0, self.dropping - 1)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # 안쪽에서 닫히지 않은 태그를 함께 닫습니다.
+        while self.open_tags:
+            current = self.open_tags.pop()
+            self.output.append(f"</{current}>")
+            if self.heading is not None and current == self.heading[1]:
+                self._finish_heading()
+            if current == tag:
+                break
+
+    def handle_data(self, data):
+        if self.dropping:
+            return
+        self.output.append(escape(data, quote=False))
+        if self.heading is not None:
+            self.heading[3].append(data)
+
+    def _finish_heading(self):
+        """모은 제목 글자로 고유 id 를 만들어 제목 태그를 채우고 목차에 추가합니다."""
+        index, tag, attributes, text = self.heading
+        self.heading = None
+        title = " ".join("".join(text).split())
+        base = slugify(title, allow_unicode=True) or "section"
+        anchor, number = base, 1
+        while anchor in self.used_ids:
+            number += 1
+            anchor = f"{base}-{number}"
+        self.used_ids.add(anchor)
+        self.output[index] = f'<{tag} id="{anchor}"{attributes}>'
+        self.toc.append({"level": TOC_LEVELS[tag], "id": anchor, "title": title})
+
+    def render(self, content):
+        """본문을 처리해 (HTML, 목차) 를 반환합니다."""
+        self.feed(content)
+        self.close()
+        while self.open_tags:
+            self.handle_endtag(self.open_tags[-1])
+        return "".join(self.output), self.toc
+
+
+def render_content(content):
+    """
+    게시물 본문을 정리된 HTML 과 목차로 렌더링합니다.
+
+    Args:
+        content (str): 작성자가 입력한 본문 (HTML)
+
+    Returns:
+        dict: {"content_html", "content_toc", "content_hash"} 필드 값
+            content_toc 는 {"level", "id", "title"} 목록입니다.
+    """
+    html, toc = _ContentRenderer().render(content or "")
+    return {
+        "content_html": html,
+        "content_toc": toc,
+        "content_hash": content_hash(content or ""),
+    }
+
+
+def render_fields(content):
+    """
+    본문을 렌더링하고, 렌더링된 HTML 로 요약/단어 수/읽기 시간까지 계산합니다.
+
+    DB 를 쓰지 않으므로 render_post_content 명령의 작업 프로세스에서도 실행됩니다.
+
+    Args:
+        content (str): 작성자가 입력한 본문 (HTML)
+
+    Returns:
+        dict: render_content() 와 content_stats() 의 필드 값
+    """
+    rendered = render_content(content)
+    return {**rendered, **content_stats(rendered["content_html"])}
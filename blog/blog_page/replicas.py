@@ -0,0 +1,136 @@
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 쓰기 직후 이 쿠키가 있는 동안에는 그 사용자의 읽기를 주 DB 에서 합니다.
+STICKY_COOKIE = "primary_reads"
+# 내용이 바뀐 직후(페이지 캐시 무효화) 모든 사용자의 읽기를 주 DB 로 보내는 동안 두는 캐시 키
+FENCE_CACHE_KEY = "replicas:fence"
+
+# 현재 처리 중인 요청 (라우터가 요청에 따라 읽기 DB 를 고릅니다)
+_current_request = ContextVar("replica_request", default=None)
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def replica_alias():
+    """읽기 복제본 DB 별칭(REPLICA_DATABASE)을 반환합니다. 설정되지 않았으면 None"""
+    return getattr(settings, "REPLICA_DATABASE", None)
+
+
+def hold_primary():
+    """
+    복제 지연 동안 모든 읽기를 주 DB 에서 하도록 합니다.
+
+    내용이 바뀌어 페이지 캐시를 지운 직후 복제본에서 읽으면 바뀌기 전 내용이
+    다시 캐시되므로 page_cache.invalidate_pages 에서 호출합니다.
+    """
+    if replica_alias():
+        cache.set(FENCE_CACHE_KEY, True, getattr(settings, "REPLICA_STICKY_SECONDS", 5))
+
+
+def _reads_from_replica(request):
+    """요청의 읽기를 복제본에서 해도 되는지 확인합니다."""
+    decision = getattr(request, "_reads_from_replica", None)
+    if decision is not None:
+        return decision
+    match = request.resolver_match
+    if match is None:
+        # URL 을 해석하기 전(미들웨어 등)의 읽기는 주 DB 에서 합니다.
+        return False
+    decision = (
+        request.method in SAFE_METHODS
+        and match.view_name in getattr(settings, "REPLICA_VIEWS", ())
+        and STICKY_COOKIE not in request.COOKIES
+        and not cache.get(FENCE_CACHE_KEY)
+    )
+    request._reads_from_replica = decision
+    return decision
+
+
+class ReplicaRouter:
+    """
+    REPLICA_VIEWS 에 있는 뷰의 GET/HEAD 요청에서 일어나는 읽기를 복제본(REPLICA_DATABASE)으로,
+    그 밖의 읽기와 모든 쓰기를 주 DB 로 보내는 DB 라우터입니다.
+
+    - 쓰기 요청(POST 등)을 보낸 사용자는 REPLICA_STICKY_SECONDS 동안 주 DB 에서 읽어
+      자신이 쓴 내용을 바로 봅니다. (ReplicaRoutingMiddleware 가 쿠키를 붙입니다)
+    - 내용이 바뀐 직후에는 페이지 캐시에 이전 내용이 다시 담기지 않도록 모든 사용자가
+      같은 시간 동안 주 DB 에서 읽습니다. (hold_primary)
+    - 주 DB 트랜잭션 안의 읽기는 항상 주 DB 에서 합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = replica_alias()
+        request = _current_request.get()
+        if alias is None or request is None:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias if _reads_from_replica(request) else None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 주 DB 의 사본이므로 어느 쪽에서 읽은 객체끼리도 연결할 수 있습니다.
+        databases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        # 복제본은 주 DB 를 복사해 만들므로 따로 마이그레이션하지 않습니다.
+        if db == replica_alias():
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    ReplicaRouter 가 현재 요청을 보고 읽기 DB 를 고를 수 있도록 요청을 기록하고,
+    쓰기 요청의 응답에 주 DB 읽기 쿠키(STICKY_COOKIE)를 붙이는 미들웨어입니다.
+
+    동기/비동기 요청을 모두 그대로 처리합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _current_request.set(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        return self.process(request, response)
+
+    async def __acall__(self, request):
+        token = _current_request.set(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_request.reset(token)
+        return self.process(request, response)
+
+    def process(self, request, response):
+        """쓰기 요청이면 한동안 주 DB 에서 읽도록 쿠키를 붙입니다."""
+        if replica_alias() and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=getattr(settings, "REPLICA_STICKY_SECONDS", 5),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
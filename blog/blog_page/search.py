@@ -0,0 +1,316 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+from django.db import connection, transaction
+from django.db.models import (
+    Case,
+    Count,
+    ExpressionWrapper,
+    F,
+    FilteredRelation,
+    FloatField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Greatest
+from django.utils.html import strip_tags
+
+from .models import Post, SearchPosting, SearchTerm
+
+# 필드별 가중치: 제목 > 태그 > 본문
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 2
+CONTENT_WEIGHT = 1
+
+MAX_TERM_LENGTH = 50
+# 색인에 없는 영문/숫자 토큰을 접두어로 보고 확장할 때 쓰는 최대 토큰 수 (문서 빈도 순)
+MAX_PREFIX_TERMS = 20
+
+# 한글 음절 덩어리 또는 (밑줄과 한글을 제외한) 단어 문자 덩어리
+_TOKEN_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+
+def _is_hangul(token):
+    """토큰이 한글 음절로 이루어졌는지 확인합니다."""
+    return "가" <= token[0] <= "힣"
+
+
+def tokenize(text, unigrams=False):
+    """
+    문자열을 검색 토큰 목록으로 나눕니다.
+
+    영문/숫자는 단어 단위로, 한글은 조사와 어미가 붙어도 검색되도록
+    글자 2-gram 단위로 나눕니다. (예: "장고를" -> ["장고", "고를"])
+
+    Args:
+        text (str): 토큰화할 문자열
+        unigrams (bool): 한글 음절 하나(1-gram)도 토큰에 넣을지 여부.
+            색인할 때 켜서 한 글자 검색어("장")도 찾을 수 있게 합니다.
+
+    Returns:
+        list: 소문자로 정규화된 토큰 리스트
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if _is_hangul(run):
+            if len(run) == 1 or unigrams:
+                tokens.extend(run)
+            if len(run) > 1:
+                tokens.extend(run[i : i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run[:MAX_TERM_LENGTH])
+    return tokens
+
+
+def build_postings(post):
+    """
+    게시물 하나의 (토큰 -> 가중치) 색인 정보를 계산합니다.
+
+    Args:
+        post (Post): 색인할 게시물
+
+    Returns:
+        Counter: 토큰별 가중치
+    """
+    weights = Counter()
+    for term in tokenize(post.title, unigrams=True):
+        weights[term] += TITLE_WEIGHT
+    for term in tokenize(strip_tags(post.content), unigrams=True):
+        weights[term] += CONTENT_WEIGHT
+    for tag in post.tags.all():
+        for term in tokenize(tag.name, unigrams=True):
+            weights[term] += TAG_WEIGHT
+    return weights
+
+
+def adjust_document_frequency(deltas):
+    """
+    토큰별 문서 빈도(SearchTerm.df)를 deltas 만큼 바꿉니다.
+
+    늘어난 토큰은 ``INSERT ... ON CONFLICT DO UPDATE SET df = df + n`` 으로 더해
+    처음 나온 토큰도 만들고, 줄어든 토큰은 같은 감소량끼리 묶어 UPDATE 한 뒤
+    빈도가 0 이 된 토큰을 지웁니다.
+
+    Args:
+        deltas (dict): {토큰: 늘어난(줄어든) 게시물 수}
+    """
+    added = [(term, delta) for term, delta in deltas.items() if delta > 0]
+    removed = defaultdict(list)
+    for term, delta in deltas.items():
+        if delta < 0:
+            removed[-delta].append(term)
+    if added:
+        table = connection.ops.quote_name(SearchTerm._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {table} (term, df) VALUES (%s, %s) "
+                f"ON CONFLICT (term) DO UPDATE SET df = {table}.df + excluded.df",
+                added,
+            )
+    for delta, terms in removed.items():
+        SearchTerm.objects.filter(term__in=terms).update(
+            df=Greatest(F("df") - delta, 0)
+        )
+    if removed:
+        SearchTerm.objects.filter(
+            term__in=[term for terms in removed.values() for term in terms], df__lte=0
+        ).delete()
+
+
+def index_post(post):
+    """
+    게시물의 색인 항목을 새로 계산해 교체하고 토큰별 문서 빈도를 고칩니다.
+
+    Args:
+        post (Post): 색인할 게시물
+    """
+    weights = build_postings(post)
+    with transaction.atomic():
+        postings = SearchPosting.objects.filter(post=post)
+        old_terms = set(postings.values_list("term", flat=True))
+        postings.delete()
+        SearchPosting.objects.bulk_create(
+            SearchPosting(term=term, post=post, weight=weight)
+            for term, weight in weights.items()
+        )
+        deltas = dict.fromkeys(weights.keys() - old_terms, 1)
+        deltas.update(dict.fromkeys(old_terms - weights.keys(), -1))
+        adjust_document_frequency(deltas)
+
+
+def unindex_post(post):
+    """
+    게시물이 삭제되기 전에 그 게시물의 토큰별 문서 빈도를 줄입니다.
+    (색인 항목 자체는 게시물과 함께 CASCADE 로 지워집니다)
+
+    Args:
+        post (Post): 삭제할 게시물
+    """
+    terms = SearchPosting.objects.filter(post=post).values_list("term", flat=True)
+    adjust_document_frequency(dict.fromkeys(terms, -1))
+
+
+def rebuild_document_frequency():
+    """색인 항목 전체로 토큰별 문서 빈도를 다시 계산합니다."""
+    rows = (
+        SearchPosting.objects.values("term")
+        .annotate(df=Count("post"))
+        .values_list("term", "df")
+    )
+    with transaction.atomic():
+        SearchTerm.objects.all().delete()
+        SearchTerm.objects.bulk_create(
+            (SearchTerm(term=term, df=df) for term, df in rows.iterator()),
+            batch_size=1000,
+        )
+
+
+def rebuild_index(chunk_size=500):
+    """
+    모든 게시물의 검색 색인을 다시 만듭니다.
+
+    게시물 chunk_size 개씩 한 트랜잭션에서 기존 항목을 지우고 새 항목을 넣으므로
+    다시 만드는 중이나 중간에 실패해도 색인이 비지 않습니다. (각 게시물은 이전
+    항목이나 새 항목 중 하나를 온전히 가집니다)
+
+    Args:
+        chunk_size (int): 한 트랜잭션에서 처리할 게시물 수
+
+    Returns:
+        int: 색인한 게시물 수
+    """
+    count = 0
+    last_pk = 0
+    while True:
+        posts = list(
+            Post.objects.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .prefetch_related("tags")[:chunk_size]
+        )
+        if not posts:
+            break
+        postings = [
+            SearchPosting(term=term, post=post, weight=weight)
+            for post in posts
+            for term, weight in build_postings(post).items()
+        ]
+        with transaction.atomic():
+            SearchPosting.objects.filter(post__in=posts).delete()
+            SearchPosting.objects.bulk_create(postings, batch_size=chunk_size)
+        count += len(posts)
+        last_pk = posts[-1].pk
+    # 지금은 없는 게시물의 항목은 CASCADE 로 이미 지워졌습니다.
+    rebuild_document_frequency()
+    return count
+
+
+def _resolve_terms(tokens):
+    """
+    검색어 토큰마다 찾아볼 색인 토큰과 문서 빈도를 구합니다.
+
+    색인에 그대로 있는 토큰은 그 토큰만, 없는 영문/숫자 토큰은 그 토큰으로 시작하는
+    색인 토큰(문서 빈도가 높은 MAX_PREFIX_TERMS 개)으로 바꿉니다. ("djan" -> "django")
+
+    Returns:
+        list: 토큰마다 [(색인 토큰, 문서 빈도), ...]. 찾을 토큰이 없으면 빈 리스트
+    """
+    known = dict(
+        SearchTerm.objects.filter(term__in=tokens, df__gt=0).values_list("term", "df")
+    )
+    groups = []
+    for token in tokens:
+        if token in known:
+            groups.append([(token, known[token])])
+        elif _is_hangul(token):
+            groups.append([])
+        else:
+            groups.append(
+                list(
+                    SearchTerm.objects.filter(
+                        term__gte=token, term__lt=token + chr(0x10FFFF), df__gt=0
+                    )
+                    .order_by("-df")
+                    .values_list("term", "df")[:MAX_PREFIX_TERMS]
+                )
+            )
+    return groups
+
+
+def search_posts(query, queryset=None):
+    """
+    역색인을 이용해 검색어의 모든 토큰을 포함한 게시물을 관련도 순으로 반환합니다.
+
+    관련도는 토큰별 가중치에 IDF(역문서 빈도)를 곱한 값의 합이고, 문서 빈도는
+    SearchTerm 에 미리 계산해 둡니다. 가장 드문 토큰의 색인 항목에서 출발해 나머지
+    토큰은 게시물마다 (term, post) 색인으로 한 행씩 확인합니다.
+    토큰이 하나면 IDF 가 모든 결과에 같으므로 가중치만으로 정렬해
+    (term, weight, post) 색인을 순서대로 읽다가 한 페이지에서 멈춥니다.
+
+    Args:
+        query (str): 검색어
+        queryset (QuerySet, optional): 검색 대상 게시물 쿼리셋 (기본값: 전체 게시물)
+
+    Returns:
+        QuerySet: search_score 로 주석 처리되어 관련도 순으로 정렬된 게시물 쿼리셋
+    """
+    if queryset is None:
+        queryset = Post.objects.all()
+    # 결과가 없어도 search_score 로 정렬할 수 있도록 주석을 붙여 둡니다.
+    no_match = queryset.annotate(
+        search_score=Value(0.0, output_field=FloatField())
+    ).none()
+    tokens = sorted(set(tokenize(query)))
+    if not tokens:
+        return no_match
+    groups = _resolve_terms(tokens)
+    if not all(groups):
+        # 색인에 없는 토큰이 하나라도 있으면 모든 토큰을 포함한 게시물은 없습니다.
+        return no_match
+
+    # 드문 토큰부터 조인해 후보를 먼저 줄입니다.
+    groups.sort(key=lambda terms: sum(df for _, df in terms))
+    if len(groups) == 1 and len(groups[0]) == 1:
+        return (
+            queryset.filter(searchposting__term=groups[0][0][0])
+            .annotate(search_score=F("searchposting__weight"))
+            .order_by("-search_score", "-pk")
+        )
+
+    total = Post.objects.count() or 1
+    score = Value(0.0)
+    for index, terms in enumerate(groups):
+        if len(terms) == 1:
+            # 토큰마다 (term, post) 색인으로 한 행만 찾는 조인을 붙입니다.
+            term, df = terms[0]
+            alias = f"search_term_{index}"
+            queryset = queryset.annotate(
+                **{
+                    alias: FilteredRelation(
+                        "searchposting", condition=Q(searchposting__term=term)
+                    )
+                }
+            ).filter(**{f"{alias}__isnull": False})
+            score += F(f"{alias}__weight") * math.log(1 + total / df)
+            continue
+        # 접두어로 확장된 토큰은 한 게시물에 여러 항목이 있을 수 있어 조인 대신 IN 을 씁니다.
+        postings = SearchPosting.objects.filter(term__in=[term for term, _ in terms])
+        idf = Case(
+            *[When(term=term, then=math.log(1 + total / df)) for term, df in terms],
+            output_field=FloatField(),
+        )
+        queryset = queryset.filter(pk__in=postings.values("post"))
+        score += Subquery(
+            postings.filter(post=OuterRef("pk"))
+            .values("post")
+            .annotate(score=Sum(F("weight") * idf, output_field=FloatField()))
+            .values("score"),
+            output_field=FloatField(),
+        )
+    return queryset.annotate(
+        search_score=ExpressionWrapper(score, output_field=FloatField())
+    ).order_by("-search_score", "-pk")
@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Category, Post
+
+SIDEBAR_CACHE_KEY = "blog_page:category_sidebar"
+
+
+def get_category_sidebar():
+    """
+    카테고리 사이드바 데이터를 반환합니다.
+
+    카테고리 목록과 카테고리별 발행 게시물 수는 자주 바뀌지 않으므로 캐시에 두고,
+    게시물/카테고리가 바뀔 때 시그널(signals.py)로만 무효화합니다.
+
+    Returns:
+        dict: categories(이름, 슬러그, 게시물 수 목록)와 no_category_post_count
+    """
+    sidebar = cache.get(SIDEBAR_CACHE_KEY)
+    if sidebar is None:
+        published = Q(post__status="published")
+        categories = (
+            Category.objects.annotate(post_count=Count("post", filter=published))
+            .order_by("-name")
+            .values("name", "slug", "post_count")
+        )
+        sidebar = {
+            "categories": list(categories),
+            "no_category_post_count": Post.objects.filter(
+                category=None, status="published"
+            ).count(),
+        }
+        cache.set(SIDEBAR_CACHE_KEY, sidebar, None)
+    return sidebar
+
+
+def invalidate_category_sidebar():
+    """캐시된 카테고리 사이드바 데이터를 지웁니다."""
+    cache.delete(SIDEBAR_CACHE_KEY)
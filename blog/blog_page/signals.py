@@ -0,0 +1,440 @@
+import threading
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from .feeds import LATEST_SCOPE, category_scope, invalidate_feeds, tag_scope
+from .images import delete_derivatives, schedule_post_image
+from .models import BLOB_FIELDS, Bookmark, Category, Comment, Like, Post, Tag
+from .page_cache import invalidate_pages
+from .recommend import schedule_related_posts
+from .search import index_post, unindex_post
+from .sidebar import invalidate_category_sidebar
+from .sitemaps import invalidate_sitemap
+from .storage import acquire_blobs, release_blobs
+from .tag_index import adjust_tag_counts, invalidate_tag_index
+from .trending import event_weight, record_event, score_update
+
+SEARCH_FIELDS = {"title", "content"}
+
+# 게시물 카운터 컬럼과 그 값을 바꾸는 모델
+COUNTER_FIELDS = {
+    Like: "likes_count",
+    Bookmark: "bookmarks_count",
+    Comment: "comments_count",
+}
+
+
+# 인기 점수(trending.py)에 반영하는 모델과 이벤트 종류
+TRENDING_EVENTS = {Like: "like", Comment: "comment"}
+
+
+def _adjust_counter(instance, delta):
+    """
+    게시물의 카운터 컬럼을 F() 표현식으로 delta 만큼 바꿉니다.
+
+    좋아요/댓글이면 같은 UPDATE 에서 인기 점수도 바꿉니다. 삭제될 때는 그 이벤트가
+    더했던 만큼(지금까지 감쇠된 값)을 뺍니다.
+    """
+    field = COUNTER_FIELDS[type(instance)]
+    values = {field: F(field) + delta}
+    event = TRENDING_EVENTS.get(type(instance))
+    if event is not None:
+        occurred = instance.created_at if delta < 0 else None
+        values["trending_score"] = score_update(event_weight(event) * delta, occurred)
+    Post.objects.filter(pk=instance.post_id).update(**values)
+
+
+@receiver(post_save, sender=Like)
+@receiver(post_save, sender=Bookmark)
+@receiver(post_save, sender=Comment)
+def increase_post_counter(sender, instance, created, **kwargs):
+    """좋아요/북마크/댓글이 생기면 게시물 카운터를 1 늘립니다."""
+    if created:
+        _adjust_counter(instance, 1)
+
+
+@receiver(post_delete, sender=Like)
+@receiver(post_delete, sender=Bookmark)
+@receiver(post_delete, sender=Comment)
+def decrease_post_counter(sender, instance, **kwargs):
+    """좋아요/북마크/댓글이 삭제되면 게시물 카운터를 1 줄입니다."""
+    _adjust_counter(instance, -1)
+
+
+def _schedule_related_posts(post):
+    """커밋 후 게시물의 관련 게시물(recommend.py) 갱신을 예약합니다."""
+    post_id = post.pk
+    transaction.on_commit(lambda: schedule_related_posts(post_id))
+
+
+# 커밋을 기다리는 검색 색인 갱신 (스레드마다 DB 연결이 따로 있으므로 스레드별로 둡니다)
+_search_index = threading.local()
+
+
+def _schedule_index(*post_ids):
+    """
+    커밋 후 게시물의 검색 색인 갱신을 예약합니다.
+
+    한 트랜잭션에서 제목 저장, 태그 추가 등으로 여러 번 불려도 커밋 후 게시물마다
+    한 번만 색인합니다. 트랜잭션 밖이면 바로 색인합니다.
+    """
+    if not hasattr(_search_index, "pending"):
+        _search_index.pending = set()
+    _search_index.pending.update(post_ids)
+    transaction.on_commit(_run_search_index)
+
+
+def _run_search_index():
+    """예약된 게시물을 커밋된 내용으로 색인합니다. 먼저 실행된 콜백이 모두 처리합니다."""
+    post_ids, _search_index.pending = _search_index.pending, set()
+    if not post_ids:
+        return
+    # 그 사이 삭제된 게시물은 색인도 CASCADE 로 지워졌으므로 건너뜁니다.
+    for post in Post.objects.filter(pk__in=post_ids).prefetch_related("tags"):
+        index_post(post)
+
+
+@receiver(post_save, sender=Post)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    """게시물의 제목이나 본문이 저장되면 검색 색인 갱신을 예약합니다."""
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    _schedule_index(instance.pk)
+    _schedule_related_posts(instance)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_search_index_on_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """게시물의 태그가 바뀌면 검색 색인 갱신을 예약합니다."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _schedule_index(instance.pk)
+        _schedule_related_posts(instance)
+    elif pk_set:
+        _schedule_index(*pk_set)
+
+
+@receiver(pre_delete, sender=Post)
+def update_search_terms_on_post_delete(sender, instance, **kwargs):
+    """게시물이 삭제되면 색인 항목이 CASCADE 로 지워지기 전에 토큰별 문서 빈도를 줄입니다."""
+    unindex_post(instance)
+
+
+@receiver(post_init, sender=Tag)
+def remember_tag_name(sender, instance, **kwargs):
+    """불러온 시점의 태그 이름을 기억해 둡니다."""
+    instance._indexed_name = instance.__dict__.get("name")
+
+
+@receiver(post_save, sender=Tag)
+def update_search_index_on_tag_rename(sender, instance, created, **kwargs):
+    """태그 이름이 바뀐 경우에만 그 태그가 달린 게시물의 검색 색인 갱신을 예약합니다."""
+    renamed = not created and instance.name != instance._indexed_name
+    instance._indexed_name = instance.name
+    if renamed:
+        _schedule_index(*instance.post_set.values_list("pk", flat=True))
+
+
+def _invalidate_feeds(post_ids, category_ids=(), tag_ids=()):
+    """
+    바뀐 발행 게시물이 들어가는 피드(feeds.py)와 게시물의 피드 항목을 무효화합니다.
+
+    커밋 전에 다른 요청이 이전 데이터로 피드를 다시 만들 수 있으므로
+    커밋 후에 한 번 더 무효화합니다.
+
+    Args:
+        post_ids (iterable): 바뀐 게시물의 기본 키
+        category_ids (iterable): 게시물이 속한(속했던) 카테고리의 기본 키
+        tag_ids (iterable): 게시물에 달린(달렸던) 태그의 기본 키 (서브쿼리도 가능)
+    """
+    post_ids = list(post_ids)
+    scopes = [LATEST_SCOPE]
+    scopes += map(
+        category_scope,
+        Category.objects.filter(pk__in=category_ids).values_list("slug", flat=True),
+    )
+    scopes += map(
+        tag_scope, Tag.objects.filter(pk__in=tag_ids).values_list("slug", flat=True)
+    )
+    invalidate_feeds(*scopes, post_ids=post_ids)
+    transaction.on_commit(lambda: invalidate_feeds(*scopes, post_ids=post_ids))
+
+
+def _invalidate_sitemap(section, *pks):
+    """사이트맵(sitemaps.py)에서 객체가 들어 있는 조각을 지금과 커밋 후에 무효화합니다."""
+    invalidate_sitemap(section, *pks)
+    transaction.on_commit(lambda: invalidate_sitemap(section, *pks))
+
+
+def _sidebar_state(post):
+    """사이드바 게시물 수에 영향을 주는 (카테고리, 발행 여부) 값을 반환합니다."""
+    # 지연 로딩(defer)된 필드를 건드려 추가 쿼리가 나가지 않도록 __dict__ 에서 읽습니다.
+    return (
+        post.__dict__.get("category_id"),
+        post.__dict__.get("status") == "published",
+    )
+
+
+@receiver(post_init, sender=Post)
+def remember_sidebar_state(sender, instance, **kwargs):
+    """불러온 시점의 카테고리와 발행 여부를 기억해 둡니다."""
+    instance._sidebar_state = _sidebar_state(instance)
+
+
+@receiver(post_save, sender=Post)
+def invalidate_sidebar_on_post_save(sender, instance, created, **kwargs):
+    """
+    게시물의 카테고리나 발행 여부가 바뀐 경우에만 사이드바 캐시를 지웁니다.
+    발행 여부가 바뀌면 게시물에 달린 태그의 게시물 수도 고치고,
+    새로 발행되면 인기 점수에 발행 이벤트를 더합니다.
+    발행된(또는 발행이 취소된) 게시물이면 그 게시물이 들어가는 피드와 사이트맵 조각을
+    무효화합니다.
+    """
+    state = _sidebar_state(instance)
+    previous = (None, False) if created else instance._sidebar_state
+    if state != previous:
+        invalidate_category_sidebar()
+        _invalidate_pages(site=True)
+    if not created and state[1] != previous[1]:
+        _adjust_post_tag_counts(instance, 1 if state[1] else -1)
+    if state[1] and not previous[1]:
+        # 새로 발행된 게시물이 이벤트가 쌓이기 전에도 인기 목록에 보이도록 합니다.
+        record_event(instance.pk, "publish")
+    if state[1] or previous[1]:
+        tag_ids = () if created else instance.tags.values("pk")
+        _invalidate_feeds([instance.pk], {state[0], previous[0]}, tag_ids)
+        _invalidate_sitemap("posts", instance.pk)
+    instance._sidebar_state = state
+
+
+@receiver(pre_delete, sender=Post)
+def update_tag_index_on_post_delete(sender, instance, **kwargs):
+    """
+    발행된 게시물이 삭제되면 태그 연결이 지워지기 전에 태그별 게시물 수를 줄이고
+    게시물이 들어가 있던 피드와 사이트맵 조각을 무효화합니다.
+    """
+    if instance._sidebar_state[1]:
+        _adjust_post_tag_counts(instance, -1)
+        _invalidate_feeds(
+            [instance.pk], [instance._sidebar_state[0]], instance.tags.values("pk")
+        )
+        _invalidate_sitemap("posts", instance.pk)
+
+
+@receiver(post_delete, sender=Post)
+def invalidate_sidebar_on_post_delete(sender, instance, **kwargs):
+    """발행된 게시물이 삭제되면 사이드바 캐시를 지웁니다."""
+    if instance._sidebar_state[1]:
+        invalidate_category_sidebar()
+        _invalidate_pages(site=True)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_sidebar_on_category_change(sender, **kwargs):
+    """카테고리가 추가/수정/삭제되면 사이드바 캐시를 지웁니다."""
+    invalidate_category_sidebar()
+    _invalidate_pages(site=True)
+
+
+def _adjust_tag_counts(deltas):
+    """커밋 후 캐시된 태그 색인(tag_index.py)의 게시물 수를 고칩니다."""
+    transaction.on_commit(lambda: adjust_tag_counts(deltas))
+
+
+def _adjust_post_tag_counts(post, delta):
+    """게시물에 달린 모든 태그의 게시물 수를 delta 만큼 고칩니다."""
+    tag_ids = post.tags.values_list("pk", flat=True)
+    _adjust_tag_counts(dict.fromkeys(tag_ids, delta))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_tag_index_on_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """발행된 게시물의 태그가 바뀌면 바뀐 태그의 게시물 수와 피드만 고칩니다."""
+    if action == "pre_clear" and not reverse:
+        # clear() 는 post_clear 에 지워진 태그를 알려주지 않으므로 미리 기억해 둡니다.
+        instance._cleared_tag_ids = list(instance.tags.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    delta = 1 if action == "post_add" else -1
+    if not reverse:
+        if not _sidebar_state(instance)[1]:
+            return
+        tag_ids = instance._cleared_tag_ids if action == "post_clear" else pk_set
+        _adjust_tag_counts(dict.fromkeys(tag_ids, delta))
+        _invalidate_feeds([instance.pk], (), tag_ids)
+    elif action == "post_clear":
+        transaction.on_commit(invalidate_tag_index)
+        transaction.on_commit(lambda: invalidate_feeds(site=True))
+    elif pk_set:
+        published = list(
+            Post.objects.filter(pk__in=pk_set, status="published").values_list(
+                "pk", flat=True
+            )
+        )
+        _adjust_tag_counts({instance.pk: delta * len(published)})
+        if published:
+            _invalidate_feeds(published, (), [instance.pk])
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_index_on_tag_change(sender, **kwargs):
+    """태그가 추가/수정/삭제되면 태그 색인을 다시 만들도록 지웁니다."""
+    invalidate_tag_index()
+    transaction.on_commit(invalidate_tag_index)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_feeds_on_taxonomy_change(sender, **kwargs):
+    """태그/카테고리가 추가/수정/삭제되면 이름이 들어간 모든 피드와 피드 항목을 무효화합니다."""
+    invalidate_feeds(site=True)
+    transaction.on_commit(lambda: invalidate_feeds(site=True))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_sitemap_on_taxonomy_change(sender, instance, **kwargs):
+    """태그/카테고리가 추가/수정/삭제되면 그 태그/카테고리가 들어 있는 사이트맵 조각을 무효화합니다."""
+    _invalidate_sitemap("tags" if sender is Tag else "categories", instance.pk)
+
+
+def _invalidate_pages(*post_ids, site=False):
+    """
+    익명 사용자 페이지 캐시(page_cache.py)를 무효화합니다.
+
+    커밋 전에 다른 요청이 이전 데이터로 페이지를 다시 캐시할 수 있으므로
+    커밋 후에 한 번 더 무효화합니다.
+    """
+    invalidate_pages(*post_ids, site=site)
+    transaction.on_commit(lambda: invalidate_pages(*post_ids, site=site))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_pages(sender, instance, **kwargs):
+    """게시물이 저장/삭제되면 게시물 상세와 목록 페이지 캐시를 무효화합니다."""
+    _invalidate_pages(instance.pk)
+
+
+@receiver(post_save, sender=Like)
+@receiver(post_save, sender=Bookmark)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Like)
+@receiver(post_delete, sender=Bookmark)
+@receiver(post_delete, sender=Comment)
+def invalidate_pages_on_interaction(sender, instance, **kwargs):
+    """좋아요/북마크/댓글이 바뀌면 해당 게시물과 목록 페이지 캐시를 무효화합니다."""
+    _invalidate_pages(instance.post_id)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_pages_on_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """게시물의 태그가 바뀌면 해당 게시물과 목록 페이지 캐시를 무효화합니다."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _invalidate_pages(instance.pk)
+    elif pk_set:
+        _invalidate_pages(*pk_set)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_pages_on_tag_change(sender, **kwargs):
+    """태그가 추가/수정/삭제되면 모든 페이지 캐시를 무효화합니다."""
+    _invalidate_pages(site=True)
+
+
+def _head_image_name(post):
+    """지연 로딩된 필드를 건드리지 않고 대표 이미지 경로를 반환합니다."""
+    value = post.__dict__.get("head_image")
+    return getattr(value, "name", value) or ""
+
+
+@receiver(post_init, sender=Post)
+def remember_head_image(sender, instance, **kwargs):
+    """불러온 시점의 대표 이미지 경로를 기억해 둡니다."""
+    instance._head_image_name = _head_image_name(instance)
+
+
+@receiver(post_save, sender=Post)
+def process_head_image(sender, instance, created, **kwargs):
+    """대표 이미지가 바뀌면 이전 파생 이미지를 지우고 새 파생 이미지 생성을 예약합니다."""
+    name = _head_image_name(instance)
+    if name == instance._head_image_name:
+        return
+    instance._head_image_name = name
+    if instance.head_image_variants:
+        old_variants = instance.head_image_variants
+        instance.head_image_variants = {}
+        Post.objects.filter(pk=instance.pk).update(head_image_variants={})
+        transaction.on_commit(lambda: delete_derivatives(old_variants))
+    if name:
+        post_id = instance.pk
+        transaction.on_commit(lambda: schedule_post_image(post_id, name))
+
+
+@receiver(post_delete, sender=Post)
+def delete_head_image_variants(sender, instance, **kwargs):
+    """게시물이 삭제되면 대표 이미지의 파생 이미지도 삭제합니다."""
+    variants = instance.__dict__.get("head_image_variants")
+    if variants:
+        transaction.on_commit(lambda: delete_derivatives(variants))
+
+
+def _blob_names(post):
+    """지연 로딩된 필드를 건드리지 않고 파일 필드별 스토리지 경로를 반환합니다."""
+    names = {}
+    for field in BLOB_FIELDS:
+        if field in post.__dict__:
+            value = post.__dict__[field]
+            names[field] = getattr(value, "name", value) or ""
+    return names
+
+
+@receiver(post_init, sender=Post)
+def remember_blobs(sender, instance, **kwargs):
+    """불러온 시점의 첨부 파일/대표 이미지 경로를 기억해 둡니다."""
+    instance._blob_names = _blob_names(instance)
+
+
+@receiver(post_save, sender=Post)
+def update_blob_references(sender, instance, created, **kwargs):
+    """첨부 파일/대표 이미지가 바뀌면 새 블롭의 참조 수를 늘리고 이전 블롭의 참조 수를 줄입니다."""
+    previous = {} if created else instance._blob_names
+    current = _blob_names(instance)
+    acquired, released = [], []
+    for field, name in current.items():
+        # 저장 후 지연 로딩된 필드는 이전 값을 모르므로 건드리지 않습니다.
+        if not created and field not in previous:
+            continue
+        old = previous.get(field, "")
+        if name != old:
+            acquired.append(name)
+            released.append(old)
+    acquire_blobs(*acquired)
+    release_blobs(*released)
+    instance._blob_names = current
+
+
+@receiver(post_delete, sender=Post)
+def release_blobs_on_delete(sender, instance, **kwargs):
+    """게시물이 삭제되면 첨부 파일/대표 이미지 블롭의 참조 수를 줄입니다."""
+    release_blobs(*_blob_names(instance).values())
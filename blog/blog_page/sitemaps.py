@@ -0,0 +1,228 @@
+import gzip
+import hashlib
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Max
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.html import escape
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+
+from .models import Category, Post, Tag
+from .page_cache import _version
+from .replicas import hold_primary
+
+# 사이트맵 구역별 대상 (구역 이름: get_absolute_url 과 lastmod 에 필요한 필드만 읽는 쿼리셋)
+SITEMAP_SECTIONS = {
+    "posts": lambda: Post.objects.filter(status="published").only("updated_at"),
+    "categories": lambda: Category.objects.filter(is_public=True).only(
+        "slug", "updated_at"
+    ),
+    "tags": lambda: Tag.objects.filter(is_public=True).only("slug", "updated_at"),
+}
+
+# 사이트맵 버전(마지막 변경 시각) 키
+INDEX_VERSION_KEY = "sitemaps:version:index"
+SHARD_VERSION_KEY = "sitemaps:version:{section}:{shard}"
+SITEMAP_KEY = "sitemaps:document:{digest}"
+
+# 기본 키의 최댓값 (64비트 정수). 이보다 큰 범위의 조각 번호는 404 로 응답합니다.
+MAX_PK = 2**63 - 1
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+URLSET_START = (
+    f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+)
+URLSET_END = "</urlset>\n"
+
+
+def _shard_size():
+    """조각 하나에 들어가는 기본 키 범위(SITEMAP_SHARD_SIZE)를 반환합니다."""
+    return getattr(settings, "SITEMAP_SHARD_SIZE", 10000)
+
+
+def invalidate_sitemap(section, *pks):
+    """
+    객체가 바뀐 사이트맵 조각과 색인을 무효화합니다.
+
+    조각은 기본 키 범위로 나뉘므로 바뀐 객체가 들어 있는 조각만 다시 만듭니다.
+
+    Args:
+        section (str): SITEMAP_SECTIONS 의 구역 이름
+        *pks (int): 바뀐(추가/삭제 포함) 객체의 기본 키
+    """
+    now = time.time()
+    versions = {
+        SHARD_VERSION_KEY.format(section=section, shard=pk // _shard_size()): now
+        for pk in pks
+    }
+    versions[INDEX_VERSION_KEY] = now
+    cache.set_many(versions, None)
+    # 복제본이 따라잡기 전에 이전 내용으로 사이트맵이 다시 만들어지지 않도록 합니다.
+    hold_primary()
+
+
+def _build_index(request):
+    """각 구역에서 객체가 있는 조각마다 항목이 하나씩 있는 사이트맵 색인(XML)을 만듭니다."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<sitemapindex xmlns="{SITEMAP_NS}">',
+    ]
+    for section, queryset in SITEMAP_SECTIONS.items():
+        # 조각별 마지막 수정일을 GROUP BY 한 번으로 구합니다.
+        shards = (
+            queryset()
+            .annotate(shard=F("pk") / _shard_size())
+            .values("shard")
+            .annotate(lastmod=Max("updated_at"))
+            .order_by("shard")
+        )
+        for row in shards:
+            url = reverse(
+                "sitemap_section", kwargs={"section": section, "shard": row["shard"]}
+            )
+            lines.append(
+                f"<sitemap><loc>{escape(request.build_absolute_uri(url))}</loc>"
+                f"<lastmod>{row['lastmod'].isoformat()}</lastmod></sitemap>"
+            )
+    lines.append("</sitemapindex>")
+    return "\n".join(lines).encode()
+
+
+def _build_shard(request, section, shard):
+    """
+    구역의 조각 하나를 gzip 으로 압축한 사이트맵(XML)으로 만듭니다.
+
+    행을 청크 단위로 읽으면서 바로 압축하므로 조각 전체를 메모리에 올리지 않습니다.
+
+    Returns:
+        bytes or None: 압축된 사이트맵, 조각에 객체가 없으면 None
+    """
+    size = _shard_size()
+    objects = (
+        SITEMAP_SECTIONS[section]()
+        .filter(pk__gte=shard * size, pk__lt=(shard + 1) * size)
+        .order_by("pk")
+    )
+    base = request.build_absolute_uri("/").rstrip("/")
+    buffer = BytesIO()
+    count = 0
+    # mtime=0 으로 같은 내용이면 같은 바이트가 나오게 합니다.
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as output:
+        output.write(URLSET_START.encode())
+        for obj in objects.iterator(
+            chunk_size=getattr(settings, "SITEMAP_CHUNK_SIZE", 2000)
+        ):
+            output.write(
+                f"<url><loc>{escape(base + obj.get_absolute_url())}</loc>"
+                f"<lastmod>{obj.updated_at.isoformat()}</lastmod></url>\n".encode()
+            )
+            count += 1
+        output.write(URLSET_END.encode())
+    return buffer.getvalue() if count else None
+
+
+def _serve(request, version_key, build, content_type):
+    """
+    버전이 같으면 304 또는 캐시된 문서로, 바뀌었으면 새로 만든 문서로 응답합니다.
+
+    버전 키가 없으면 먼저 문서를 만들어 보고, 비어 있으면(범위 밖 조각) 캐시에
+    아무것도 쓰지 않고 404 로 응답합니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        version_key (str): 문서의 버전 키
+        build (callable): 문서(bytes)를 만드는 함수. 문서가 없으면 None
+        content_type (str): 응답의 Content-Type
+
+    Returns:
+        HttpResponse: 사이트맵 문서 또는 304 응답
+
+    Raises:
+        Http404: build 가 None 을 반환한 경우
+    """
+    version = cache.get(version_key)
+    document = None
+    if version is None:
+        # 없는 조각의 URL 마다 버전 키가 쌓이지 않도록 문서가 있을 때만 버전을 만듭니다.
+        document = build()
+        if document is None:
+            raise Http404("사이트맵 조각이 비어 있습니다.")
+        version = _version(version_key)
+    # 문서에 들어가는 절대 URL 이 다른 호스트끼리는 구분합니다.
+    digest = hashlib.md5(
+        f"{version!r}:{request.build_absolute_uri(request.path)}".encode()
+    ).hexdigest()
+    etag = f'"{digest}"'
+    last_modified = int(version)
+    key = SITEMAP_KEY.format(digest=digest)
+    timeout = getattr(settings, "SITEMAP_CACHE_TIMEOUT", 60 * 60 * 24)
+    if document is not None:
+        cache.set(key, document, timeout)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if document is None:
+            document = cache.get(key)
+        if document is None:
+            document = build()
+            if document is None:
+                raise Http404("사이트맵 조각이 비어 있습니다.")
+            cache.set(key, document, timeout)
+        response = HttpResponse(document, content_type=content_type)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    return response
+
+
+@require_safe
+def sitemap_index(request):
+    """
+    구역별 사이트맵 조각의 목록(사이트맵 색인)을 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+
+    Returns:
+        HttpResponse: 사이트맵 색인 XML 또는 304 응답
+    """
+    return _serve(
+        request,
+        INDEX_VERSION_KEY,
+        lambda: _build_index(request),
+        "application/xml; charset=utf-8",
+    )
+
+
+@require_safe
+def sitemap_section(request, section, shard):
+    """
+    구역(게시물, 카테고리, 태그)의 사이트맵 조각 하나를 gzip 으로 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        section (str): SITEMAP_SECTIONS 의 구역 이름
+        shard (int): 조각 번호 (기본 키 // SITEMAP_SHARD_SIZE)
+
+    Returns:
+        HttpResponse: gzip 으로 압축된 사이트맵 XML 또는 304 응답
+
+    Raises:
+        Http404: 없는 구역이거나 조각에 객체가 없는 경우
+    """
+    if section not in SITEMAP_SECTIONS:
+        raise Http404("없는 사이트맵 구역입니다.")
+    if shard > MAX_PK // _shard_size():
+        raise Http404("없는 사이트맵 조각입니다.")
+    return _serve(
+        request,
+        SHARD_VERSION_KEY.format(section=section, shard=shard),
+        lambda: _build_shard(request, section, shard),
+        "application/gzip",
+    )
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import F
+
+# 블롭 경로: blobs/ab/cd/<sha256><확장자>
+BLOB_PREFIX = "blobs"
+BLOB_NAME_RE = re.compile(r"^blobs/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.[0-9a-z]+)?$")
+# 업로드를 받는 동안의 임시 파일 위치 (원자적으로 옮길 수 있도록 같은 파일 시스템에 둡니다)
+STAGING_DIR = "blobs/.staging"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    파일 내용의 SHA-256 해시로 경로를 정해 같은 내용을 한 번만 저장하는 스토리지입니다.
+
+    업로드는 청크 단위로 임시 파일에 쓰면서 해시를 계산하므로 파일 전체를 메모리에
+    올리지 않습니다. 같은 블롭이 이미 있으면 임시 파일을 버리고 기존 경로를 돌려줍니다.
+    upload_to 로 정해진 경로는 확장자만 사용합니다.
+
+    블롭을 몇 개의 게시물이 참조하는지는 Blob 모델에 기록하고(acquire_blobs,
+    release_blobs), 참조가 없어진 블롭은 collect_blobs 로 지웁니다.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # 최종 경로는 _save 에서 내용으로 정해지므로 여기서는 그대로 둡니다.
+        return name
+
+    def _save(self, name, content):
+        _, ext = os.path.splitext(name)
+        ext = ext.lower() if re.fullmatch(r"\.[0-9A-Za-z]{1,10}", ext) else ""
+
+        staging = self.path(STAGING_DIR)
+        os.makedirs(staging, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=staging)
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    temp.write(chunk)
+
+            hexdigest = digest.hexdigest()
+            name = f"{BLOB_PREFIX}/{hexdigest[:2]}/{hexdigest[2:4]}/{hexdigest}{ext}"
+            path = self.path(name)
+            if os.path.exists(path):
+                # 수정 시각을 갱신해 collect_blobs 가 방금 재사용된 블롭을 지우지 않게 합니다.
+                os.utime(path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temp_path, self.file_permissions_mode)
+                os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return name
+
+
+def blob_storage():
+    """첨부 파일과 대표 이미지 원본에 쓰는 스토리지(STORAGES["blobs"])를 반환합니다."""
+    return storages["blobs"]
+
+
+def is_blob(name):
+    """스토리지 경로가 내용 주소 블롭인지 확인합니다. (이전 날짜별 경로는 False)"""
+    return bool(name) and BLOB_NAME_RE.match(name) is not None
+
+
+def acquire_blobs(*names):
+    """
+    블롭의 참조 수를 1씩 늘립니다. 처음 참조되는 블롭이면 Blob 행을 만듭니다.
+
+    Args:
+        *names (str): 새로 참조하게 된 스토리지 경로 (블롭이 아닌 경로는 무시합니다)
+    """
+    from .models import Blob
+
+    storage = blob_storage()
+    for name in filter(is_blob, names):
+        blob, _ = Blob.objects.get_or_create(
+            name=name, defaults={"size": storage.size(name)}
+        )
+        Blob.objects.filter(pk=blob.pk).update(references=F("references") + 1)
+
+
+def release_blobs(*names):
+    """
+    블롭의 참조 수를 1씩 줄이고, 커밋 후 참조가 없어진 블롭을 지우도록 예약합니다.
+
+    Args:
+        *names (str): 더 이상 참조하지 않는 스토리지 경로 (블롭이 아닌 경로는 무시합니다)
+    """
+    from .models import Blob
+
+    names = [name for name in names if is_blob(name)]
+    if not names:
+        return
+    for name in names:
+        Blob.objects.filter(name=name, references__gt=0).update(
+            references=F("references") - 1
+        )
+    transaction.on_commit(lambda: collect_blobs(names))
+
+
+def collect_blobs(names=None, grace=None):
+    """
+    참조가 없는 블롭 파일과 Blob 행을 지웁니다.
+
+    업로드 중인 요청이 방금 같은 블롭을 재사용했을 수 있으므로 파일 수정 시각이
+    grace 초 안쪽이면 남겨 두고, 다음 gc_blobs 실행에서 다시 확인합니다.
+
+    Args:
+        names (list, optional): 확인할 블롭 경로 (없으면 참조가 0인 모든 블롭)
+        grace (float, optional): 유예 시간(초), 기본값은 BLOB_GC_GRACE
+
+    Returns:
+        int: 지운 블롭 수
+    """
+    from .models import Blob
+
+    if grace is None:
+        grace = getattr(settings, "BLOB_GC_GRACE", 300)
+    storage = blob_storage()
+    orphans = Blob.objects.filter(references=0)
+    if names is not None:
+        orphans = orphans.filter(name__in=names)
+
+    deleted = 0
+    threshold = time.time() - grace
+    for blob in orphans.iterator():
+        try:
+            if os.path.getmtime(storage.path(blob.name)) > threshold:
+                continue
+        except FileNotFoundError:
+            pass
+        with transaction.atomic():
+            # 확인하는 사이에 다시 참조되었으면 지우지 않습니다.
+            if not Blob.objects.filter(pk=blob.pk, references=0).delete()[0]:
+                continue
+            storage.delete(blob.name)
+        deleted += 1
+    return deleted
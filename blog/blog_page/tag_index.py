@@ -0,0 +1,114 @@
+import heapq
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Tag
+
+TAG_INDEX_CACHE_KEY = "blog_page:tag_index"
+
+# 태그 구름의 글자 크기 단계 수 (weight 1 ~ TAG_CLOUD_STEPS)
+TAG_CLOUD_STEPS = 5
+
+
+def _build_tag_index():
+    """공개 태그별 발행 게시물 수를 한 번의 집계 쿼리로 계산합니다."""
+    tags = (
+        Tag.objects.filter(is_public=True)
+        .annotate(post_count=Count("post", filter=Q(post__status="published")))
+        .values_list("pk", "name", "slug", "post_count")
+    )
+    return {pk: [name, slug, count] for pk, name, slug, count in tags}
+
+
+def get_tag_index():
+    """
+    공개 태그별 발행 게시물 수를 반환합니다.
+
+    캐시에 두고, 게시물의 태그나 발행 여부가 바뀌면 시그널(signals.py)에서
+    adjust_tag_counts() 로 바뀐 태그의 수만 고칩니다. 태그 자체가 바뀌면 다시 만듭니다.
+    동시에 고치다 어긋난 값은 TAG_INDEX_TIMEOUT 이 지나면 다시 계산됩니다.
+
+    Returns:
+        dict: 태그 기본 키 -> [이름, 슬러그, 게시물 수]
+    """
+    index = cache.get(TAG_INDEX_CACHE_KEY)
+    if index is None:
+        index = _build_tag_index()
+        cache.set(
+            TAG_INDEX_CACHE_KEY, index, getattr(settings, "TAG_INDEX_TIMEOUT", 3600)
+        )
+    return index
+
+
+def adjust_tag_counts(deltas):
+    """
+    캐시된 태그 색인의 게시물 수를 바뀐 만큼만 고칩니다.
+
+    색인에 없는 태그(새로 만든 태그 등)가 있으면 색인을 지워 다음 요청에서 다시 만듭니다.
+
+    Args:
+        deltas (dict): 태그 기본 키 -> 게시물 수 변화량
+    """
+    deltas = {pk: delta for pk, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    index = cache.get(TAG_INDEX_CACHE_KEY)
+    if index is None:
+        return
+    if not deltas.keys() <= index.keys():
+        invalidate_tag_index()
+        return
+    for pk, delta in deltas.items():
+        index[pk][2] = max(0, index[pk][2] + delta)
+    cache.set(TAG_INDEX_CACHE_KEY, index, getattr(settings, "TAG_INDEX_TIMEOUT", 3600))
+
+
+def invalidate_tag_index():
+    """캐시된 태그 색인을 지웁니다."""
+    cache.delete(TAG_INDEX_CACHE_KEY)
+
+
+def get_tag_cloud(limit=None, steps=TAG_CLOUD_STEPS):
+    """
+    발행 게시물이 있는 공개 태그를 이름순으로, 게시물 수에 따른 가중치와 함께 반환합니다.
+
+    가중치는 게시물 수의 로그 값을 1 ~ steps 단계로 나눈 값이라 인기 태그 몇 개가
+    나머지를 모두 가장 작은 크기로 만들지 않습니다.
+
+    Args:
+        limit (int, optional): 게시물 수 상위 limit 개만 반환 (없으면 전체)
+        steps (int): 가중치 단계 수
+
+    Returns:
+        list: {"name", "slug", "post_count", "weight"} 딕셔너리 목록 (이름순)
+    """
+    tags = [
+        (count, name, slug)
+        for name, slug, count in get_tag_index().values()
+        if count > 0
+    ]
+    if limit is not None:
+        # 전체를 정렬하지 않고 상위 limit 개만 고릅니다.
+        tags = heapq.nsmallest(limit, tags, key=lambda tag: (-tag[0], tag[1]))
+    if not tags:
+        return []
+
+    low = math.log(min(count for count, _, _ in tags))
+    high = math.log(max(count for count, _, _ in tags))
+    spread = high - low
+    return [
+        {
+            "name": name,
+            "slug": slug,
+            "post_count": count,
+            "weight": (
+                1 + round((math.log(count) - low) / spread * (steps - 1))
+                if spread
+                else 1
+            ),
+        }
+        for count, name, slug in sorted(tags, key=lambda tag: tag[1])
+    ]
@@ -0,0 +1,86 @@
+from django import template
+
+from blog_page import sidebar
+from blog_page.images import VARIANT_GROUPS
+from blog_page.models import Post
+from blog_page.tag_index import get_tag_cloud
+from blog_page.trending import trending_posts
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def query_replace(context, key, value):
+    """
+    현재 요청의 GET 파라미터에서 key 값만 바꾼 쿼리 문자열을 반환합니다.
+
+    사용 예:
+        <a href="?{% query_replace 'cursor' page.next_cursor %}">다음</a>
+    """
+    query = context["request"].GET.copy()
+    query[key] = value
+    return query.urlencode()
+
+
+@register.simple_tag
+def get_category_sidebar():
+    """
+    캐시된 카테고리 사이드바 데이터를 반환합니다.
+
+    사용 예:
+        {% get_category_sidebar as sidebar %}
+        {% for category in sidebar.categories %}...{% endfor %}
+    """
+    return sidebar.get_category_sidebar()
+
+
+@register.inclusion_tag("blog_page/category_sidebar.html", takes_context=True)
+def category_sidebar(context, current=None):
+    """
+    카테고리 사이드바를 렌더링합니다.
+
+    사용 예:
+        {% category_sidebar current=category.slug %}
+    """
+    return {"sidebar": sidebar.get_category_sidebar(), "current": current}
+
+
+@register.inclusion_tag("blog_page/tag_cloud.html")
+def tag_cloud(limit=None):
+    """
+    캐시된 태그 색인으로 태그 구름을 렌더링합니다.
+
+    사용 예:
+        {% tag_cloud limit=20 %}
+    """
+    return {"tags": get_tag_cloud(limit=limit)}
+
+
+@register.inclusion_tag("blog_page/trending_sidebar.html")
+def trending_sidebar(limit=5):
+    """
+    인기 게시물 상위 limit 개를 렌더링합니다.
+
+    사용 예:
+        {% trending_sidebar 5 %}
+    """
+    return {"posts": trending_posts(limit, Post.objects.only("pk", "title"))}
+
+
+@register.inclusion_tag("blog_page/post_image.html")
+def post_image(post, group="list", css_class="post-image"):
+    """
+    게시물 대표 이미지를 WebP/JPEG srcset 이 포함된 <picture> 로 렌더링합니다.
+
+    사용 예:
+        {% post_image post "list" %}
+    """
+    _, sizes = VARIANT_GROUPS[group]
+    return {
+        "post": post,
+        "src": post.get_head_image_src(group),
+        "webp_srcset": post.get_head_image_srcset(group, "webp"),
+        "srcset": post.get_head_image_srcset(group, "fallback"),
+        "sizes": sizes,
+        "css_class": css_class,
+    }
@@ -1,3 +1,1996 @@
-from django.test import TestCase
+import base64
+import gzip
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.core.servers.basehttp import WSGIServer
+from django.db import connection
+from django.urls import resolve, reverse
+from django.http import HttpResponse
+from django.test import (
+    LiveServerTestCase,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.templatetags.static import static as static_url
+from django.test.testcases import LiveServerThread, QuietWSGIRequestHandler
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from accounts.models import CustomUser
+from .assets import _minify_css, _minify_js
+from .counters import ViewCountBuffer, view_counter
+from .instrumentation import (
+    QueryBudgetExceeded,
+    get_request_stats,
+    reset_request_stats,
+)
+from .feeds import FEED_ENTRY_KEY
+from .forms import PostForm
+from .media import MUTABLE_MAX_AGE
+from .models import (
+    Blob,
+    Bookmark,
+    Category,
+    Comment,
+    Like,
+    Post,
+    PostRecommendation,
+    SearchPosting,
+    SearchTerm,
+    Tag,
+)
+from .management.commands.sync_replica import Command as SyncReplicaCommand
+from .page_cache import invalidate_pages
+from .pagination import InvalidCursor, KeysetPaginator
+from .replicas import (
+    STICKY_COOKIE,
+    ReplicaRouter,
+    ReplicaRoutingMiddleware,
+    _current_request,
+)
+from .recommend import (
+    SparseTfidfIndex,
+    TfidfIndex,
+    rebuild_related_posts,
+    update_related_posts,
+)
+from .rendering import content_hash, render_content
+from .search import rebuild_index, search_posts, tokenize
+from .sidebar import SIDEBAR_CACHE_KEY, get_category_sidebar
+from .signals import _run_search_index
+from .storage import blob_storage, is_blob
+from .tag_index import TAG_INDEX_CACHE_KEY, get_tag_cloud, get_tag_index
+from .trending import event_weight, heat, initial_score, record_event, trending_posts
+
+
+class BlogTestMixin:
+    """
+    블로그 테스트가 함께 쓰는 준비 코드입니다.
+
+    테스트마다 캐시와 조회수 버퍼를 비우고, 글쓴이(self.user)의 게시물을 만드는 도우미를 둡니다.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        view_counter.clear()
+
+    @staticmethod
+    def create_user(username="writer"):
+        return CustomUser.objects.create_user(username=username, password="pw")
+
+    def create_post(self, title="제목", content="내용", status="published", **fields):
+        return Post.objects.create(
+            title=title, content=content, author=self.user, status=status, **fields
+        )
+
+    def use_temp_media_root(self):
+        """테스트가 끝나면 지워지는 임시 디렉터리를 MEDIA_ROOT 로 씁니다."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+
+class BlogTestCase(BlogTestMixin, TestCase):
+    """글쓴이(self.user)를 테스트 클래스마다 한 번만 만드는 TestCase 입니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = cls.create_user()
+
+
+@override_settings(BACKGROUND_WORKERS=0)
+class ViewCountBufferTest(BlogTestMixin, TransactionTestCase):
+    """조회수 쓰기 지연 버퍼 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user()
+        self.posts = [self.create_post(f"글 {i}", status="draft") for i in range(3)]
+
+    def test_concurrent_increments_are_not_lost(self):
+        buffer = ViewCountBuffer(threshold=7, interval=3600)
+        threads_count, views_per_thread = 8, 50
+
+        def worker():
+            try:
+                for i in range(views_per_thread):
+                    buffer.incr(self.posts[i % len(self.posts)].pk)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        buffer.flush()
+
+        total = sum(
+            Post.objects.values_list("views_count", flat=True).filter(
+                pk__in=[post.pk for post in self.posts]
+            )
+        )
+        self.assertEqual(total, threads_count * views_per_thread)
+        for post in self.posts:
+            self.assertEqual(buffer.pending(post.pk), 0)
+
+    def test_flush_command_applies_views_staged_by_another_process(self):
+        post = self.posts[0]
+        # 웹 서버 프로세스의 버퍼: 명령을 실행하는 프로세스의 view_counter 와 메모리를 나누지 않습니다.
+        web_process = ViewCountBuffer(interval=3600, timer=False)
+        for _ in range(5):
+            web_process.incr(post.pk)
+        self.assertEqual(view_counter.pending(post.pk), 0)
+        web_process.stage()
+        self.assertEqual(view_counter.pending(post.pk), 5)
+
+        output = StringIO()
+        call_command("flush_view_counts", stdout=output)
+
+        self.assertIn("5건", output.getvalue())
+        post.refresh_from_db()
+        self.assertEqual(post.views_count, 5)
+        self.assertEqual(web_process.pending(post.pk), 0)
+
+    def test_timer_flushes_quiet_posts(self):
+        post = self.posts[0]
+        buffer = ViewCountBuffer(interval=0.1, timer=True)
+        buffer.incr(post.pk)
+
+        # 타이머 스레드가 쓰는 동안 읽으면 테스트 DB(공유 캐시 메모리 DB)가 잠기므로
+        # 메모리의 조회수가 비워진 뒤 진행 중인 반영이 끝나기를 기다렸다가 읽습니다.
+        for _ in range(50):
+            if not buffer._pending:
+                break
+            time.sleep(0.05)
+        with buffer._flush_lock:
+            post.refresh_from_db()
+        self.assertEqual(post.views_count, 1)
+
+    @override_settings(VIEW_COUNT_FLUSH_THRESHOLD=2, VIEW_COUNT_FLUSH_INTERVAL=3600)
+    def test_shared_buffer_reads_settings_when_used(self):
+        post = self.posts[0]
+        view_counter.incr(post.pk)
+        view_counter.incr(post.pk)
+
+        post.refresh_from_db()
+        self.assertEqual(post.views_count, 2)
+
+    def test_threshold_flush_runs_in_background(self):
+        post = self.posts[0]
+        buffer = ViewCountBuffer(threshold=2, interval=3600, timer=False)
+        with mock.patch("blog_page.counters.run_in_background") as background:
+            buffer.incr(post.pk)
+            buffer.incr(post.pk)
+            buffer.incr(post.pk)
+
+        # 반영이 끝나기 전까지는 다음 조회가 작업을 또 예약하지 않습니다.
+        background.assert_called_once_with(buffer._flush_in_background)
+        post.refresh_from_db()
+        self.assertEqual(post.views_count, 0)
+
+        buffer._flush_in_background()
+        post.refresh_from_db()
+        self.assertEqual(post.views_count, 3)
+        self.assertFalse(buffer._flush_lock.locked())
+
+    def test_cache_eviction_does_not_lose_views(self):
+        post = self.posts[0]
+        buffer = ViewCountBuffer(interval=3600, timer=False)
+        buffer.incr(post.pk)
+        buffer.stage()
+        buffer.incr(post.pk)
+
+        cache.clear()
+        buffer.flush()
+
+        post.refresh_from_db()
+        self.assertEqual(post.views_count, 2)
+
+
+class PostDetailViewCountTest(BlogTestCase):
+    """게시물 상세 페이지 조회수 표시 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post()
+
+    def test_detail_shows_buffered_views_without_writing(self):
+        # 익명 사용자는 페이지 캐시를 거치므로 렌더링 결과를 보려면 로그인합니다.
+        self.client.force_login(self.post.author)
+        self.client.get(self.post.get_absolute_url())
+        response = self.client.get(self.post.get_absolute_url())
+
+        self.assertEqual(response.context["post"].views_count, 2)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views_count, 0)
+
+
+class CommentTreeTest(BlogTestCase):
+    """경로 기반 댓글 트리 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post()
+
+    def add_comment(self, parent=None):
+        return Comment.objects.create(
+            post=self.post, author=self.user, content="댓글", parent=parent
+        )
+
+    def test_path_and_depth_follow_parent(self):
+        root = self.add_comment()
+        reply = self.add_comment(parent=root)
+        nested = self.add_comment(parent=reply)
+
+        self.assertEqual(nested.depth, 2)
+        self.assertTrue(nested.path.startswith(reply.path + "/"))
+        self.assertEqual(list(root.get_descendants()), [reply, nested])
+
+    def test_deep_threads_keep_full_path(self):
+        root = comment = self.add_comment()
+        for _ in range(120):
+            comment = self.add_comment(parent=comment)
+
+        comment.refresh_from_db()
+        self.assertEqual(comment.depth, 120)
+        self.assertEqual(len(comment.path), 121 * (Comment.PATH_STEP_WIDTH + 1) - 1)
+        self.assertEqual(root.get_descendants().count(), 120)
+
+    def test_detail_query_count_does_not_grow_with_comments(self):
+        def detail_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(self.post.get_absolute_url())
+            return len(queries)
+
+        self.client.force_login(self.user)
+        root = self.add_comment()
+        self.add_comment(parent=root)
+        detail_queries()  # 사이드바 캐시 채우기
+        baseline = detail_queries()
+
+        for _ in range(5):
+            parent = self.add_comment()
+            for _ in range(3):
+                parent = self.add_comment(parent=parent)
+
+        self.assertEqual(detail_queries(), baseline)
+        tree = self.client.get(self.post.get_absolute_url()).context["comment_tree"]
+        self.assertEqual(len(tree), 6)
+        # 답글은 펼치기 전까지 수만 보여줍니다.
+        self.assertEqual([node["comment"].reply_count for node in tree], [1] + [3] * 5)
+        self.assertTrue(all(node["replies"] == [] for node in tree))
+
+    @override_settings(COMMENT_PAGE_SIZE=2)
+    def test_top_level_comments_are_paginated(self):
+        roots = [self.add_comment() for _ in range(5)]
+        self.add_comment(parent=roots[4])
+
+        response = self.client.get(self.post.get_absolute_url())
+        self.assertEqual(
+            [node["comment"] for node in response.context["comment_tree"]], roots[:2]
+        )
+        self.assertNotContains(response, f'id="comment-{roots[2].pk}"')
+
+        seen = []
+        url = response.context["comments_next"]
+        while url:
+            data = self.client.get(url).json()
+            seen += [
+                root.pk for root in roots if f'id="comment-{root.pk}"' in data["html"]
+            ]
+            url = data["next"]
+        self.assertEqual(seen, [root.pk for root in roots[2:]])
+        self.assertIn("답글 1개 보기", data["html"])
+
+    def test_replies_endpoint_renders_subtree(self):
+        root = self.add_comment()
+        reply = self.add_comment(parent=root)
+        nested = self.add_comment(parent=reply)
+        other = self.add_comment()
+
+        url = reverse(
+            "blog_page:comment_replies",
+            kwargs={"pk": self.post.pk, "comment_pk": root.pk},
+        )
+        data = self.client.get(url).json()
+        self.assertEqual(data["count"], 2)
+        self.assertIn(f'id="comment-{reply.pk}"', data["html"])
+        self.assertIn(f'id="comment-{nested.pk}"', data["html"])
+        self.assertNotIn(f'id="comment-{other.pk}"', data["html"])
+        self.assertNotIn(f'id="comment-{root.pk}"', data["html"])
+        self.assertIsNone(data["next"])
+
+        other_post = self.create_post("다른 글", status="draft")
+        response = self.client.get(
+            reverse(
+                "blog_page:comment_replies",
+                kwargs={"pk": other_post.pk, "comment_pk": root.pk},
+            )
+        )
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(COMMENT_PAGE_SIZE=2)
+    def test_replies_endpoint_is_paginated(self):
+        root = self.add_comment()
+        first = self.add_comment(parent=root)
+        nested = self.add_comment(parent=first)
+        deeper = self.add_comment(parent=nested)
+        second = self.add_comment(parent=root)
+        replies = [first, nested, deeper, second]
+
+        seen = []
+        url = reverse(
+            "blog_page:comment_replies",
+            kwargs={"pk": self.post.pk, "comment_pk": root.pk},
+        )
+        while url:
+            data = self.client.get(url).json()
+            page = [
+                reply for reply in replies if f'id="comment-{reply.pk}"' in data["html"]
+            ]
+            self.assertEqual(data["count"], len(page))
+            seen += page
+            url = data["next"]
+        self.assertEqual(seen, replies)
+        # 앞 페이지의 부모 아래에 붙일 수 있도록 부모 ID 를 함께 보냅니다.
+        self.assertIn(f'data-parent-id="{root.pk}"', data["html"])
+
+
+class SearchIndexTest(BlogTestCase):
+    """역색인 검색 테스트"""
+
+    def create_post(self, title, content, tags=()):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = super().create_post(title, content)
+            for name in tags:
+                post.tags.add(Tag.objects.create(name=name))
+        return post
+
+    def test_tokenize_splits_korean_into_bigrams(self):
+        self.assertEqual(tokenize("장고를 Django_4"), ["장고", "고를", "django", "4"])
+
+    def test_search_ranks_title_matches_first(self):
+        in_content = self.create_post("성능 이야기", "<p>장고 템플릿</p>")
+        in_title = self.create_post("장고 입문", "파이썬 웹 프레임워크")
+        self.create_post("무관한 글", "아무 내용")
+
+        self.assertEqual(list(search_posts("장고")), [in_title, in_content])
+
+    def test_index_follows_edits_and_tags(self):
+        post = self.create_post("제목", "내용", tags=["캐시"])
+        self.assertEqual(list(search_posts("캐시")), [post])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.title = "새 제목"
+            post.save()
+            post.tags.clear()
+        self.assertEqual(list(search_posts("캐시")), [])
+        self.assertEqual(list(search_posts("새 제목")), [post])
+
+    def test_index_is_rebuilt_once_per_transaction(self):
+        tags = [Tag.objects.create(name=name) for name in ("캐시", "장고")]
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                post = Post.objects.create(
+                    title="제목", content="내용", author=self.user
+                )
+                post.tags.add(*tags)
+                post.title = "새 제목"
+                post.save()
+
+        deletes = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('DELETE FROM "blog_page_searchposting"')
+        ]
+        self.assertEqual(len(deletes), 1)
+        self.assertEqual(list(search_posts("새 제목 장고")), [post])
+
+    def test_tag_save_reindexes_only_on_rename(self):
+        post = self.create_post("제목", "내용", tags=["캐시"])
+        tag = post.tags.get()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            tag.is_public = False
+            tag.save()
+        self.assertNotIn(_run_search_index, callbacks)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "버퍼"
+            tag.save()
+        self.assertEqual(list(search_posts("캐시")), [])
+        self.assertEqual(list(search_posts("버퍼")), [post])
+
+    def test_single_syllable_and_word_prefix_queries_match(self):
+        post = self.create_post("장고 입문", "django queryset")
+        self.create_post("무관한 글", "flask")
+
+        self.assertEqual(list(search_posts("장")), [post])
+        self.assertEqual(list(search_posts("djan")), [post])
+        self.assertEqual(list(search_posts("장 query")), [post])
+        self.assertEqual(list(search_posts("djx")), [])
+
+    def test_document_frequency_follows_index(self):
+        first = self.create_post("캐시", "django")
+        second = self.create_post("캐시 전략", "flask")
+        self.assertEqual(SearchTerm.objects.get(term="캐시").df, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.title = "전략"
+            second.save()
+        self.assertEqual(SearchTerm.objects.get(term="캐시").df, 1)
+
+        first.delete()
+        self.assertFalse(SearchTerm.objects.filter(term="캐시").exists())
+        self.assertFalse(SearchTerm.objects.filter(term="django").exists())
+
+    def test_rebuild_keeps_index_and_document_frequency(self):
+        posts = [self.create_post(f"장고 {i}", "본문") for i in range(3)]
+        postings = set(SearchPosting.objects.values_list("term", "post", "weight"))
+        terms = set(SearchTerm.objects.values_list("term", "df"))
+
+        self.assertEqual(rebuild_index(chunk_size=2), 3)
+
+        self.assertEqual(
+            set(SearchPosting.objects.values_list("term", "post", "weight")), postings
+        )
+        self.assertEqual(set(SearchTerm.objects.values_list("term", "df")), terms)
+        self.assertEqual(list(search_posts("장고")), posts[::-1])
+
+    def test_unindexed_query_returns_empty_page(self):
+        response = self.client.get("/blog/", {"q": "없는단어"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["posts"]), [])
+
+    def test_post_list_filters_by_query(self):
+        post = self.create_post("장고 검색", "본문")
+        self.create_post("다른 글", "본문")
+
+        response = self.client.get("/blog/", {"q": "검색"})
+        self.assertEqual(list(response.context["posts"]), [post])
+
+
+class PostCounterTest(BlogTestCase):
+    """게시물 좋아요/북마크/댓글 카운터 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post()
+        self.client.force_login(self.user)
+
+    def test_toggles_keep_counters_in_sync(self):
+        like_url = f"/blog/like/{self.post.pk}/"
+        ajax = {"HTTP_X_REQUESTED_WITH": "XMLHttpRequest"}
+
+        response = self.client.post(like_url, **ajax)
+        self.assertEqual(response.json()["likes_count"], 1)
+        self.client.post(f"/blog/bookmark/{self.post.pk}/", **ajax)
+        root = Comment.objects.create(post=self.post, author=self.user, content="a")
+        Comment.objects.create(
+            post=self.post, author=self.user, content="b", parent=root
+        )
+
+        self.post.refresh_from_db()
+        self.assertEqual(
+            (
+                self.post.likes_count,
+                self.post.bookmarks_count,
+                self.post.comments_count,
+            ),
+            (1, 1, 2),
+        )
+
+        self.client.post(like_url, **ajax)
+        root.delete()
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.likes_count, self.post.comments_count), (0, 0))
+
+    def test_list_query_count_does_not_depend_on_page_size(self):
+        def list_queries():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get("/blog/")
+            self.assertEqual(response.status_code, 200)
+            return len(queries)
+
+        Like.objects.create(user=self.user, post=self.post)
+        baseline = list_queries()
+
+        for i in range(10):
+            post = Post.objects.create(
+                title=f"글 {i}", content="내용", author=self.user, status="published"
+            )
+            post.tags.add(Tag.objects.create(name=f"태그{i}"))
+            Bookmark.objects.create(user=self.user, post=post)
+
+        self.assertEqual(list_queries(), baseline)
+        posts = self.client.get("/blog/").context["posts"]
+        self.assertTrue(all(post.is_bookmarked for post in posts[:10]))
+        self.assertTrue(posts[10].is_liked)
+
+
+class KeysetPaginationTest(BlogTestCase):
+    """커서 기반 페이지네이션 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts = [self.create_post(f"글 {i}") for i in range(25)]
+
+    def test_pages_walk_forward_and_back_without_gaps(self):
+        # 같은 created_at 을 가진 행이 있어도 pk 로 순서가 정해져야 합니다.
+        Post.objects.update(created_at=self.posts[0].created_at)
+        paginator = KeysetPaginator(
+            Post.objects.all(), ("-created_at", "-pk"), per_page=10
+        )
+
+        seen = []
+        pages = []
+        page = paginator.page()
+        while True:
+            pages.append(page)
+            seen.extend(post.pk for post in page)
+            if not page.has_next:
+                break
+            page = paginator.page(page.next_cursor)
+
+        self.assertEqual(seen, sorted((post.pk for post in self.posts), reverse=True))
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        previous = paginator.page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        self.assertTrue(previous.has_previous)
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        response = self.client.get("/blog/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["posts"][0], self.posts[-1])
+
+    def test_wrong_type_cursor_falls_back_to_first_page(self):
+        paginator = KeysetPaginator(Post.objects.all(), ("-created_at", "-pk"))
+        for values in (["x", "y"], [{"dt": "2024-01-01T00:00:00"}, "abc"], [1, [2]]):
+            payload = json.dumps({"v": values, "r": False}).encode()
+            cursor = base64.urlsafe_b64encode(payload).decode()
+            with self.assertRaises(InvalidCursor):
+                paginator.decode_cursor(cursor)
+            self.assertEqual(paginator.get_page(cursor)[0], self.posts[-1])
+
+        for params in ({"cursor": cursor}, {"q": "글", "cursor": cursor}):
+            response = self.client.get("/blog/", params)
+            self.assertEqual(response.status_code, 200)
+
+    def test_listing_views_render_cursor_links(self):
+        tag = Tag.objects.create(name="태그")
+        for post in self.posts:
+            post.tags.add(tag)
+            Bookmark.objects.create(user=self.user, post=post)
+        self.client.force_login(self.user)
+
+        for url in [
+            "/blog/",
+            "/blog/?q=글",
+            tag.get_absolute_url(),
+            "/accounts/profile/",
+        ]:
+            response = self.client.get(url)
+            self.assertContains(response, "cursor=")
+
+    def test_search_results_paginate_by_relevance(self):
+        first = self.client.get("/blog/", {"q": "글"}).context["page_obj"]
+        second = self.client.get(
+            "/blog/", {"q": "글", "cursor": first.next_cursor}
+        ).context["page_obj"]
+
+        self.assertEqual(len(first) + len(second), 24)
+        self.assertFalse({post.pk for post in first} & {post.pk for post in second})
+
+
+class CategorySidebarTest(BlogTestCase):
+    """카테고리 사이드바 캐시 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.create(name="장고", slug="django")
+
+    def test_sidebar_is_cached_between_requests(self):
+        self.create_post(category=self.category)
+        get_category_sidebar()
+
+        with self.assertNumQueries(0):
+            sidebar = get_category_sidebar()
+        self.assertEqual(sidebar["categories"][0]["post_count"], 1)
+
+    def test_only_relevant_changes_invalidate(self):
+        post = self.create_post(category=self.category)
+        get_category_sidebar()
+
+        post.title = "새 제목"
+        post.save()
+        self.assertIsNotNone(cache.get(SIDEBAR_CACHE_KEY))
+
+        post.category = None
+        post.save()
+        self.assertIsNone(cache.get(SIDEBAR_CACHE_KEY))
+        self.assertEqual(get_category_sidebar()["no_category_post_count"], 1)
+
+        Category.objects.create(name="파이썬", slug="python")
+        self.assertEqual(len(get_category_sidebar()["categories"]), 2)
+
+        Post.objects.get(pk=post.pk).delete()
+        self.assertEqual(get_category_sidebar()["no_category_post_count"], 0)
+
+    def test_category_page_renders_sidebar(self):
+        self.create_post(category=self.category)
+        response = self.client.get(self.category.get_absolute_url())
+        self.assertContains(response, 'class="category-link active"')
+
+
+class TagSyncTest(BlogTestCase):
+    """게시물 태그 일괄 동기화 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post(status="draft")
+
+    def save_with_tags(self, tag_string):
+        form = PostForm(
+            {"title": "제목", "content": "내용", "status": "draft", "tags": tag_string},
+            instance=self.post,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        return form.save()
+
+    def test_get_or_create_many_reuses_existing_and_slugs(self):
+        existing = Tag.objects.create(name="Django")
+        tags = Tag.get_or_create_many(["파이썬 웹", "Django", "django", "파이썬 웹"])
+
+        self.assertEqual([tag.name for tag in tags], ["파이썬 웹", "Django", "Django"])
+        self.assertEqual(tags[1], existing)
+        self.assertEqual(tags[0].slug, "파이썬-웹")
+
+    def test_form_applies_only_differences(self):
+        self.save_with_tags("a, b, c")
+        with CaptureQueriesContext(connection) as unchanged:
+            self.save_with_tags("a, b, c")
+        self.save_with_tags("b, c, d")
+
+        self.assertEqual(
+            sorted(self.post.tags.values_list("name", flat=True)), ["b", "c", "d"]
+        )
+        self.assertFalse(
+            any(
+                "blog_page_post_tags" in q["sql"] and "INSERT" in q["sql"]
+                for q in unchanged.captured_queries
+            )
+        )
+
+    def test_post_update_view_saves_tags(self):
+        self.client.force_login(self.user)
+        response = self.client.post(
+            f"/blog/edit/{self.post.pk}/",
+            {"title": "제목", "content": "내용", "status": "draft", "tags": "x, y"},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            sorted(self.post.tags.values_list("name", flat=True)), ["x", "y"]
+        )
+
+
+@override_settings(BACKGROUND_WORKERS=0)
+class HeadImagePipelineTest(BlogTestCase):
+    """대표 이미지 파생본 생성 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.use_temp_media_root()
+
+    def upload(self, width, height, name="photo.jpg"):
+        buffer = BytesIO()
+        Image.new("RGB", (width, height), "orange").save(buffer, "JPEG")
+        return SimpleUploadedFile(name, buffer.getvalue(), "image/jpeg")
+
+    def test_derivatives_are_generated_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(
+                title="제목",
+                content="내용",
+                author=self.user,
+                head_image=self.upload(1200, 600),
+            )
+        post.refresh_from_db()
+
+        widths = {
+            label: entry["width"] for label, entry in post.head_image_variants.items()
+        }
+        self.assertEqual(
+            widths, {"thumb": 400, "thumb@2x": 800, "detail": 960, "detail@2x": 1200}
+        )
+        thumb = post.head_image_variants["thumb"]
+        self.assertTrue(thumb["webp"].startswith(os.path.dirname(post.head_image.name)))
+        self.assertTrue(default_storage.exists(thumb["webp"]))
+        self.assertIn("400w", post.get_head_image_srcset("list"))
+        self.assertTrue(post.get_head_image_src("list").endswith(".400w.jpg"))
+
+    def test_replacing_image_removes_old_derivatives(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = Post.objects.create(
+                title="제목",
+                content="내용",
+                author=self.user,
+                head_image=self.upload(500, 500),
+            )
+        post.refresh_from_db()
+        old = post.head_image_variants["thumb"]["webp"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.head_image = self.upload(300, 300, "other.jpg")
+            post.save()
+        post.refresh_from_db()
+
+        self.assertFalse(default_storage.exists(old))
+        self.assertEqual(post.head_image_variants["thumb"]["width"], 300)
+
+
+class PostContentStatsTest(BlogTestCase):
+    """게시물 요약/읽기 통계 사전 계산 테스트"""
+
+    content = "<p><strong>" + " ".join(["단어"] * 450) + "</strong></p>"
+
+    def test_stats_are_computed_on_save(self):
+        post = self.create_post(content=self.content, status="draft")
+
+        self.assertEqual(post.word_count, 450)
+        self.assertEqual(post.reading_time, 3)
+        self.assertTrue(post.excerpt.endswith("</strong></p>"))
+        self.assertEqual(post.excerpt.count("단어"), 30)
+
+        post.content = "짧은 글"
+        post.save(update_fields=["content"])
+        post.refresh_from_db()
+        self.assertEqual((post.word_count, post.reading_time), (2, 1))
+        self.assertEqual(post.excerpt, "짧은 글")
+
+    def test_backfill_command_fills_existing_posts(self):
+        post = self.create_post(content=self.content, status="draft")
+        Post.objects.filter(pk=post.pk).update(excerpt="", word_count=0, reading_time=0)
+
+        call_command("backfill_post_stats", chunk_size=1, stdout=StringIO())
+        post.refresh_from_db()
+
+        self.assertEqual(post.word_count, 450)
+        self.assertTrue(post.excerpt)
+
+    def test_post_list_does_not_load_content(self):
+        self.create_post(content=self.content)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/blog/")
+
+        self.assertContains(response, "3분 분량")
+        post_queries = [
+            query["sql"] for query in queries if 'FROM "blog_page_post"' in query["sql"]
+        ]
+        self.assertTrue(post_queries)
+        for sql in post_queries:
+            self.assertNotIn('"blog_page_post"."content"', sql)
+
+
+class AsyncInteractionTest(BlogTestCase):
+    """좋아요/북마크/댓글 비동기 엔드포인트 테스트"""
+
+    headers = {"x-requested-with": "XMLHttpRequest"}
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post(status="draft")
+
+    async def test_like_and_bookmark_toggle_over_asgi(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.post(
+            f"/blog/like/{self.post.pk}/", headers=self.headers
+        )
+        self.assertEqual(response.json()["is_liked"], True)
+        self.assertEqual(response.json()["likes_count"], 1)
+
+        response = await self.async_client.post(
+            f"/blog/like/{self.post.pk}/", headers=self.headers
+        )
+        self.assertEqual(response.json()["likes_count"], 0)
+
+        response = await self.async_client.post(
+            f"/blog/bookmark/{self.post.pk}/", headers=self.headers
+        )
+        self.assertEqual(response.json()["bookmarks_count"], 1)
+        self.assertTrue(
+            await Bookmark.objects.filter(user=self.user, post=self.post).aexists()
+        )
+
+    def test_like_redirects_only_to_same_site_next(self):
+        self.client.force_login(self.user)
+        url = f"/blog/like/{self.post.pk}/"
+
+        response = self.client.post(url, {"next": "/blog/?cursor=abc"})
+        self.assertEqual(response.url, "/blog/?cursor=abc")
+        for next_url in (
+            "https://evil.example/",
+            "//evil.example/",
+            "javascript:alert(1)",
+        ):
+            response = self.client.post(url, {"next": next_url})
+            self.assertEqual(response.url, self.post.get_absolute_url())
+
+    async def test_comment_create_over_asgi(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.post(
+            f"/blog/{self.post.pk}/comment/", {"content": "비동기 댓글"}
+        )
+
+        self.assertTrue(response.json()["success"])
+        self.assertIn("비동기 댓글", response.json()["html"])
+        comment = await Comment.objects.aget(post=self.post)
+        self.assertEqual(comment.depth, 0)
+        self.assertTrue(comment.path)
+
+    def test_toggle_rolls_back_row_when_counter_update_fails(self):
+        self.client.force_login(self.user)
+
+        with mock.patch(
+            "blog_page.signals._adjust_counter", side_effect=RuntimeError("boom")
+        ), self.assertRaises(RuntimeError):
+            self.client.post(f"/blog/like/{self.post.pk}/", headers=self.headers)
+
+        self.assertFalse(Like.objects.exists())
+        response = self.client.post(f"/blog/like/{self.post.pk}/", headers=self.headers)
+        self.assertEqual(response.json()["is_liked"], True)
+        self.assertEqual(response.json()["likes_count"], 1)
+
+    async def test_comment_create_error_does_not_leak_details(self):
+        await self.async_client.aforce_login(self.user)
+
+        with mock.patch.object(
+            Comment, "save", side_effect=RuntimeError("/srv/secret.sqlite3")
+        ), self.assertLogs("blog_page.views", "ERROR"):
+            response = await self.async_client.post(
+                f"/blog/{self.post.pk}/comment/", {"content": "댓글"}
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertNotIn("secret", response.content.decode())
+        self.assertFalse(response.json()["success"])
+
+    async def test_anonymous_and_get_requests_are_rejected(self):
+        response = await self.async_client.post(f"/blog/like/{self.post.pk}/")
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response.url)
+
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(f"/blog/{self.post.pk}/comment/")
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(await Like.objects.acount(), 0)
+
+
+@override_settings(BACKGROUND_WORKERS=0)
+class RelatedPostRecommendationTest(BlogTestCase):
+    """TF-IDF 관련 게시물 추천 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.django = self.create("django orm queryset", "django queryset index")
+        self.orm = self.create("django queryset tips", "orm queryset index")
+        self.kimchi = self.create("kimchi recipe", "cabbage kimchi pepper")
+        self.draft = self.create(
+            "django orm draft", "django orm queryset", status="draft"
+        )
+        for word in ("alpha", "beta", "gamma", "delta"):
+            self.create(word, f"{word} filler")
+
+    def create(self, title, content, status="published"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.create_post(title, content, status=status)
+
+    def related_ids(self, post):
+        return set(post.related_posts.values_list("pk", flat=True))
+
+    def test_rebuild_fills_related_posts_and_keeps_manual_entries(self):
+        self.django.related_posts.add(self.kimchi)
+
+        rebuild_related_posts()
+        rebuild_related_posts()
+
+        self.assertEqual(self.related_ids(self.django), {self.orm.pk, self.kimchi.pk})
+        self.assertEqual(
+            list(
+                PostRecommendation.objects.filter(post=self.django).values_list(
+                    "related", flat=True
+                )
+            ),
+            [self.orm.pk],
+        )
+        # 초안은 추천 대상이 아니지만 초안 자신은 추천을 받습니다.
+        self.assertNotIn(self.draft.pk, self.related_ids(self.orm))
+        self.assertIn(self.django.pk, self.related_ids(self.draft))
+
+    def test_saving_a_post_updates_affected_recommendations(self):
+        rebuild_related_posts()
+        self.assertEqual(self.related_ids(self.kimchi), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            stew = self.create("kimchi stew", "kimchi pepper pork")
+
+        self.assertEqual(self.related_ids(stew), {self.kimchi.pk})
+        self.assertEqual(self.related_ids(self.kimchi), {stew.pk})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            stew.title = "pork stew"
+            stew.content = "pork onion"
+            stew.save()
+
+        self.assertEqual(self.related_ids(self.kimchi), set())
+
+    def test_update_matches_rebuild_when_a_recommendation_drops_out(self):
+        rebuild_related_posts(k=1)
+        self.assertEqual(self.related_ids(self.orm), {self.django.pk})
+
+        with mock.patch("blog_page.signals.schedule_related_posts"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.django.title = "kimchi pepper"
+                self.django.content = "cabbage pepper"
+                self.django.save()
+        update_related_posts(self.django.pk, k=1)
+
+        posts = [self.django.pk, self.orm.pk, self.kimchi.pk]
+        recommendations = PostRecommendation.objects.filter(post__in=posts)
+        updated = dict(recommendations.values_list("post", "related"))
+        rebuild_related_posts(k=1)
+        self.assertEqual(updated, dict(recommendations.values_list("post", "related")))
+        self.assertEqual(updated[self.django.pk], self.kimchi.pk)
+        self.assertNotEqual(updated.get(self.orm.pk), self.django.pk)
+
+    def test_sparse_index_matches_full_index(self):
+        post_ids = list(Post.objects.values_list("pk", flat=True))
+
+        expected = TfidfIndex().nearest(post_ids)
+        # 내적이 여러 쿼리로 나뉘어도 같은 결과가 나오는지 봅니다.
+        with mock.patch("blog_page.recommend.MAX_QUERY_TERMS", 3):
+            result = SparseTfidfIndex(post_ids).nearest(post_ids)
+
+        self.assertEqual(result.keys(), expected.keys())
+        for post_id, picks in expected.items():
+            # 점수가 같은 항목의 순서는 정해져 있지 않으므로 점수만 비교합니다.
+            scores = dict(result[post_id])
+            self.assertEqual(scores.keys(), dict(picks).keys())
+            for related, score in picks:
+                self.assertAlmostEqual(scores[related], score, places=5)
+
+    def test_saving_a_post_does_not_build_the_full_index(self):
+        with mock.patch("blog_page.recommend.TfidfIndex") as full_index:
+            with self.captureOnCommitCallbacks(execute=True):
+                stew = self.create("kimchi stew", "kimchi pepper pork")
+
+        full_index.assert_not_called()
+        self.assertEqual(self.related_ids(stew), {self.kimchi.pk})
+
+
+class AnonymousPageCacheTest(BlogTestCase):
+    """익명 사용자 페이지 캐시와 조건부 GET 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post()
+        self.url = self.post.get_absolute_url()
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get("/blog/")
+        with self.assertNumQueries(0):
+            second = self.client.get("/blog/")
+
+        self.assertEqual(first["X-Page-Cache"], "miss")
+        self.assertEqual(second["X-Page-Cache"], "hit")
+        self.assertEqual(first.content, second.content)
+        self.assertNotIn(b"csrfmiddlewaretoken", second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_conditional_get_returns_304_and_counts_views(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(view_counter.pending(self.post.pk), 2)
+        self.client.get(self.url)
+        self.assertEqual(view_counter.pending(self.post.pk), 3)
+
+    def test_changes_invalidate_cached_pages(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.client.get("/blog/")
+
+        Comment.objects.create(post=self.post, author=self.user, content="댓글")
+        response = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertContains(response, "댓글")
+
+        Like.objects.create(post=self.post, user=self.user)
+        self.assertContains(self.client.get("/blog/"), "좋아요 1")
+
+    def test_logged_in_users_bypass_cache(self):
+        self.client.get(self.url)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertNotIn("ETag", response)
+        self.assertContains(response, "csrfmiddlewaretoken")
+
+
+class TagIndexTest(BlogTestCase):
+    """태그 색인과 태그 구름 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.django = Tag.objects.create(name="django")
+        self.python = Tag.objects.create(name="python")
+        self.hidden = Tag.objects.create(name="hidden", is_public=False)
+
+    def create_post(self, *tags, status="published"):
+        post = super().create_post(status=status)
+        post.tags.add(*tags)
+        return post
+
+    def counts(self):
+        return {name: count for name, _, count in get_tag_index().values()}
+
+    def test_index_is_built_with_one_query_and_cached(self):
+        self.create_post(self.django, self.python, self.hidden)
+        self.create_post(self.django)
+        self.create_post(self.django, status="draft")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.counts(), {"django": 2, "python": 1})
+        with self.assertNumQueries(0):
+            get_tag_index()
+
+    def test_counts_are_adjusted_without_rebuilding(self):
+        post = self.create_post(self.django)
+        get_tag_index()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.tags.add(self.python)
+            post.tags.remove(self.django)
+        self.assertEqual(self.counts(), {"django": 0, "python": 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.status = "draft"
+            post.save()
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.status = "published"
+            post.save()
+            post.tags.clear()
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.tags.add(self.django)
+            Post.objects.get(pk=post.pk).delete()
+        self.assertIsNotNone(cache.get(TAG_INDEX_CACHE_KEY))
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+    def test_new_tag_rebuilds_index(self):
+        get_tag_index()
+        Tag.objects.create(name="rust")
+        self.assertIsNone(cache.get(TAG_INDEX_CACHE_KEY))
+
+    def test_cloud_weights_and_top(self):
+        for _ in range(8):
+            self.create_post(self.django)
+        self.create_post(self.python)
+
+        cloud = get_tag_cloud()
+        self.assertEqual([tag["name"] for tag in cloud], ["django", "python"])
+        self.assertEqual([tag["weight"] for tag in cloud], [5, 1])
+        self.assertEqual([tag["name"] for tag in get_tag_cloud(limit=1)], ["django"])
+
+    def test_tag_pages(self):
+        self.create_post(self.django, self.hidden)
+        self.create_post(self.django, status="draft")
+
+        response = self.client.get("/blog/tags/")
+        self.assertContains(response, 'class="tag weight-1"')
+        self.assertNotContains(response, "hidden")
+
+        response = self.client.get(self.django.get_absolute_url())
+        self.assertEqual(len(response.context["posts"]), 1)
+        self.assertEqual(
+            self.client.get(self.hidden.get_absolute_url()).status_code, 404
+        )
+
+
+class RequestInstrumentationTest(BlogTestCase):
+    """요청 계측 미들웨어 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        reset_request_stats()
+        self.post = self.create_post()
+        self.client.force_login(self.user)
+
+    @override_settings(SERVER_TIMING=True)
+    def test_records_stats_and_server_timing_per_url_name(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.post.get_absolute_url())
+
+        stats = get_request_stats()["blog_page:post_detail"]
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["queries"], len(queries))
+        self.assertGreater(stats["template_ms"], 0)
+        self.assertRegex(
+            response["Server-Timing"],
+            rf'^db;dur=[\d.]+;desc="{len(queries)} queries", tpl;dur=[\d.]+, '
+            r"total;dur=[\d.]+$",
+        )
+
+    @override_settings(
+        QUERY_BUDGETS={"blog_page:post_detail": 1}, QUERY_BUDGET_ACTION="raise"
+    )
+    def test_budget_violation_raises_in_tests(self):
+        with self.assertRaisesMessage(QueryBudgetExceeded, "blog_page:post_detail"):
+            self.client.get(self.post.get_absolute_url())
+
+    @override_settings(
+        QUERY_BUDGETS={"blog_page:post_detail": 1}, QUERY_BUDGET_ACTION="log"
+    )
+    def test_budget_violation_is_logged_outside_tests(self):
+        with self.assertLogs("blog_page.instrumentation", "WARNING") as logs:
+            response = self.client.get(self.post.get_absolute_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("예산 1개", logs.output[0])
+
+    async def test_async_views_are_measured(self):
+        await self.async_client.aforce_login(self.user)
+
+        await self.async_client.post(f"/blog/like/{self.post.pk}/")
+
+        stats = get_request_stats()["blog_page:like_post"]
+        self.assertGreater(stats["queries"], 0)
+
+
+class LoadDataGeneratorTest(TestCase):
+    """부하 테스트 데이터 생성 명령 테스트"""
+
+    def test_generates_consistent_data_and_clears_it(self):
+        call_command(
+            "generate_load_data",
+            users=5,
+            posts=12,
+            comments=150,
+            likes=30,
+            bookmarks=10,
+            tags=8,
+            categories=2,
+            chunk_size=5,
+            stdout=StringIO(),
+        )
+
+        posts = Post.objects.filter(author__username__startswith="load-")
+        self.assertEqual(posts.count(), 12)
+        self.assertEqual(Comment.objects.count(), 150)
+        for post in posts:
+            self.assertEqual(post.comments_count, post.comment_set.count())
+            self.assertEqual(post.likes_count, post.like_set.count())
+            self.assertEqual(post.bookmarks_count, post.bookmark_set.count())
+            self.assertTrue(post.excerpt)
+        for comment in Comment.objects.filter(parent__isnull=False)[:50]:
+            self.assertTrue(comment.path.startswith(comment.parent.path + "/"))
+            self.assertEqual(comment.depth, comment.parent.depth + 1)
+        self.assertTrue(Comment.objects.filter(depth__gte=2).exists())
+        self.assertTrue(
+            self.client.login(username="load-user-0", password="load-test-password")
+        )
+
+        call_command("generate_load_data", clear=True, stdout=StringIO())
+        self.assertFalse(Post.objects.exists())
+        self.assertFalse(Comment.objects.exists())
+        self.assertFalse(CustomUser.objects.filter(username__startswith="load-"))
+
+
+@override_settings(REPLICA_DATABASE="replica")
+class ReplicaRoutingTest(BlogTestMixin, SimpleTestCase):
+    """읽기 복제본 라우팅 테스트"""
+
+    def db_for_read(self, request):
+        request.resolver_match = resolve(request.path)
+        token = _current_request.set(request)
+        try:
+            return ReplicaRouter().db_for_read(Post)
+        finally:
+            _current_request.reset(token)
+
+    def test_reads_from_listed_views_go_to_replica(self):
+        factory = RequestFactory()
+        self.assertEqual(self.db_for_read(factory.get("/blog/")), "replica")
+        self.assertEqual(self.db_for_read(factory.get("/blog/1/")), "replica")
+        self.assertIsNone(self.db_for_read(factory.post("/blog/")))
+        self.assertIsNone(self.db_for_read(factory.get("/blog/write/")))
+        self.assertIsNone(ReplicaRouter().db_for_read(Post))
+        self.assertEqual(ReplicaRouter().db_for_write(Post), "default")
+
+    def test_writers_and_fresh_changes_read_from_primary(self):
+        factory = RequestFactory()
+        middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse())
+        response = middleware(factory.post("/blog/like/1/"))
+        self.assertIn(STICKY_COOKIE, response.cookies)
+
+        request = factory.get("/blog/")
+        request.COOKIES[STICKY_COOKIE] = "1"
+        self.assertIsNone(self.db_for_read(request))
+
+        invalidate_pages(1)
+        self.assertIsNone(self.db_for_read(factory.get("/blog/")))
+
+    @override_settings(REPLICA_DATABASE=None)
+    def test_disabled_without_replica(self):
+        self.assertIsNone(self.db_for_read(RequestFactory().get("/blog/")))
+        response = ReplicaRoutingMiddleware(lambda request: HttpResponse())(
+            RequestFactory().post("/blog/like/1/")
+        )
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+    def test_sync_replica_copies_database(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        source = os.path.join(directory, "primary.sqlite3")
+        target = os.path.join(directory, "replica.sqlite3")
+        with sqlite3.connect(source) as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE post (title TEXT)")
+            db.execute("INSERT INTO post VALUES ('제목')")
+
+        SyncReplicaCommand().copy(source, target)
+
+        with sqlite3.connect(target) as db:
+            self.assertEqual(
+                db.execute("SELECT title FROM post").fetchall(), [("제목",)]
+            )
+
+
+class SQLiteSettingsTest(TestCase):
+    """SQLite 연결 설정 테스트"""
+
+    def test_pragmas_are_applied(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], 20000)
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+
+
+class PostTransferTest(BlogTestCase):
+    """게시물 JSON Lines 내보내기/가져오기 명령 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "posts.jsonl.gz")
+
+    def export(self, **options):
+        call_command("export_posts", self.path, stdout=StringIO(), **options)
+
+    def test_round_trip(self):
+        call_command(
+            "generate_load_data",
+            users=4,
+            posts=6,
+            comments=40,
+            likes=10,
+            bookmarks=5,
+            tags=5,
+            categories=2,
+            skip_index=True,
+            stdout=StringIO(),
+        )
+        source = list(Post.objects.select_related("author").order_by("pk"))
+        self.export(chunk_size=4)
+        call_command("generate_load_data", clear=True, stdout=StringIO())
+
+        call_command("import_posts", self.path, batch_size=4, stdout=StringIO())
+
+        posts = list(Post.objects.order_by("pk"))
+        self.assertEqual(len(posts), len(source))
+        for old, new in zip(source, posts):
+            self.assertEqual(new.title, old.title)
+            self.assertEqual(new.created_at, old.created_at)
+            self.assertEqual(new.author.username, old.author.username)
+            self.assertEqual(new.comments_count, new.comment_set.count())
+            self.assertEqual(new.likes_count, new.like_set.count())
+            self.assertTrue(new.excerpt)
+        self.assertEqual(Comment.objects.count(), 40)
+        for comment in Comment.objects.filter(parent__isnull=False):
+            self.assertTrue(comment.path.startswith(comment.parent.path + "/"))
+            self.assertEqual(comment.depth, comment.parent.depth + 1)
+        self.assertTrue(search_posts(tokenize(posts[0].title)[0]))
+        self.assertFalse(os.path.exists(f"{self.path}.checkpoint"))
+
+    def test_resumes_from_checkpoint(self):
+        tag = Tag.objects.create(name="django")
+        for i in range(5):
+            self.create_post(f"글 {i}").tags.add(tag)
+        self.export()
+        Post.objects.all().delete()
+
+        path = os.path.join(self.directory, "posts.jsonl")
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            lines = file.readlines()
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(lines[:3] + ["{broken\n"] + lines[3:])
+        with self.assertRaisesMessage(CommandError, "4번째 줄"):
+            call_command("import_posts", path, batch_size=2, stdout=StringIO())
+        self.assertEqual(Post.objects.count(), 2)
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(lines[:3] + ["\n"] + lines[3:])
+        call_command("import_posts", path, batch_size=2, resume=True, stdout=StringIO())
+        self.assertEqual(
+            list(Post.objects.order_by("pk").values_list("title", flat=True)),
+            [f"글 {i}" for i in range(5)],
+        )
+        self.assertEqual(tag.post_set.count(), 5)
+
+    def test_import_refreshes_cached_feeds(self):
+        self.create_post("가져올 글")
+        self.export()
+        Post.objects.all().delete()
+        cache.clear()
+        self.assertNotContains(self.client.get("/blog/feed/"), "가져올 글")
+
+        call_command("import_posts", self.path, stdout=StringIO())
+        self.assertContains(self.client.get("/blog/feed/"), "가져올 글")
+
+    def test_import_refreshes_cached_sitemaps(self):
+        post = self.create_post(
+            "가져올 글", category=Category.objects.create(name="개발", slug="dev")
+        )
+        post.tags.add(Tag.objects.create(name="django"))
+        self.export()
+        Post.objects.all().delete()
+        Category.objects.all().delete()
+        Tag.objects.all().delete()
+        cache.clear()
+        sections = ("posts", "categories", "tags")
+        for section in sections:
+            self.client.get(f"/sitemap-{section}-0.xml.gz")
+        self.assertNotContains(self.client.get("/sitemap.xml"), "sitemap-posts-")
+
+        call_command("import_posts", self.path, stdout=StringIO())
+        post = Post.objects.get()
+        self.assertContains(self.client.get("/sitemap.xml"), "sitemap-posts-0")
+        for section, url in zip(
+            sections,
+            (
+                post.get_absolute_url(),
+                post.category.get_absolute_url(),
+                post.tags.get().get_absolute_url(),
+            ),
+        ):
+            shard = self.client.get(f"/sitemap-{section}-0.xml.gz")
+            self.assertIn(url, gzip.decompress(shard.content).decode())
+
+
+class SerialLiveServerThread(LiveServerThread):
+    """
+    요청을 한 번에 하나씩 처리하는 테스트 서버 스레드
+
+    메모리 SQLite 테스트 DB 에서는 서버의 모든 요청 스레드가 연결 하나를 함께 쓰므로,
+    동시에 들어온 요청의 트랜잭션이 서로 격리되지 않습니다.
+    """
+
+    def _create_server(self, connections_override=None):
+        # 서버 스레드는 run() 에서 이미 공유 연결을 쓰도록 설정됩니다.
+        return WSGIServer(
+            (self.host, self.port), QuietWSGIRequestHandler, allow_reuse_address=False
+        )
+
+
+@override_settings(BACKGROUND_WORKERS=0)
+class RouteBenchmarkTest(BlogTestMixin, LiveServerTestCase):
+    """URL 부하 테스트 명령 테스트"""
+
+    server_thread_class = SerialLiveServerThread
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user("bench")
+        self.create_post("벤치 글", "벤치 내용")
+
+    def test_reports_percentiles_as_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "result.json")
+            call_command(
+                "bench_routes",
+                base_url=self.live_server_url,
+                clients=2,
+                requests=6,
+                warmup=0,
+                routes=["post_list", "post_detail", "like_post"],
+                username="bench",
+                password="pw",
+                output=output,
+                stdout=StringIO(),
+            )
+            with open(output, encoding="utf-8") as file:
+                report = json.load(file)
+
+        self.assertTrue(report["authenticated"])
+        for route in ("post_list", "post_detail", "like_post"):
+            result = report["routes"][route]
+            self.assertEqual(result["requests"], 6)
+            self.assertEqual(result["errors"], 0)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+
+@override_settings(BACKGROUND_WORKERS=0, BLOB_GC_GRACE=0)
+class ContentAddressedStorageTest(BlogTestCase):
+    """첨부 파일/대표 이미지 내용 주소 저장 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.use_temp_media_root()
+
+    def create_post(self, name="report.pdf", content=b"same bytes"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return super().create_post(
+                status="draft", file_upload=SimpleUploadedFile(name, content)
+            )
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.create_post("report.pdf")
+        second = self.create_post("copy.PDF")
+
+        self.assertEqual(first.file_upload.name, second.file_upload.name)
+        self.assertRegex(first.file_upload.name, r"^blobs/../../[0-9a-f]{64}\.pdf$")
+        self.assertEqual(Blob.objects.get().references, 2)
+        self.assertEqual(first.get_file_name(), "report.pdf")
+        self.assertEqual(second.get_file_name(), "copy.PDF")
+        with first.file_upload.open() as file:
+            self.assertEqual(file.read(), b"same bytes")
+
+    def test_blob_is_deleted_with_its_last_reference(self):
+        first = self.create_post()
+        second = self.create_post()
+        name = first.file_upload.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(blob_storage().exists(name))
+        self.assertEqual(Blob.objects.get().references, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.file_upload = SimpleUploadedFile("new.pdf", b"other bytes")
+            second.save()
+        self.assertFalse(blob_storage().exists(name))
+        self.assertEqual(list(Blob.objects.values_list("references", flat=True)), [1])
+
+    def test_gc_command_repairs_counts_and_imports_legacy_files(self):
+        post = self.create_post()
+        Blob.objects.update(references=5)
+        legacy = default_storage.save(
+            "blog/files/2024/01/01/old.txt", ContentFile(b"x")
+        )
+        legacy_post = Post.objects.create(
+            title="예전", content="내용", author=self.user
+        )
+        Post.objects.filter(pk=legacy_post.pk).update(file_upload=legacy)
+
+        call_command("gc_blobs", import_legacy=True, stdout=StringIO())
+
+        legacy_post.refresh_from_db()
+        self.assertTrue(is_blob(legacy_post.file_upload.name))
+        self.assertEqual(legacy_post.get_file_name(), "old.txt")
+        self.assertFalse(default_storage.exists(legacy))
+        self.assertEqual(Blob.objects.get(name=post.file_upload.name).references, 1)
+        self.assertEqual(
+            Blob.objects.get(name=legacy_post.file_upload.name).references, 1
+        )
+
+
+@override_settings(BACKGROUND_WORKERS=0)
+class MediaServingTest(BlogTestCase):
+    """미디어 파일 제공(Range, 조건부 요청, X-Sendfile) 테스트"""
+
+    data = bytes(range(256)) * 4
+
+    def setUp(self):
+        super().setUp()
+        self.use_temp_media_root()
+        self.post = self.create_post(
+            status="draft", file_upload=SimpleUploadedFile("보고서.bin", self.data)
+        )
+        self.url = f"/media/{self.post.file_upload.name}"
+
+    def test_blob_is_served_with_immutable_cache_headers(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.data)
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+        response = self.client.get(
+            self.url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_derivative_next_to_blob_is_not_immutable(self):
+        base, _ = os.path.splitext(self.post.file_upload.name)
+        name = f"{base}.640w.webp"
+        with open(blob_storage().path(name), "wb") as file:
+            file.write(b"webp")
+
+        response = self.client.get(f"/media/{name}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("immutable", response["Cache-Control"])
+        self.assertIn(f"max-age={MUTABLE_MAX_AGE}", response["Cache-Control"])
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, headers={"range": "bytes=10-19"})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/1024")
+        self.assertEqual(b"".join(response.streaming_content), self.data[10:20])
+
+        response = self.client.get(self.url, headers={"range": "bytes=-4"})
+        self.assertEqual(b"".join(response.streaming_content), self.data[-4:])
+
+        response = self.client.get(self.url, headers={"range": "bytes=5000-"})
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+        response = self.client.get(
+            self.url, headers={"range": "bytes=0-9", "if-range": '"stale"'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_download_uses_original_name(self):
+        response = self.client.get(f"/blog/{self.post.pk}/file/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertIn("filename*=utf-8''%EB%B3%B4", response["Content-Disposition"])
+
+    @override_settings(MEDIA_SENDFILE="x-accel-redirect")
+    def test_sendfile_hands_off_to_proxy(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/protected-media/{self.post.file_upload.name}",
+        )
+        self.assertEqual(response.content, b"")
+
+    def test_rejects_paths_outside_media(self):
+        self.assertEqual(self.client.get("/media/../manage.py").status_code, 404)
+        self.assertEqual(self.client.get("/media/blobs/.staging/x").status_code, 404)
+
+
+class TrendingTest(BlogTestCase):
+    """시간 감쇠 인기 점수 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.post = self.create_post("첫 글")
+
+    def heat(self, post):
+        post.refresh_from_db()
+        return heat(post)
+
+    def test_events_raise_score_and_cancel_restores_it(self):
+        self.assertAlmostEqual(self.heat(self.post), event_weight("publish"), places=3)
+
+        like = Like.objects.create(user=self.user, post=self.post)
+        self.assertAlmostEqual(
+            self.heat(self.post),
+            event_weight("publish") + event_weight("like"),
+            places=3,
+        )
+
+        like.delete()
+        self.assertAlmostEqual(self.heat(self.post), event_weight("publish"), places=3)
+
+    def test_older_events_count_less(self):
+        half_life = timedelta(seconds=settings.TRENDING_HALF_LIFE)
+        Post.objects.update(trending_score=0)
+        record_event(self.post.pk, "like", occurred=timezone.now() - half_life)
+        self.assertAlmostEqual(self.heat(self.post), event_weight("like") / 2, places=3)
+
+        now = timezone.now()
+        self.assertAlmostEqual(
+            initial_score([("like", now - 2 * half_life, 4)], now),
+            initial_score([("like", now, 1)], now),
+        )
+
+    def test_trending_order_and_page(self):
+        hot = self.create_post("인기 글")
+        self.create_post("임시 글", status="draft")
+        Comment.objects.create(post=hot, author=self.user, content="댓글")
+
+        self.assertEqual(
+            [post.title for post in trending_posts()], ["인기 글", "첫 글"]
+        )
+        response = self.client.get("/blog/trending/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "임시 글")
+        self.assertEqual(
+            [post.title for post in response.context["posts"]], ["인기 글", "첫 글"]
+        )
+
+    def test_flushed_views_raise_score(self):
+        before = self.heat(self.post)
+        for _ in range(3):
+            view_counter.incr(self.post.pk)
+        view_counter.flush()
+
+        self.assertAlmostEqual(
+            self.heat(self.post), before + 3 * event_weight("view"), places=3
+        )
+
+    def test_rebuild_command_matches_incremental_scores(self):
+        Like.objects.create(user=self.user, post=self.post)
+        Comment.objects.create(post=self.post, author=self.user, content="댓글")
+        expected = self.heat(self.post)
+        Post.objects.update(trending_score=0)
+
+        call_command("rebuild_trending_scores", chunk_size=1, stdout=StringIO())
+
+        self.assertAlmostEqual(self.heat(self.post), expected, places=3)
+
+
+class FeedTest(BlogTestCase):
+    """RSS/Atom 피드 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.create(name="개발", slug="dev")
+        self.tag = Tag.objects.create(name="django")
+        self.post = self.create_post("첫 글")
+        self.post.tags.add(self.tag)
+        self.draft = self.create_post("임시 글", status="draft")
+
+    def create_post(self, title, status="published"):
+        return super().create_post(
+            title, "<p>본문</p>", status=status, category=self.category
+        )
+
+    def test_feeds_list_published_posts(self):
+        urls = [
+            "/blog/feed/",
+            "/blog/feed/atom/",
+            f"/blog/category/{self.category.slug}/feed/",
+            f"/blog/tag/{self.tag.slug}/feed/atom/",
+        ]
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertContains(response, "첫 글")
+            self.assertContains(response, f"http://testserver/blog/{self.post.pk}/")
+            self.assertNotContains(response, "임시 글")
+        self.assertEqual(
+            self.client.get("/blog/feed/")["Content-Type"],
+            "application/rss+xml; charset=utf-8",
+        )
+        self.assertEqual(self.client.get("/blog/category/none/feed/").status_code, 404)
+
+    def test_conditional_requests_do_not_touch_database(self):
+        response = self.client.get("/blog/feed/")
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+
+        with self.assertNumQueries(0):
+            cached = self.client.get("/blog/feed/")
+            not_modified = self.client.get("/blog/feed/", HTTP_IF_NONE_MATCH=etag)
+            since = self.client.get("/blog/feed/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(since.status_code, 304)
+
+    def test_only_changed_entries_are_rebuilt(self):
+        other = self.create_post("둘째 글")
+        etag = self.client.get("/blog/feed/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = "고친 글"
+            self.post.save()
+        self.assertIsNone(cache.get(FEED_ENTRY_KEY.format(pk=self.post.pk)))
+        self.assertIsNotNone(cache.get(FEED_ENTRY_KEY.format(pk=other.pk)))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/blog/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "고친 글")
+        self.assertContains(response, "둘째 글")
+        self.assertEqual(len(queries), 3)
+
+    def test_unrelated_changes_keep_feeds(self):
+        etag = self.client.get("/blog/tag/django/feed/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.draft.title = "고친 임시 글"
+            self.draft.save()
+        response = self.client.get("/blog/tag/django/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.tags.remove(self.tag)
+        response = self.client.get("/blog/tag/django/feed/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "첫 글")
+
+
+@override_settings(SITEMAP_SHARD_SIZE=2)
+class SitemapTest(BlogTestCase):
+    """조각으로 나눈 사이트맵 테스트"""
+
+    def setUp(self):
+        super().setUp()
+        self.category = Category.objects.create(name="개발", slug="dev")
+        self.tag = Tag.objects.create(name="django")
+        self.posts = [self.create_post(f"글 {i}") for i in range(5)]
+        self.draft = self.create_post("임시 글", status="draft")
+
+    def shard_url(self, section, pk):
+        return f"/sitemap-{section}-{pk // 2}.xml.gz"
+
+    def read_shard(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        return gzip.decompress(response.content).decode()
+
+    def test_index_lists_non_empty_shards(self):
+        response = self.client.get("/sitemap.xml")
+
+        shards = {self.shard_url("posts", post.pk) for post in self.posts}
+        shards.add(self.shard_url("categories", self.category.pk))
+        shards.add(self.shard_url("tags", self.tag.pk))
+        self.assertEqual(response.content.decode().count("<sitemap>"), len(shards))
+        for url in shards:
+            self.assertContains(response, f"http://testserver{url}")
+
+    def test_shards_contain_published_objects_in_range(self):
+        post = self.posts[-1]
+        content = self.read_shard(self.shard_url("posts", post.pk))
+        for other in self.posts + [self.draft]:
+            expected = other.pk // 2 == post.pk // 2 and other is not self.draft
+            self.assertEqual(
+                f"http://testserver{other.get_absolute_url()}</loc>" in content,
+                expected,
+            )
+        self.assertIn(
+            "/blog/tag/django/",
+            self.read_shard(self.shard_url("tags", self.tag.pk)),
+        )
+        self.assertEqual(self.client.get("/sitemap-users-0.xml.gz").status_code, 404)
+
+    def test_out_of_range_shards_do_not_touch_the_cache(self):
+        for shard in (999, 10**30):
+            response = self.client.get(f"/sitemap-posts-{shard}.xml.gz")
+            self.assertEqual(response.status_code, 404)
+        self.assertIsNone(cache.get("sitemaps:version:posts:999"))
+
+    def test_only_changed_shard_is_regenerated(self):
+        first, last = self.posts[0], self.posts[-1]
+        first_url = self.shard_url("posts", first.pk)
+        last_url = self.shard_url("posts", last.pk)
+        first_etag = self.client.get(first_url)["ETag"]
+        last_etag = self.client.get(last_url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(first_url, HTTP_IF_NONE_MATCH=first_etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            last.title = "고친 글"
+            last.save()
+        response = self.client.get(first_url, HTTP_IF_NONE_MATCH=first_etag)
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(last_url, HTTP_IF_NONE_MATCH=last_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], last_etag)
+
+
+class ContentRenderingTest(BlogTestCase):
+    """본문 렌더링 파이프라인 테스트"""
+
+    def test_render_sanitizes_and_anchors_headings(self):
+        rendered = render_content(
+            '<h2 onclick="x()">소개</h2><script>alert(1)</script>'
+            '<p><a href="javascript:alert(1)" target="_blank">링크</a>'
+            '<img src="/a.png" onerror="x()"><b>굵게</p><h2>소개</h2><h3>A &amp; B</h3>'
+        )
+
+        self.assertEqual(
+            rendered["content_html"],
+            '<h2 id="소개">소개</h2><p><a target="_blank" rel="noopener noreferrer">'
+            '링크</a><img src="/a.png" loading="lazy" decoding="async"><b>굵게</b></p>'
+            '<h2 id="소개-2">소개</h2><h3 id="a-b">A &amp; B</h3>',
+        )
+        self.assertEqual(
+            rendered["content_toc"],
+            [
+                {"level": 2, "id": "소개", "title": "소개"},
+                {"level": 2, "id": "소개-2", "title": "소개"},
+                {"level": 3, "id": "a-b", "title": "A & B"},
+            ],
+        )
+
+    def test_save_stores_rendered_content(self):
+        post = self.create_post(
+            content="<script>alert(1)</script><h2>소개</h2>\n<p>본문</p>"
+        )
+
+        post.refresh_from_db()
+        self.assertEqual(post.content_html, '<h2 id="소개">소개</h2>\n<p>본문</p>')
+        self.assertNotIn("script", post.excerpt)
+        self.assertEqual(post.word_count, 2)
+        response = self.client.get(post.get_absolute_url())
+        self.assertContains(response, '<a href="#소개">소개</a>', html=True)
+        self.assertNotContains(response, "alert(1)")
+
+    def test_stale_content_is_rendered_once_on_read(self):
+        post = self.create_post(content="<p>이전</p>")
+        Post.objects.filter(pk=post.pk).update(content="<h2>새 제목</h2>")
+
+        post = Post.objects.get(pk=post.pk)
+        self.assertEqual(post.rendered_content, '<h2 id="새-제목">새 제목</h2>')
+        with self.assertNumQueries(0):
+            post.table_of_contents
+        post.refresh_from_db()
+        self.assertEqual(post.content_hash, content_hash("<h2>새 제목</h2>"))
+
+    def test_command_renders_stale_posts(self):
+        fresh = self.create_post(content="<p>그대로</p>")
+        stale = self.create_post(content="<p>이전</p>")
+        Post.objects.filter(pk=stale.pk).update(content="<h2>바뀜</h2>")
+
+        output = StringIO()
+        call_command("render_post_content", processes=1, stdout=output)
+        self.assertIn("2개 중 1개", output.getvalue())
+        stale.refresh_from_db()
+        self.assertEqual(stale.content_toc[0]["id"], "바뀜")
+
+        output = StringIO()
+        call_command(
+            "render_post_content", processes=2, chunk_size=1, force=True, stdout=output
+        )
+        self.assertIn("2개 중 2개", output.getvalue())
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.content_html, "<p>그대로</p>")
+
+    def test_command_refreshes_cached_pages_and_feeds(self):
+        post = self.create_post(content="<p>이전 본문</p>")
+        urls = [post.get_absolute_url(), "/blog/feed/"]
+        for url in urls:
+            self.assertContains(self.client.get(url), "이전 본문")
+        Post.objects.filter(pk=post.pk).update(content="<p>새 본문</p>")
+
+        call_command("render_post_content", processes=1, stdout=StringIO())
+        for url in urls:
+            response = self.client.get(url)
+            self.assertContains(response, "새 본문")
+            self.assertNotContains(response, "이전 본문")
+
+
+class StaticAssetPipelineTest(TestCase):
+    """정적 파일 빌드(압축, 해시 이름, 미리 압축)와 제공 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cls.static_root, ignore_errors=True)
+        static = override_settings(
+            STATIC_ROOT=cls.static_root,
+            STORAGES={
+                **settings.STORAGES,
+                "staticfiles": {
+                    "BACKEND": "blog_page.assets.CompressedManifestStaticFilesStorage"
+                },
+            },
+        )
+        static.enable()
+        cls.addClassCleanup(static.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+        cls.url = static_url("css/style.css")
+
+    def test_minifiers_keep_strings_and_syntax(self):
+        self.assertEqual(
+            _minify_css('a :hover { content: "a  ;}" ; } /* 주석 */ b , c { d: e; }'),
+            'a :hover{content: "a  ;}"}b,c{d: e}',
+        )
+        self.assertEqual(
+            _minify_js('var a = "x // y"; // 주석\nlet r = /\\/+/g;\nreturn a\n+ +b'),
+            'var a="x // y";let r=/\\/+/g;return a\n+ +b\n',
+        )
+
+    def test_build_writes_hashed_minified_and_compressed_files(self):
+        self.assertRegex(self.url, r"^/static/css/style\.[0-9a-f]{12}\.css$")
+        path = os.path.join(self.static_root, self.url.removeprefix("/static/"))
+        with open(path, "rb") as file:
+            content = file.read()
+        with open(settings.BASE_DIR / "static/css/style.css", "rb") as file:
+            self.assertLess(len(content), len(file.read()))
+        self.assertNotIn(b"/*", content)
+        with gzip.open(path + ".gz") as file:
+            self.assertEqual(file.read(), content)
+
+    def test_precompressed_variant_is_served_by_accept_encoding(self):
+        response = self.client.get(
+            self.url, headers={"accept-encoding": "gzip, deflate"}
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn("Accept-Encoding", response["Vary"])
+        compressed = b"".join(response.streaming_content)
+
+        response = self.client.get(self.url, headers={"accept-encoding": "gzip;q=0"})
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(
+            gzip.decompress(compressed), b"".join(response.streaming_content)
+        )
+
+        etag = self.client.get(self.url, headers={"accept-encoding": "gzip"})["ETag"]
+        response = self.client.get(
+            self.url, headers={"accept-encoding": "gzip", "if-none-match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # 해시 없는 이름은 내용이 바뀔 수 있으므로 오래 캐시하지 않습니다.
+        response = self.client.get("/static/css/style.css")
+        self.assertNotIn("immutable", response["Cache-Control"])
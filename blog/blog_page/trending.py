@@ -0,0 +1,142 @@
+import math
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Greatest, Log, Power
+from django.utils import timezone as django_timezone
+
+from .models import Post
+
+# 점수의 기준 시각. 점수는 이 시각부터 반감기 몇 번이 지났는지를 지수로 씁니다.
+TRENDING_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# 이벤트 종류별 기본 가중치 (TRENDING_WEIGHTS 로 바꿀 수 있습니다)
+DEFAULT_WEIGHTS = {"view": 1, "like": 5, "comment": 8, "publish": 20}
+
+# 2 ** (-60) 보다 작은 기여는 0 으로 봅니다. (PostgreSQL POWER 의 언더플로 방지)
+MIN_EXPONENT = -60.0
+
+
+def _half_life():
+    """점수가 절반으로 줄어드는 시간(초, TRENDING_HALF_LIFE)을 반환합니다."""
+    return getattr(settings, "TRENDING_HALF_LIFE", 60 * 60 * 24)
+
+
+def _exponent(when=None):
+    """기준 시각부터 when 까지 반감기가 몇 번 지났는지 반환합니다."""
+    when = when or django_timezone.now()
+    return (when - TRENDING_EPOCH).total_seconds() / _half_life()
+
+
+def event_weight(event):
+    """이벤트 종류("view", "like", "comment", "publish")의 가중치를 반환합니다."""
+    return getattr(settings, "TRENDING_WEIGHTS", {}).get(event, DEFAULT_WEIGHTS[event])
+
+
+def score_update(amount, occurred=None, now=None):
+    """
+    trending_score 에 이벤트 하나의 기여를 더하는(amount 가 음수면 빼는) 표현식을 반환합니다.
+
+    점수는 시간 감쇠 합계 S(t) = Σ w·2^-((t - tᵢ)/반감기) 를 모든 게시물에 같은 비율로
+    줄어드는 부분을 빼고 log₂ 로 저장한 값입니다.
+
+        trending_score = log₂ Σ w·2^xᵢ    (xᵢ = 기준 시각부터 이벤트까지의 반감기 수)
+
+    모든 게시물의 점수가 시간에 따라 같은 비율로 줄어들므로 저장된 값의 순서가 곧
+    현재 인기 순서입니다. 따라서 이벤트가 생길 때 그 게시물 한 행만 UPDATE 하면 되고,
+    주기적으로 전체 점수를 다시 계산할 필요가 없습니다. 로그로 저장하므로 시간이
+    지나도 값이 넘치지 않습니다.
+
+    Args:
+        amount (float): 더할 가중치 (취소된 이벤트면 음수)
+        occurred (datetime, optional): 이벤트가 일어난 시각 (기본값: now)
+        now (datetime, optional): 현재 시각
+
+    Returns:
+        Expression: Post.objects.update(trending_score=...) 에 쓰는 표현식
+    """
+    x = _exponent(now)
+    contribution = amount * 2 ** (_exponent(occurred) - x) if occurred else amount
+    # log₂(2^S + c·2^x) = x + log₂(2^(S - x) + c) 로 계산해 큰 지수를 다루지 않습니다.
+    return Value(x) + Log(
+        Value(2.0),
+        Greatest(
+            Power(Value(2.0), Greatest(F("trending_score") - x, Value(MIN_EXPONENT)))
+            + Value(contribution),
+            Value(2**MIN_EXPONENT),
+        ),
+    )
+
+
+def record_event(post_ids, event, count=1, occurred=None, cancel=False):
+    """
+    게시물의 인기 점수에 이벤트를 반영합니다.
+
+    Args:
+        post_ids (int or list): 게시물의 기본 키
+        event (str): 이벤트 종류 ("view", "like", "comment", "publish")
+        count (int): 이벤트 수
+        occurred (datetime, optional): 이벤트가 일어난 시각 (취소할 때 원래 시각)
+        cancel (bool): 좋아요 취소, 댓글 삭제처럼 이전 이벤트를 되돌리는 경우 True
+    """
+    if not isinstance(post_ids, (list, tuple, set)):
+        post_ids = [post_ids]
+    amount = event_weight(event) * count * (-1 if cancel else 1)
+    Post.objects.filter(pk__in=post_ids).update(
+        trending_score=score_update(amount, occurred)
+    )
+
+
+def initial_score(events, now=None):
+    """
+    (이벤트 종류, 시각, 수) 목록으로 점수를 계산합니다. (rebuild_trending_scores 에서 사용)
+
+    Args:
+        events (iterable): (event, datetime, count) 튜플
+        now (datetime, optional): 현재 시각
+
+    Returns:
+        float: trending_score 값 (이벤트가 없으면 0.0)
+    """
+    x = _exponent(now)
+    total = sum(
+        event_weight(event) * count * 2 ** max(_exponent(when) - x, MIN_EXPONENT)
+        for event, when, count in events
+    )
+    return x + math.log2(total) if total > 0 else 0.0
+
+
+def heat(post, now=None):
+    """
+    게시물의 현재 감쇠 점수(가중치 합)를 반환합니다.
+
+    Args:
+        post (Post): trending_score 가 있는 게시물
+        now (datetime, optional): 현재 시각
+
+    Returns:
+        float: 지금 기준으로 감쇠된 가중치 합 (반감기가 지날 때마다 절반)
+    """
+    exponent = post.trending_score - _exponent(now)
+    return 2**exponent if exponent > MIN_EXPONENT else 0.0
+
+
+def trending_posts(limit=10, queryset=None):
+    """
+    발행된 게시물을 현재 인기 순으로 limit 개 반환합니다.
+
+    (status, trending_score) 인덱스를 따라 읽으므로 게시물 수와 관계없이
+    limit 개만 읽습니다.
+
+    Args:
+        limit (int): 게시물 수
+        queryset (QuerySet, optional): 기본 쿼리셋 (select_related 등)
+
+    Returns:
+        QuerySet: 인기 순으로 정렬된 게시물
+    """
+    queryset = Post.objects.all() if queryset is None else queryset
+    return queryset.filter(status="published").order_by("-trending_score", "-pk")[
+        :limit
+    ]
@@ -21,6 +21,8 @@ urlpatterns = [
     path("", PostList.as_view(), name="post_list"),
     # 게시물 상세 보기
     path("<int:pk>/", PostDetail.as_view(), name="post_detail"),
+    # 첨부 파일 다운로드
+    path("<int:pk>/file/", views.download_file, name="post_file"),
     # 새 게시물 작성 페이지
     path("write/", PostCreate.as_view(), name="post_create"),
     # 기존 게시물 수정 페이지
@@ -31,16 +33,45 @@ urlpatterns = [
     path("search/", PostSearchView.as_view(), name="search"),
     # 댓글 생성
     path("<int:pk>/comment/", CommentCreate.as_view(), name="comment_create"),
+    # 최상위 댓글 다음 페이지 (HTML 조각)
+    path("<int:pk>/comments/", views.comment_list, name="comment_list"),
+    # 댓글의 답글 트리 (HTML 조각)
+    path(
+        "<int:pk>/comments/<int:comment_pk>/replies/",
+        views.comment_replies,
+        name="comment_replies",
+    ),
     # 댓글 수정
     path("comment/<int:pk>/update/", CommentUpdate.as_view(), name="comment_update"),
     # 댓글 삭제
     path("comment/<int:pk>/delete/", CommentDelete.as_view(), name="comment_delete"),
     # 카테고리별 게시물 목록
     path("category/<slug:slug>/", category_page, name="category_page"),
+    # 최근 게시물 피드 (RSS/Atom)
+    path("feed/", views.post_feed, name="post_feed"),
+    path("feed/atom/", views.post_feed, {"feed_format": "atom"}, name="post_feed_atom"),
+    # 카테고리별 피드
+    path("category/<slug:slug>/feed/", views.category_feed, name="category_feed"),
+    path(
+        "category/<slug:slug>/feed/atom/",
+        views.category_feed,
+        {"feed_format": "atom"},
+        name="category_feed_atom",
+    ),
+    # 인기 게시물 페이지
+    path("trending/", views.trending, name="trending"),
     # 태그 목록
     path("tags/", views.tag_list, name="tag_list"),
     # 태그별 게시물 목록
     path("tag/<str:slug>/", views.tag_page, name="tag_page"),
+    # 태그별 피드
+    path("tag/<str:slug>/feed/", views.tag_feed, name="tag_feed"),
+    path(
+        "tag/<str:slug>/feed/atom/",
+        views.tag_feed,
+        {"feed_format": "atom"},
+        name="tag_feed_atom",
+    ),
     # 게시물 좋아요
     path("like/<int:post_id>/", views.like_post, name="like_post"),
     # 북마크 토글
@@ -58,9 +89,10 @@ urlpatterns = [
 
 주요 기능:
 - 게시물 목록, 상세 보기, 생성, 수정, 삭제
-- 댓글 생성, 수정, 삭제
+- 댓글 생성, 수정, 삭제 및 댓글/답글 나눠 불러오기
 - 카테고리 및 태그별 게시물 필터링
 - 게시물 검색
+- 최근 게시물, 카테고리, 태그별 RSS/Atom 피드
 - 좋아요 및 북마크 기능
 
 각 URL 패턴에는 고유한 이름이 지정되어 있어, 
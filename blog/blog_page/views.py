@@ -1,5 +1,8 @@
 import logging, json
-from django.shortcuts import get_object_or_404, render, redirect
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.shortcuts import aget_object_or_404, get_object_or_404, render, redirect
 from django.views.generic import (
     ListView,
     DetailView,
@@ -8,22 +11,38 @@ from django.views.generic import (
     DeleteView,
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.auth.decorators import login_required
-from django.urls import reverse_lazy
+from django.contrib.auth.views import redirect_to_login
+from django.urls import reverse, reverse_lazy
 from django.utils.text import slugify
-from django.db.models import Q
+from django.db import IntegrityError, transaction
 from django.contrib import messages
-from django.http import HttpResponseRedirect, HttpResponseForbidden, JsonResponse
-from django.views.decorators.http import require_POST
+from django.http import (
+    Http404,
+    HttpResponseRedirect,
+    HttpResponseForbidden,
+    JsonResponse,
+)
+from django.views.decorators.http import require_POST, require_safe
 from .models import Post, Category, Tag, Comment, Like, Bookmark
 from .forms import CommentForm, PostForm
+from .comments import build_comment_tree, reply_page, top_level_page
+from .counters import view_counter
+from .search import search_posts
+from .pagination import KeysetPaginationMixin, KeysetPaginator
+from .page_cache import cache_anonymous_page
+from .media import serve_file
+from .tag_index import get_tag_cloud
+from .trending import trending_posts
+from .feeds import LATEST_SCOPE, category_scope, serve_feed, tag_scope
 from django.template.loader import render_to_string
 from django.core.exceptions import PermissionDenied
 from django.utils.decorators import method_decorator
+from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import View
 
 
-class PostList(ListView):
+@method_decorator(cache_anonymous_page(), name="dispatch")
+class PostList(KeysetPaginationMixin, ListView):
     """
     게시물 목록을 보여주는 뷰입니다.
 
@@ -32,12 +51,14 @@ class PostList(ListView):
         ordering: 정렬 기준
         template_name: 사용할 템플릿 파일 이름
         context_object_name: 템플릿에서 사용할 객체 리스트의 이름
+        paginate_by: 페이지당 게시물 수 (커서 기반 페이지네이션)
     """
 
     model = Post
     ordering = "-pk"
     template_name = "blog_page/post_list.html"
     context_object_name = "posts"
+    paginate_by = 12
 
     def get_context_data(self, **kwargs):
         """
@@ -47,11 +68,20 @@ class PostList(ListView):
             dict: 추가된 컨텍스트 데이터
         """
         context = super().get_context_data(**kwargs)
-        context["category_list"] = Category.objects.all().order_by("-name")
-        context["no_category_post_count"] = Post.objects.filter(category=None).count()
         context["search_keyword"] = self.request.GET.get("q", "")
         return context
 
+    def get_keyset_ordering(self):
+        """
+        검색어가 있으면 관련도 순, 없으면 최신 글 순으로 정렬합니다.
+
+        Returns:
+            tuple: 정렬 키 목록
+        """
+        if self.request.GET.get("q"):
+            return ("-search_score", "-pk")
+        return ("-pk",)
+
     def get_queryset(self):
         """
         표시할 게시물 쿼리셋을 반환합니다.
@@ -60,17 +90,27 @@ class PostList(ListView):
         Returns:
             QuerySet: 필터링된 게시물 쿼리셋
         """
-        queryset = super().get_queryset().filter(status="published")
+        queryset = (
+            super()
+            .get_queryset()
+            .filter(status="published")
+            .for_listing()
+            .select_related("author", "category")
+            .prefetch_related("tags")
+            .with_user_state(self.request.user)
+        )
         search_keyword = self.request.GET.get("q")
         if search_keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=search_keyword)
-                | Q(content__icontains=search_keyword)
-                | Q(tags__name__icontains=search_keyword)
-            ).distinct()
+            queryset = search_posts(search_keyword, queryset)
         return queryset
 
 
+def _count_cached_view(request, pk):
+    """캐시된 응답이나 304 로 응답한 상세 페이지 조회도 조회수에 반영합니다."""
+    view_counter.incr(pk)
+
+
+@method_decorator(cache_anonymous_page(on_hit=_count_cached_view), name="dispatch")
 class PostDetail(DetailView):
     """
     개별 게시물의 상세 정보를 보여주는 뷰입니다.
@@ -83,16 +123,31 @@ class PostDetail(DetailView):
     model = Post
     template_name = "blog_page/post_detail.html"
 
+    def get_queryset(self):
+        """
+        작성자, 카테고리와 현재 사용자의 좋아요/북마크 여부를 함께 불러옵니다.
+
+        Returns:
+            QuerySet: 게시물 쿼리셋
+        """
+        return (
+            super()
+            .get_queryset()
+            .select_related("author", "category")
+            .with_user_state(self.request.user)
+        )
+
     def get_object(self, queryset=None):
         """
         조회수를 증가시키고 게시물 객체를 반환합니다.
+        조회수는 버퍼에 쌓였다가 일괄 반영되므로, 화면에는 반영 대기 중인 값을 더해 보여줍니다.
 
         Returns:
             Post: 조회된 게시물 객체
         """
         post = super().get_object(queryset)
-        post.views_count += 1
-        post.save(update_fields=["views_count"])
+        view_counter.incr(post.pk)
+        post.views_count += view_counter.pending(post.pk)
         return post
 
     def get_context_data(self, **kwargs):
@@ -103,38 +158,89 @@ class PostDetail(DetailView):
             dict: 추가된 컨텍스트 데이터
         """
         context = super().get_context_data(**kwargs)
-        context["categories"] = Category.objects.all().order_by("-name")
-        context["no_category_post_count"] = Post.objects.filter(category=None).count()
         context["comment_form"] = CommentForm
         context["current_user"] = self.request.user
 
-        comments = self.object.comment_set.filter(parent=None).order_by("created_at")
-        comment_tree = self.build_comment_tree(comments)
-        context["comment_tree"] = comment_tree
+        # 답글은 수만 보여주고, 나머지 댓글과 답글은 comment_list/comment_replies 로 불러옵니다.
+        comments = top_level_page(self.object.pk)
+        context["comment_tree"] = build_comment_tree(comments)
+        context["comments_next"] = _comments_next_url(self.object.pk, comments)
 
         context["related_posts"] = self.object.related_posts.all()
         return context
 
-    def build_comment_tree(self, comments):
-        """
-        댓글 트리를 구성합니다.
 
-        Args:
-            comments (QuerySet): 상위 댓글 쿼리셋
+def _comments_next_url(post_id, page):
+    """최상위 댓글의 다음 페이지를 불러올 URL 을 반환합니다. 마지막 페이지면 None"""
+    if not page.has_next:
+        return None
+    url = reverse("blog_page:comment_list", kwargs={"pk": post_id})
+    return f"{url}?cursor={page.next_cursor}"
 
-        Returns:
-            list: 댓글 트리 구조
-        """
-        comment_tree = []
-        for comment in comments:
-            comment_dict = {
-                "comment": comment,
-                "replies": self.build_comment_tree(
-                    comment.replies.all().order_by("created_at")
-                ),
-            }
-            comment_tree.append(comment_dict)
-        return comment_tree
+
+@require_safe
+@cache_anonymous_page()
+def comment_list(request, pk):
+    """
+    게시물의 최상위 댓글 한 페이지를 HTML 조각으로 보여주는 뷰 함수입니다.
+    상세 페이지의 "댓글 더 보기"에서 호출합니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        pk (int): 게시물의 기본 키
+
+    Returns:
+        JsonResponse: {"html", "next"} (next 는 다음 페이지 URL, 마지막 페이지면 None)
+
+    Raises:
+        Http404: 게시물이 없는 경우
+    """
+    if not Post.objects.filter(pk=pk).exists():
+        raise Http404("게시물이 없습니다.")
+    comments = top_level_page(pk, request.GET.get("cursor"))
+    html = render_to_string(
+        "blog_page/comment_list.html",
+        {"comment_tree": build_comment_tree(comments)},
+        request=request,
+    )
+    return JsonResponse({"html": html, "next": _comments_next_url(pk, comments)})
+
+
+@require_safe
+@cache_anonymous_page()
+def comment_replies(request, pk, comment_pk):
+    """
+    댓글 하나의 하위 댓글(답글 트리) 한 페이지를 HTML 조각으로 보여주는 뷰 함수입니다.
+    접힌 댓글의 "답글 N개 보기"와 "답글 더 보기"에서 호출합니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        pk (int): 게시물의 기본 키
+        comment_pk (int): 답글을 불러올 댓글의 기본 키
+
+    Returns:
+        JsonResponse: {"html", "count", "next"}
+            (count 는 불러온 답글 수, next 는 다음 페이지 URL, 마지막 페이지면 None)
+
+    Raises:
+        Http404: 게시물에 그 댓글이 없는 경우
+    """
+    comment = get_object_or_404(
+        Comment.objects.only("post_id", "path"), pk=comment_pk, post_id=pk
+    )
+    replies = reply_page(comment, request.GET.get("cursor"))
+    html = render_to_string(
+        "blog_page/comment_list.html",
+        {"comment_tree": build_comment_tree(replies)},
+        request=request,
+    )
+    next_url = None
+    if replies.has_next:
+        url = reverse(
+            "blog_page:comment_replies", kwargs={"pk": pk, "comment_pk": comment_pk}
+        )
+        next_url = f"{url}?cursor={replies.next_cursor}"
+    return JsonResponse({"html": html, "count": len(replies), "next": next_url})
 
 
 def category_page(request, slug):
@@ -149,18 +255,42 @@ def category_page(request, slug):
         HttpResponse: 렌더링된 카테고리 페이지
     """
     category = get_object_or_404(Category, slug=slug)
-    posts = Post.objects.filter(category=category).order_by("-pk")
+    paginator = KeysetPaginator(
+        Post.objects.filter(category=category).for_listing(), ("-pk",)
+    )
+    posts = paginator.get_page(request.GET.get("cursor"))
     context = {
         "category": category,
         "posts": posts,
-        "categories": Category.objects.all().order_by("-name"),
     }
     return render(request, "blog_page/category_list.html", context)
 
 
+# 인기 게시물 페이지에 보여줄 게시물 수
+TRENDING_PAGE_SIZE = 20
+
+
+@cache_anonymous_page()
+def trending(request):
+    """
+    발행된 게시물을 시간 감쇠 인기 점수(trending.py) 순으로 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+
+    Returns:
+        HttpResponse: 렌더링된 인기 게시물 페이지
+    """
+    posts = trending_posts(
+        TRENDING_PAGE_SIZE, Post.objects.select_related("author").for_listing()
+    )
+    return render(request, "blog_page/trending.html", {"posts": posts})
+
+
 def tag_list(request):
     """
-    모든 태그 목록을 보여주는 뷰 함수입니다.
+    발행된 게시물이 있는 공개 태그를 게시물 수에 따라 크기가 다른 태그 구름으로 보여주는
+    뷰 함수입니다. ?top=N 을 주면 게시물이 많은 상위 N 개만 보여줍니다.
 
     Args:
         request (HttpRequest): HTTP 요청 객체
@@ -168,13 +298,15 @@ def tag_list(request):
     Returns:
         HttpResponse: 렌더링된 태그 목록 페이지
     """
-    tags = Tag.objects.all().order_by("name")
-    return render(request, "blog_page/tag_list.html", {"tags": tags})
+    top = request.GET.get("top", "")
+    limit = int(top) if top.isdigit() and int(top) > 0 else None
+    tags = get_tag_cloud(limit=limit)
+    return render(request, "blog_page/tag_list.html", {"tags": tags, "top": limit})
 
 
 def tag_page(request, slug):
     """
-    특정 태그가 달린 게시물 목록을 보여주는 뷰 함수입니다.
+    특정 공개 태그가 달린 발행 게시물 목록을 보여주는 뷰 함수입니다.
 
     Args:
         request (HttpRequest): HTTP 요청 객체
@@ -183,11 +315,110 @@ def tag_page(request, slug):
     Returns:
         HttpResponse: 렌더링된 태그 페이지
     """
-    tag = get_object_or_404(Tag, slug=slug)
-    posts = Post.objects.filter(tags=tag).order_by("-created_at")
+    tag = get_object_or_404(Tag, slug=slug, is_public=True)
+    paginator = KeysetPaginator(
+        Post.objects.filter(tags=tag, status="published").for_listing(),
+        ("-created_at", "-pk"),
+    )
+    posts = paginator.get_page(request.GET.get("cursor"))
     return render(request, "blog_page/tag_page.html", {"tag": tag, "posts": posts})
 
 
+@require_safe
+def post_feed(request, feed_format="rss"):
+    """
+    최근 발행된 게시물의 RSS/Atom 피드를 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        feed_format (str): "rss" 또는 "atom"
+
+    Returns:
+        HttpResponse: 피드 문서 또는 304 응답
+    """
+
+    def load():
+        return (
+            "The Blog",
+            reverse("blog_page:post_list"),
+            "최근 게시물",
+            Post.objects.all(),
+        )
+
+    return serve_feed(request, LATEST_SCOPE, feed_format, load)
+
+
+@require_safe
+def category_feed(request, slug, feed_format="rss"):
+    """
+    특정 카테고리에 최근 발행된 게시물의 RSS/Atom 피드를 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        slug (str): 카테고리 슬러그
+        feed_format (str): "rss" 또는 "atom"
+
+    Returns:
+        HttpResponse: 피드 문서 또는 304 응답
+    """
+
+    def load():
+        category = get_object_or_404(Category, slug=slug)
+        return (
+            f"The Blog - {category.name}",
+            category.get_absolute_url(),
+            f"{category.name} 카테고리의 최근 게시물",
+            Post.objects.filter(category=category),
+        )
+
+    return serve_feed(request, category_scope(slug), feed_format, load)
+
+
+@require_safe
+def tag_feed(request, slug, feed_format="rss"):
+    """
+    특정 공개 태그가 달린 최근 발행 게시물의 RSS/Atom 피드를 보여주는 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        slug (str): 태그 슬러그
+        feed_format (str): "rss" 또는 "atom"
+
+    Returns:
+        HttpResponse: 피드 문서 또는 304 응답
+    """
+
+    def load():
+        tag = get_object_or_404(Tag, slug=slug, is_public=True)
+        return (
+            f"The Blog - #{tag.name}",
+            tag.get_absolute_url(),
+            f"#{tag.name} 태그가 달린 최근 게시물",
+            Post.objects.filter(tags=tag),
+        )
+
+    return serve_feed(request, tag_scope(slug), feed_format, load)
+
+
+@require_safe
+def download_file(request, pk):
+    """
+    게시물의 첨부 파일을 원래 파일 이름으로 내려보내는 뷰 함수입니다.
+    Range 요청(이어받기)과 조건부 요청을 지원합니다. (media.py 참고)
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        pk (int): 게시물의 기본 키
+
+    Returns:
+        HttpResponse: 첨부 파일 응답
+    """
+    post = get_object_or_404(Post.objects.only("file_upload", "file_name"), pk=pk)
+    if not post.file_upload:
+        raise Http404("첨부 파일이 없습니다.")
+    return serve_file(request, post.file_upload.name, post.get_file_name())
+
+
 class PostCreate(LoginRequiredMixin, CreateView):
     """
     새 게시물을 작성하는 뷰입니다.
@@ -268,24 +499,6 @@ class PostUpdate(LoginRequiredMixin, UpdateView):
             raise PermissionDenied
         return obj
 
-    def form_valid(self, form):
-        """
-        폼이 유효할 때 실행되는 메서드입니다.
-        태그를 처리합니다.
-
-        Args:
-            form (PostForm): 제출된 폼
-
-        Returns:
-            HttpResponse: 폼 처리 결과
-        """
-        response = super().form_valid(form)
-        self.object.tags.clear()
-        for tag_name in form.cleaned_data["tags"]:
-            tag, _ = Tag.objects.get_or_create(name=tag_name)
-            self.object.tags.add(tag)
-        return response
-
     def get_initial(self):
         """
         폼의 초기 데이터를 설정합니다.
@@ -341,7 +554,7 @@ class PostDelete(LoginRequiredMixin, DeleteView):
         return redirect(self.success_url)
 
 
-class PostSearchView(ListView):
+class PostSearchView(KeysetPaginationMixin, ListView):
     """
     게시물 검색 결과를 보여주는 뷰입니다.
 
@@ -349,26 +562,28 @@ class PostSearchView(ListView):
         model: 사용할 모델
         template_name: 사용할 템플릿 파일 이름
         context_object_name: 템플릿에서 사용할 객체 리스트의 이름
+        keyset_ordering: 관련도 순 정렬 키 (커서 기반 페이지네이션)
     """
 
     model = Post
     template_name = "blog_page/post_search.html"
     context_object_name = "post_list"
+    keyset_ordering = ("-search_score", "-pk")
 
     def get_queryset(self):
         """
         검색 결과 쿼리셋을 반환합니다.
 
         Returns:
-            QuerySet: 검색된 게시물 쿼리셋
+            QuerySet: 관련도 순으로 정렬된 검색 결과 쿼리셋
         """
         query = self.request.GET.get("q")
         if query:
-            return Post.objects.filter(
-                Q(title__icontains=query)
-                | Q(content__icontains=query)
-                | Q(tags__name__icontains=query)
-            ).distinct()
+            return (
+                search_posts(query, Post.objects.for_listing())
+                .select_related("author", "category")
+                .prefetch_related("tags")
+            )
         return Post.objects.none()
 
     def get_context_data(self, **kwargs):
@@ -386,11 +601,15 @@ class PostSearchView(ListView):
 logger = logging.getLogger(__name__)
 
 
-@method_decorator(require_POST, name="dispatch")
-class CommentCreate(LoginRequiredMixin, View):
-    """댓글을 생성하는 뷰입니다."""
+class CommentCreate(View):
+    """
+    댓글을 생성하는 비동기 뷰입니다.
 
-    def post(self, request, pk):
+    ASGI 로 서빙될 때 작업자 스레드를 점유하지 않도록 비동기 ORM 으로 처리합니다.
+    POST 외의 메서드는 View 가 405 로 응답합니다.
+    """
+
+    async def post(self, request, pk):
         """
         POST 요청을 처리하여 댓글을 생성합니다.
 
@@ -401,17 +620,22 @@ class CommentCreate(LoginRequiredMixin, View):
         Returns:
             JsonResponse: 처리 결과를 JSON 형식으로 반환
         """
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
         try:
-            post = get_object_or_404(Post, pk=pk)
+            post = await aget_object_or_404(Post, pk=pk)
             form = CommentForm(request.POST)
-            if form.is_valid():
+            # 부모 댓글 검증이 DB 를 조회하므로 동기 컨텍스트에서 실행합니다.
+            if await sync_to_async(form.is_valid)():
                 comment = form.save(commit=False)
                 comment.post = post
-                comment.author = request.user
-                comment.save()
+                comment.author = user
+                # 댓글과 시그널이 바꾸는 게시물 카운터, 인기 점수를 함께 커밋합니다.
+                await sync_to_async(transaction.atomic()(comment.save))()
 
-                context = {"comment": comment}
-                html = render_to_string(
+                context = {"comment": comment, "user": user}
+                html = await sync_to_async(render_to_string)(
                     "blog_page/comment.html", context, request=request
                 )
                 return JsonResponse({"success": True, "html": html})
@@ -419,9 +643,198 @@ class CommentCreate(LoginRequiredMixin, View):
                 # 폼 오류를 JSON으로 변환
                 errors = json.loads(form.errors.as_json())
                 return JsonResponse({"success": False, "errors": errors}, status=400)
+        except Http404:
+            raise
         except json.JSONDecodeError:
             return JsonResponse(
                 {"success": False, "errors": "잘못된 요청 형식입니다."}, status=400
             )
-        except Exception as e:
-            return JsonResponse
+        except Exception:
+            # 예외 메시지에는 내부 정보가 담길 수 있으므로 로그에만 남깁니다.
+            logger.exception("댓글 생성 중 오류가 발생했습니다.")
+            return JsonResponse(
+                {"success": False, "errors": "댓글을 저장하지 못했습니다."}, status=500
+            )
+
+
+@method_decorator(require_POST, name="dispatch")
+class CommentUpdate(LoginRequiredMixin, View):
+    """댓글을 수정하는 뷰입니다."""
+
+    def post(self, request, pk):
+        """
+        POST 요청을 처리하여 댓글을 수정합니다.
+
+        Args:
+            request (HttpRequest): HTTP 요청 객체
+            pk (int): 댓글의 기본 키
+
+        Returns:
+            JsonResponse: 처리 결과를 JSON 형식으로 반환
+        """
+        comment = get_object_or_404(Comment, pk=pk)
+        if comment.author != request.user:
+            return JsonResponse(
+                {"success": False, "errors": "수정 권한이 없습니다."}, status=403
+            )
+        content = request.POST.get("content", "").strip()
+        if not content:
+            return JsonResponse(
+                {"success": False, "errors": {"content": ["내용을 입력하세요."]}},
+                status=400,
+            )
+        comment.content = content
+        comment.save()
+        return JsonResponse({"success": True, "content": comment.content})
+
+
+@method_decorator(require_POST, name="dispatch")
+class CommentDelete(LoginRequiredMixin, View):
+    """댓글을 삭제하는 뷰입니다."""
+
+    def post(self, request, pk):
+        """
+        POST 요청을 처리하여 댓글을 삭제합니다.
+
+        Args:
+            request (HttpRequest): HTTP 요청 객체
+            pk (int): 댓글의 기본 키
+
+        Returns:
+            JsonResponse: 처리 결과를 JSON 형식으로 반환
+        """
+        comment = get_object_or_404(Comment, pk=pk)
+        if comment.author != request.user:
+            return JsonResponse(
+                {"success": False, "errors": "삭제 권한이 없습니다."}, status=403
+            )
+        comment.delete()
+        return JsonResponse({"success": True})
+
+
+def _is_ajax(request):
+    """요청이 AJAX(fetch) 요청인지 확인합니다."""
+    return request.headers.get("x-requested-with") == "XMLHttpRequest"
+
+
+def _redirect_back(request, post):
+    """
+    좋아요/북마크 처리 후 이전 페이지 또는 게시물 상세 페이지로 이동합니다.
+
+    next 는 사용자가 보낸 값이므로 이 사이트의 URL 일 때만 따라갑니다. (열린 리다이렉트 방지)
+    """
+    next_url = request.POST.get("next")
+    if not url_has_allowed_host_and_scheme(
+        next_url, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+    ):
+        next_url = post.get_absolute_url()
+    return redirect(next_url)
+
+
+def _async_login_required(view):
+    """
+    비동기 뷰용 로그인 확인 데코레이터입니다.
+
+    request.user 는 동기 지연 객체라 비동기 컨텍스트에서 쓸 수 없으므로
+    request.auser() 로 사용자를 확인합니다.
+    """
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+@sync_to_async
+def _atoggle(model, user, post):
+    """
+    사용자와 게시물 사이의 Like/Bookmark 행을 토글합니다.
+
+    행의 생성/삭제와 시그널이 바꾸는 게시물 카운터, 인기 점수가 함께 커밋되도록
+    하나의 트랜잭션에서 처리합니다. 비동기 ORM 은 트랜잭션을 지원하지 않으므로
+    동기 함수로 작성하고 sync_to_async 로 감쌌습니다.
+
+    Args:
+        model (Model): Like 또는 Bookmark
+        user (CustomUser): 현재 사용자
+        post (Post): 대상 게시물
+
+    Returns:
+        bool: 토글 후 행이 있으면 True, 없으면 False
+    """
+    with transaction.atomic():
+        deleted, _ = model.objects.filter(user=user, post=post).delete()
+        if deleted:
+            return False
+        try:
+            with transaction.atomic():
+                model.objects.create(user=user, post=post)
+        except IntegrityError:
+            # 동시에 들어온 같은 요청이 먼저 만든 경우: 실제 DB 상태를 돌려줍니다.
+            return model.objects.filter(user=user, post=post).exists()
+        return True
+
+
+async def _acounter(post, field):
+    """게시물의 카운터 컬럼 현재 값을 조회합니다."""
+    return await Post.objects.filter(pk=post.pk).values_list(field, flat=True).aget()
+
+
+@_async_login_required
+@require_POST
+async def like_post(request, post_id):
+    """
+    게시물 좋아요를 토글하는 비동기 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        post_id (int): 게시물의 기본 키
+
+    Returns:
+        HttpResponse: AJAX 요청이면 JSON, 아니면 리다이렉트 응답
+    """
+    post = await aget_object_or_404(Post.objects.only("pk"), pk=post_id)
+    created = await _atoggle(Like, await request.auser(), post)
+    if _is_ajax(request):
+        return JsonResponse(
+            {
+                "status": "success",
+                "is_liked": created,
+                "likes_count": await _acounter(post, "likes_count"),
+            }
+        )
+    return _redirect_back(request, post)
+
+
+@_async_login_required
+@require_POST
+async def toggle_bookmark(request, post_id):
+    """
+    게시물 북마크를 토글하는 비동기 뷰 함수입니다.
+
+    Args:
+        request (HttpRequest): HTTP 요청 객체
+        post_id (int): 게시물의 기본 키
+
+    Returns:
+        HttpResponse: AJAX 요청이면 JSON, 아니면 리다이렉트 응답
+    """
+    post = await aget_object_or_404(Post.objects.only("pk"), pk=post_id)
+    created = await _atoggle(Bookmark, await request.auser(), post)
+    if _is_ajax(request):
+        return JsonResponse(
+            {
+                "status": "success",
+                "is_bookmarked": created,
+                "bookmarks_count": await _acounter(post, "bookmarks_count"),
+            }
+        )
+    return _redirect_back(request, post)
+
+
+# 이전 URL 이름(bookmark_post)과의 호환을 위한 별칭
+bookmark_post = toggle_bookmark
@@ -43,6 +43,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "blog_page.instrumentation.QueryInstrumentationMiddleware",
+    "blog_page.replicas.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -56,7 +58,8 @@ ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # 템플릿 렌더링 시간을 측정하는 DjangoTemplates 백엔드 (blog_page.instrumentation)
+        "BACKEND": "blog_page.instrumentation.InstrumentedDjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -76,13 +79,170 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# SQLite 연결마다 적용하는 설정
+# - WAL: 읽기가 쓰기를, 쓰기가 읽기를 막지 않습니다.
+# - synchronous=NORMAL: WAL 에서는 커밋마다 fsync 하지 않아도 DB 가 깨지지 않습니다.
+#   (전원이 꺼지면 마지막 커밋 몇 개가 사라질 수 있습니다)
+# - mmap_size: 읽기를 read() 대신 메모리 매핑으로 처리합니다.
+# - timeout: 잠긴 DB 를 기다리는 시간(초, busy timeout)
+# - transaction_mode=IMMEDIATE: 트랜잭션 시작 시 쓰기 잠금을 잡아, 읽다가 쓰기로
+#   바꿀 때 기다리지 않고 "database is locked" 로 실패하는 일을 막습니다.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+SQLITE_OPTIONS = {
+    "init_command": ";".join(
+        f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+    ),
+    "timeout": 20,
+    "transaction_mode": "IMMEDIATE",
+}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": SQLITE_OPTIONS,
+    }
+}
+
+# 읽기 전용 복제본 (blog_page.replicas)
+# REPLICA_DB_NAME 환경 변수에 복제본 SQLite 파일 경로를 주면 REPLICA_VIEWS 의 읽기를
+# 복제본으로 보냅니다. 로컬에서는 python manage.py sync_replica 로 만들고 갱신합니다.
+# 테스트에서는 복제본 파일 대신 주 DB 의 테스트 DB 를 가리키고(MIRROR),
+# config.test_runner 가 REPLICA_DATABASE 를 꺼서 읽기를 주 DB 에서 합니다.
+if os.environ.get("REPLICA_DB_NAME"):
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ["REPLICA_DB_NAME"],
+        "OPTIONS": {
+            "init_command": f"PRAGMA mmap_size={SQLITE_PRAGMAS['mmap_size']};"
+            "PRAGMA query_only=ON",
+            "timeout": SQLITE_OPTIONS["timeout"],
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASE = "replica" if "replica" in DATABASES else None
+# 복제본에서 읽는 화면 (URL 이름, GET/HEAD 요청만)
+REPLICA_VIEWS = [
+    "blog_page:post_list",
+    "blog_page:post_detail",
+    "blog_page:search",
+    "blog_page:category_page",
+    "blog_page:tag_list",
+    "blog_page:tag_page",
+    "blog_page:trending",
+    "blog_page:comment_list",
+    "blog_page:comment_replies",
+    "blog_page:post_feed",
+    "blog_page:post_feed_atom",
+    "blog_page:category_feed",
+    "blog_page:category_feed_atom",
+    "blog_page:tag_feed",
+    "blog_page:tag_feed_atom",
+    "sitemap_index",
+    "sitemap_section",
+]
+# 쓰기 요청을 보낸 사용자와, 내용이 바뀐 직후의 모든 사용자가 주 DB 에서 읽는 시간(초)
+# 복제 지연보다 길게 둡니다.
+REPLICA_STICKY_SECONDS = 5
+
+DATABASE_ROUTERS = ["blog_page.replicas.ReplicaRouter"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# 여러 워커 프로세스가 페이지 캐시 등을 공유하려면 Redis/Memcached 로 바꿔야 합니다.
+# (조회수 버퍼는 캐시가 아니라 PostViewBuffer 테이블을 씁니다)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "blog",
     }
 }
 
+# 조회수 쓰기 지연 버퍼 (blog_page.counters)
+VIEW_COUNT_FLUSH_THRESHOLD = 100  # 누적 조회수가 이 값을 넘으면 DB에 반영
+VIEW_COUNT_FLUSH_INTERVAL = 30  # 마지막 반영 후 이 시간(초)이 지나면 DB에 반영
+# 조회가 없어도 VIEW_COUNT_FLUSH_INTERVAL 마다 반영하는 타이머 스레드
+VIEW_COUNT_FLUSH_TIMER = True
+
+# 요청 계측 미들웨어 (blog_page.instrumentation)
+# URL 이름별 쿼리 수 예산. 넘으면 QUERY_BUDGET_ACTION 에 따라 경고 로그("log") 또는 예외("raise")
+QUERY_BUDGETS = {
+    "blog_page:post_list": 8,
+    "blog_page:post_detail": 8,
+    "blog_page:search": 8,
+    "blog_page:category_page": 6,
+    "blog_page:tag_list": 6,
+    "blog_page:tag_page": 6,
+    "blog_page:trending": 6,
+    # 댓글 API 는 게시물(댓글) 확인과 댓글 조회 한 번씩입니다.
+    "blog_page:comment_list": 4,
+    "blog_page:comment_replies": 4,
+    # 피드는 바뀐 게시물의 항목만 다시 만듭니다. (게시물 ID, 게시물, 태그)
+    "blog_page:post_feed": 4,
+    "blog_page:post_feed_atom": 4,
+    "blog_page:category_feed": 5,
+    "blog_page:category_feed_atom": 5,
+    "blog_page:tag_feed": 5,
+    "blog_page:tag_feed_atom": 5,
+    # 사이트맵 색인은 구역마다 GROUP BY 한 번, 조각은 청크로 나눠 읽는 쿼리 하나입니다.
+    "sitemap_index": 3,
+    "sitemap_section": 1,
+    # 게시물 저장은 태그 동기화와 검색 색인 갱신(저장, 태그 추가/삭제마다)을 포함합니다.
+    "blog_page:post_create": 35,
+    "blog_page:post_edit": 35,
+    # 토글은 트랜잭션과 동시 요청에 대비한 세이브포인트를 포함합니다.
+    "blog_page:like_post": 12,
+    "blog_page:toggle_bookmark": 12,
+    "blog_page:comment_create": 10,
+    "blog_page:comment_update": 8,
+    "blog_page:comment_delete": 8,
+    "accounts:profile": 6,
+}
+# 테스트 중에는 예산 초과를 실패로 처리합니다. (config.test_runner)
+QUERY_BUDGET_ACTION = "log"
+# 응답에 Server-Timing 헤더(db, tpl, total)를 붙일지 여부
+SERVER_TIMING = DEBUG
+
+# 익명 사용자 페이지 캐시 유지 시간(초) (blog_page.page_cache)
+# 내용이 바뀌면 시그널로 바로 무효화되므로 오래 두어도 됩니다.
+PAGE_CACHE_TIMEOUT = 300
+
+# 게시물 상세 페이지와 댓글 API 의 최상위 댓글(답글) 페이지 크기 (blog_page.comments)
+# 답글은 수만 보여주고 "답글 N개 보기"를 누르면 이 크기씩 불러옵니다.
+COMMENT_PAGE_SIZE = 20
+
+# RSS/Atom 피드 (blog_page.feeds)
+FEED_SIZE = 20  # 피드에 넣을 최근 게시물 수
+# 피드 문서와 항목은 버전으로 무효화되므로 오래 두어도 됩니다.
+FEED_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 사이트맵 (blog_page.sitemaps)
+# 게시물/카테고리/태그를 기본 키 범위로 나눈 조각 하나의 크기. 사이트맵 한도(5만 개) 이하로 둡니다.
+SITEMAP_SHARD_SIZE = 10000
+SITEMAP_CHUNK_SIZE = 2000  # 조각을 만들 때 한 번에 읽는 행 수
+SITEMAP_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 인기 게시물 점수 (blog_page.trending)
+# 조회/좋아요/댓글/발행 이벤트마다 가중치를 더하고, 반감기(초)마다 절반으로 줄어듭니다.
+# 반감기나 가중치를 바꾸면 rebuild_trending_scores 로 점수를 다시 계산합니다.
+TRENDING_HALF_LIFE = 60 * 60 * 24
+TRENDING_WEIGHTS = {"view": 1, "like": 5, "comment": 8, "publish": 20}
+
+# 대표 이미지 파생본, 관련 게시물 갱신 등을 처리하는 작업자 스레드 수
+# (0이면 요청 안에서 바로 처리, blog_page.background)
+BACKGROUND_WORKERS = 2
+
+
+# 테스트 러너: 테스트 중에만 쓰는 설정(config.test_runner.TEST_SETTINGS)을 적용합니다.
+TEST_RUNNER = "config.test_runner.TestRunner"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -108,7 +268,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = "ko-kr"
 
-TIME_ZONE = "Asia/seoul"
+TIME_ZONE = "Asia/Seoul"
 
 USE_I18N = True
 
@@ -123,9 +283,34 @@ STATIC_URL = "/static/"
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR / "static"),  # 루트 디렉토리의 static 폴더
 ]
+# python manage.py collectstatic 결과 (해시 이름 사본, 매니페스트, .gz/.br 압축본)
+STATIC_ROOT = BASE_DIR / "staticfiles"
+# collectstatic 때 주석/공백을 지울 파일 (STATIC_ROOT 기준 경로 패턴, blog_page.assets)
+# 이미 압축된 admin 등 외부 파일은 건드리지 않습니다.
+STATIC_MINIFY_PATTERNS = ["css/*.css", "js/*.js"]
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    # 해시 이름 + 매니페스트 + 미리 압축 (blog_page.assets). DEBUG 에서는 원래 이름을 씁니다.
+    # 테스트는 collectstatic 없이 돌기 때문에 매니페스트가 필요 없는 저장소를 씁니다.
+    # (config.test_runner)
+    "staticfiles": {
+        "BACKEND": "blog_page.assets.CompressedManifestStaticFilesStorage",
+    },
+    # 첨부 파일/대표 이미지 원본: 내용 해시 경로에 한 번만 저장 (blog_page.storage)
+    "blobs": {"BACKEND": "blog_page.storage.ContentAddressedStorage"},
+}
+# 참조가 없어진 블롭을 지우기 전 유예 시간(초). 방금 같은 파일을 올린 요청이 있으면 남겨 둡니다.
+BLOB_GC_GRACE = 300
+# 미디어 파일 본문 전송을 앞단 프록시에 넘기는 방식 (blog_page.media)
+# None: Django 가 직접 전송, "x-sendfile": Apache/lighttpd, "x-accel-redirect": nginx
+MEDIA_SENDFILE = None
+# nginx 의 internal location 경로 (예: location /protected-media/ { internal; alias MEDIA_ROOT/; })
+MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+
+# 테스트를 실행하는 동안 settings.py 의 값 대신 쓰는 설정
+TEST_SETTINGS = {
+    # 조회수 타이머 스레드는 필요한 테스트에서 직접 만들어 확인합니다.
+    "VIEW_COUNT_FLUSH_TIMER": False,
+    # 쿼리 수 예산을 넘는 요청은 경고 로그 대신 예외로 테스트를 실패시킵니다.
+    "QUERY_BUDGET_ACTION": "raise",
+    # 복제본은 주 DB 의 테스트 DB 를 가리킬 뿐이므로 읽기를 보내지 않습니다.
+    # (복제본 라우팅 테스트는 필요한 곳에서 직접 켭니다.)
+    "REPLICA_DATABASE": None,
+    # collectstatic 없이 돌기 때문에 매니페스트가 필요 없는 저장소를 씁니다.
+    "STORAGES": {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+}
+
+
+class TestRunner(DiscoverRunner):
+    """TEST_SETTINGS 를 적용한 채로 테스트를 실행하는 러너입니다. (settings.TEST_RUNNER)"""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._test_settings = override_settings(**TEST_SETTINGS)
+        self._test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._test_settings.disable()
+        super().teardown_test_environment(**kwargs)
@@ -15,18 +15,49 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+
 from django.contrib import admin
 from django.conf import settings
-from django.urls import path, include
-from django.conf.urls.static import static
+from django.urls import path, include, re_path
 from django.views.generic import TemplateView
 
+from blog_page.assets import serve_static
+from blog_page.media import serve_media
+from blog_page.sitemaps import sitemap_index, sitemap_section
+
 urlpatterns = [
     path("", TemplateView.as_view(template_name="base.html"), name="home"),
     path("admin/", admin.site.urls),
     path("accounts/", include("accounts.urls", namespace="accounts")),
     path("blog/", include("blog_page.urls")),
+    # 사이트맵 색인과 구역별 조각 (blog_page.sitemaps)
+    path("sitemap.xml", sitemap_index, name="sitemap_index"),
+    path(
+        "sitemap-<str:section>-<int:shard>.xml.gz",
+        sitemap_section,
+        name="sitemap_section",
+    ),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 업로드 파일: Range/조건부 요청, immutable 캐시, X-Sendfile 전달을 지원합니다. (blog_page.media)
+# MEDIA_URL 이 다른 호스트(CDN 등)를 가리키면 그쪽에서 제공합니다.
+if not settings.MEDIA_URL.startswith(("http://", "https://", "//")):
+    urlpatterns += [
+        re_path(
+            rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$",
+            serve_media,
+            name="media",
+        )
+    ]
+
+# 정적 파일: Accept-Encoding 에 맞는 미리 압축한 파일, 해시 이름은 immutable 캐시 (blog_page.assets)
+# DEBUG 의 runserver 는 이보다 먼저 STATICFILES_DIRS 에서 원본을 직접 제공합니다.
+if not settings.STATIC_URL.startswith(("http://", "https://", "//")):
+    urlpatterns += [
+        re_path(
+            rf"^{re.escape(settings.STATIC_URL.lstrip('/'))}(?P<path>.+)$",
+            serve_static,
+            name="static",
+        )
+    ]
@@ -74,6 +74,96 @@ document.addEventListener("DOMContentLoaded", function () {
         }
     });
 
+    // 댓글/답글 HTML 조각을 불러옵니다. (실패하면 버튼을 다시 누를 수 있게 둡니다)
+    function loadComments(button, render) {
+        button.disabled = true;
+        fetch(button.dataset.url, {
+            headers: { "X-Requested-With": "XMLHttpRequest" },
+        })
+            .then((response) => {
+                if (!response.ok) {
+                    throw new Error(response.statusText);
+                }
+                return response.json();
+            })
+            .then(render)
+            .catch((error) => {
+                console.error("Error:", error);
+                button.disabled = false;
+            });
+    }
+
+    // 최상위 댓글 더 보기
+    const loadMoreButton = document.getElementById("load-more-comments");
+    if (loadMoreButton) {
+        loadMoreButton.addEventListener("click", function () {
+            loadComments(loadMoreButton, function (data) {
+                const page = document.createElement("template");
+                page.innerHTML = data.html;
+                // 이 페이지를 연 뒤 작성해 이미 붙어 있는 댓글은 건너뜁니다.
+                page.content.querySelectorAll(".comment").forEach((comment) => {
+                    if (document.getElementById(comment.id)) {
+                        comment.remove();
+                    }
+                });
+                document.getElementById("comments-list").appendChild(page.content);
+                if (data.next) {
+                    loadMoreButton.dataset.url = data.next;
+                    loadMoreButton.disabled = false;
+                } else {
+                    loadMoreButton.remove();
+                }
+            });
+        });
+    }
+
+    // 댓글의 답글 목록(.replies)을 반환합니다. 없으면 만듭니다.
+    function repliesOf(comment) {
+        let repliesContainer = comment.querySelector(":scope > .replies");
+        if (!repliesContainer) {
+            repliesContainer = document.createElement("div");
+            repliesContainer.className = "replies";
+            comment.appendChild(repliesContainer);
+        }
+        return repliesContainer;
+    }
+
+    // 접힌 답글 보기 / 답글 더 보기
+    commentsSection.addEventListener("click", function (e) {
+        if (e.target.matches(".load-replies")) {
+            const button = e.target;
+            loadComments(button, function (data) {
+                const parentComment = button.closest(".comment");
+                if (!button.classList.contains("more-replies")) {
+                    // 펼치기 전에 단 답글까지 응답에 들어 있으므로 목록을 비우고 채웁니다.
+                    repliesOf(parentComment).innerHTML = "";
+                }
+                const page = document.createElement("template");
+                page.innerHTML = data.html;
+                // 페이지가 답글 트리 중간에서 나뉘면 앞 페이지에서 불러온 부모 아래에 붙입니다.
+                Array.from(page.content.children).forEach((comment) => {
+                    if (document.getElementById(comment.id)) {
+                        return;
+                    }
+                    const parent =
+                        document.getElementById(
+                            `comment-${comment.dataset.parentId}`
+                        ) || parentComment;
+                    repliesOf(parent).appendChild(comment);
+                });
+                if (data.next) {
+                    button.dataset.url = data.next;
+                    button.textContent = "답글 더 보기";
+                    button.classList.add("more-replies");
+                    button.disabled = false;
+                    parentComment.appendChild(button);
+                } else {
+                    button.remove();
+                }
+            });
+        }
+    });
+
     // 답글 폼 토글
     commentsSection.addEventListener("click", function (e) {
         if (e.target.matches(".reply-button")) {